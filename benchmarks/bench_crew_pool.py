@@ -0,0 +1,80 @@
+"""
+Benchmark per-iteration crew construction overhead with and without reuse.
+
+Usage:
+    python benchmarks/bench_crew_pool.py [--iterations 200]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from crewai import BaseLLM
+from crewai.project.crew_base import load_yaml
+
+from cover_letter_writer.crews.reviewer_crew import ReviewerCrew
+from cover_letter_writer.crews.writer_crew import WriterCrew
+from cover_letter_writer.utils.crew_pool import CrewPool, load_yaml_cached
+
+CREWS = [WriterCrew, ReviewerCrew]
+
+
+class OfflineLLM(BaseLLM):
+    """LLM placeholder; crews are only built, never kicked off."""
+
+    def call(self, messages, *args, **kwargs) -> str:
+        return ""
+
+
+def time_per_iteration(build, iterations: int) -> float:
+    """Return the mean time in milliseconds of one writer + reviewer build."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for crew_cls in CREWS:
+            build(crew_cls)
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    llm = OfflineLLM(model="offline")
+    pool = CrewPool()
+
+    def pooled(crew_cls):
+        with pool.acquire(crew_cls, llm) as crew:
+            return crew
+
+    # Rebuild every iteration, re-parsing the YAML configs (previous behavior)
+    for crew_cls in CREWS:
+        crew_cls.load_yaml = staticmethod(load_yaml)
+    uncached_ms = time_per_iteration(lambda c: c(llm).crew(), args.iterations)
+
+    for crew_cls in CREWS:
+        crew_cls.load_yaml = staticmethod(load_yaml_cached)
+    cached_ms = time_per_iteration(lambda c: c(llm).crew(), args.iterations)
+    pooled_ms = time_per_iteration(pooled, args.iterations)
+
+    results = {
+        "iterations": args.iterations,
+        "rebuild_parse_yaml_ms": round(uncached_ms, 3),
+        "rebuild_cached_yaml_ms": round(cached_ms, 3),
+        "pooled_ms": round(pooled_ms, 4),
+        "pool": pool.stats(),
+    }
+
+    print("Per-iteration crew setup (writer + reviewer):")
+    print(f"  rebuild, parse YAML:   {uncached_ms:8.3f} ms")
+    print(f"  rebuild, cached YAML:  {cached_ms:8.3f} ms")
+    print(f"  pooled crews:          {pooled_ms:8.4f} ms")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark HTML extraction engines used by WebScraperTool.
+
+Usage:
+    python benchmarks/bench_html_extraction.py [--sizes 0 512 4096] [--corpus DIR]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from html_fixtures import FIXTURE_DIR, inflate_page, load_corpus
+
+from cover_letter_writer.tools.html_extractor import available_engines, extract_text
+
+BASELINE_ENGINE = "html.parser"
+
+
+def time_engine(engine: str, page: bytes, repeat: int) -> tuple[float, str]:
+    """Return the median extraction time and the extracted text."""
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = extract_text(page, engine=engine)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[0, 512, 4096],
+        help="Inflate each page to these sizes in KB (0 = as saved)",
+    )
+    parser.add_argument("--corpus", type=Path, default=FIXTURE_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    engines = available_engines()
+    if BASELINE_ENGINE not in engines:
+        raise SystemExit("beautifulsoup4 is required for the baseline engine")
+
+    results = []
+    for name, saved_page in load_corpus(args.corpus).items():
+        for size_kb in args.sizes:
+            page = inflate_page(saved_page, size_kb) if size_kb else saved_page
+            baseline_time, baseline_text = time_engine(
+                BASELINE_ENGINE, page, args.repeat
+            )
+            row = {"page": name, "size_kb": len(page) // 1024, "engines": {}}
+            for engine in engines:
+                seconds, text = (
+                    (baseline_time, baseline_text)
+                    if engine == BASELINE_ENGINE
+                    else time_engine(engine, page, args.repeat)
+                )
+                row["engines"][engine] = {
+                    "seconds": round(seconds, 4),
+                    "speedup": round(baseline_time / seconds, 2),
+                    "identical_output": text == baseline_text,
+                }
+            results.append(row)
+
+    header = " ".join(f"{engine:>22}" for engine in engines)
+    print(f"{'page':<22} {'KB':>6} {header}")
+    for row in results:
+        cells = " ".join(
+            f"{cell['seconds']:>9.4f}s x{cell['speedup']:<6}"
+            f"{'=' if cell['identical_output'] else '≠':>3}"
+            for cell in row["engines"].values()
+        )
+        print(f"{row['page']:<22} {row['size_kb']:>6} {cells}")
+    print("\n= output identical to html.parser, ≠ output differs")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark serial vs. parallel page extraction in PDFReaderTool.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py [--pages 10 40 120] [--workers 2 4]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_fixtures import write_text_pdf
+
+from cover_letter_writer.tools.pdf_reader import PDFReaderTool
+
+
+def time_extraction(
+    reader: PDFReaderTool, path: Path, repeat: int
+) -> tuple[float, str]:
+    """Return the median extraction time and the extracted text."""
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = reader.extract_text(str(path))
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 40, 120])
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[2, min(os.cpu_count() or 2, 8)]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            path = write_text_pdf(Path(tmp) / f"doc_{pages}.pdf", pages)
+            serial_time, serial_text = time_extraction(
+                PDFReaderTool(max_workers=1), path, args.repeat
+            )
+            row = {"pages": pages, "serial_s": round(serial_time, 4), "parallel": {}}
+            for workers in sorted(set(args.workers)):
+                parallel_time, parallel_text = time_extraction(
+                    PDFReaderTool(max_workers=workers, parallel_threshold=1),
+                    path,
+                    args.repeat,
+                )
+                row["parallel"][workers] = {
+                    "seconds": round(parallel_time, 4),
+                    "speedup": round(serial_time / parallel_time, 2),
+                    "identical_output": parallel_text == serial_text,
+                }
+            results.append(row)
+
+    header = " ".join(f"{f'w={w}':>16}" for w in sorted(set(args.workers)))
+    print(f"{'pages':>6} {'serial':>9} {header}")
+    for row in results:
+        cells = " ".join(
+            f"{cell['seconds']:>8.3f}s x{cell['speedup']:<5}"
+            for cell in row["parallel"].values()
+        )
+        print(f"{row['pages']:>6} {row['serial_s']:>8.3f}s {cells}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Startup time of the CLI and of creating a single provider's LLM.
+
+Usage:
+    python benchmarks/bench_startup.py [--providers openai fake] [--json FILE]
+
+Every scenario runs in a fresh interpreter with -X importtime. The report
+shows the wall time of each scenario and which top-level packages its
+imports spent the time in, so a provider SDK or CrewAI creeping back into
+the --help path is easy to spot. JSON results have the bench_suite.py
+format and can be compared with compare_results.py.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from bench_suite import environment, result
+
+# "import time: self [us] | cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \| (\s*)(\S+)$")
+
+PROVIDER_MODELS = {
+    "openai": "gpt-5.1",
+    "anthropic": "claude-sonnet-4-5",
+    "ollama": "llama3.1",
+    "fake": "fake",
+}
+
+# Placeholder keys: creating a client doesn't contact the provider
+DUMMY_KEYS = {
+    "OPENAI_API_KEY": "sk-startup-benchmark",
+    "ANTHROPIC_API_KEY": "sk-ant-startup-benchmark",
+}
+
+
+def scenarios(providers: list[str]) -> dict[str, list[str]]:
+    """Map each scenario name to the interpreter arguments running it."""
+    commands = {
+        "help": ["-m", "cover_letter_writer.main", "--help"],
+        # Missing --job-description/--cv: click reports the usage error
+        "usage_error": ["-m", "cover_letter_writer.main"],
+        "config": [
+            "-c",
+            "from cover_letter_writer.config import Config; Config().llm_provider",
+        ],
+    }
+    for provider in providers:
+        commands[f"llm_{provider}"] = [
+            "-c",
+            (
+                "from cover_letter_writer.utils import LLMFactory; "
+                f"LLMFactory.create_llm({provider!r}, {PROVIDER_MODELS[provider]!r})"
+            ),
+        ]
+    return commands
+
+
+def run_once(arguments: list[str]) -> tuple[float, str]:
+    """Run one scenario and return its wall time and import time log."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**DUMMY_KEYS, **os.environ},
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode not in (0, 2):
+        raise RuntimeError(f"Scenario {arguments} failed:\n{completed.stderr[-2000:]}")
+    return elapsed, completed.stderr
+
+
+def import_breakdown(log: str) -> tuple[Counter[str], int]:
+    """
+    Sum the self import time of every top-level package.
+
+    Args:
+        log: stderr of an interpreter run with -X importtime
+
+    Returns:
+        Milliseconds per top-level package and number of imported modules
+    """
+    packages: Counter[str] = Counter()
+    modules = 0
+    for line in log.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            modules += 1
+            packages[match.group(3).split(".")[0]] += int(match.group(1)) / 1000
+    return packages, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--providers",
+        nargs="+",
+        choices=list(PROVIDER_MODELS),
+        default=list(PROVIDER_MODELS),
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=6, help="Packages listed per scenario"
+    )
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    os.environ.setdefault("CREWAI_TESTING", "true")
+
+    results = []
+    for name, arguments in scenarios(args.providers).items():
+        print(f"Running {name}...", file=sys.stderr)
+        # The first run warms the file system cache and bytecode files
+        run_once(arguments)
+        samples = []
+        for _ in range(args.repeat):
+            elapsed, log = run_once(arguments)
+            samples.append(elapsed)
+        packages, modules = import_breakdown(log)
+        top = {package: round(ms, 1) for package, ms in packages.most_common(args.top)}
+        results.append(
+            result("startup", {"scenario": name}, samples, modules=modules, top=top)
+        )
+
+    print(f"{'scenario':<16} {'median':>10} {'min':>10} {'modules':>8}  top imports")
+    for row in results:
+        top = ", ".join(f"{pkg} {ms:.0f}ms" for pkg, ms in row["extra"]["top"].items())
+        print(
+            f"{row['params']['scenario']:<16} {row['median'] * 1000:>8.0f}ms "
+            f"{row['min'] * 1000:>8.0f}ms {row['extra']['modules']:>8}  {top}"
+        )
+
+    if args.json:
+        report = {"environment": environment(), "benchmarks": results}
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
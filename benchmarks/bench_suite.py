@@ -0,0 +1,418 @@
+"""
+Benchmark suite for parsing, scraping, prompt formatting, flow and batch overhead.
+
+Usage:
+    python benchmarks/bench_suite.py [--only parse_pdf flow] [--quick] [--json FILE]
+
+Results are written as JSON (--json) and can be compared across commits with
+compare_results.py. Flow and batch runs use the offline fake LLM provider, so
+no API keys or network access are needed.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from html_fixtures import FIXTURE_DIR, inflate_page, load_corpus
+from pdf_fixtures import LOREM, write_text_pdf
+
+from cover_letter_writer.tools.document_parser import DocumentParser
+from cover_letter_writer.tools.web_scraper import WebScraperTool
+
+# Bump when benchmarks change in a way that makes old results incomparable
+SUITE_VERSION = "1"
+
+FULL_SIZES = {
+    "parse_text": [16, 256, 4096],
+    "parse_pdf": [5, 20, 80],
+    "scrape_html": [0, 1024],
+    "clean_markdown": [64, 1024, 8192],
+    "format_supporting_docs": [5, 50],
+}
+QUICK_SIZES = {
+    "parse_text": [16, 256],
+    "parse_pdf": [5, 20],
+    "scrape_html": [0],
+    "clean_markdown": [64, 1024],
+    "format_supporting_docs": [5],
+}
+
+# Size of each supporting document in format_supporting_docs
+SUPPORTING_DOC_KB = 64
+
+# Saved pages are served for this URL instead of fetching it
+JOB_URL = "https://jobs.example.com/posting"
+
+
+class SavedPageSession:
+    """requests.Session stand-in serving a saved page for every URL."""
+
+    def __init__(self, page: bytes):
+        self.page = page
+
+    def get(self, url: str, headers: dict[str, str], timeout: int) -> Any:
+        response = type("SavedResponse", (), {})()
+        response.status_code = 200
+        response.content = self.page
+        response.headers = {}
+        response.raise_for_status = lambda: None
+        return response
+
+
+def make_text(size_kb: int) -> str:
+    """Build a markdown document of about size_kb kilobytes."""
+    paragraphs = []
+    size = 0
+    while size < size_kb * 1024:
+        paragraph = f"## Project {len(paragraphs) + 1}\n\n{LOREM}. " * 3
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> list[float]:
+    """Return the wall times of repeat calls of fn after warmup calls."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def result(
+    group: str, params: dict[str, Any], samples: list[float], **extra: Any
+) -> dict[str, Any]:
+    """
+    Summarize the samples of one benchmark.
+
+    Args:
+        group: Benchmark group
+        params: Parameters of this benchmark within the group
+        samples: Measured values in seconds
+        **extra: Additional values stored with the result
+
+    Returns:
+        Result with a stable name used to compare runs
+    """
+    label = ",".join(f"{key}={value}" for key, value in params.items())
+    return {
+        "name": f"{group}[{label}]" if label else group,
+        "group": group,
+        "params": params,
+        "unit": "seconds",
+        "rounds": len(samples),
+        "median": round(statistics.median(samples), 6),
+        "mean": round(statistics.fmean(samples), 6),
+        "min": round(min(samples), 6),
+        "max": round(max(samples), 6),
+        "stdev": round(statistics.stdev(samples), 6) if len(samples) > 1 else 0.0,
+        "extra": extra,
+    }
+
+
+def bench_parse_text(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """DocumentParser.parse_file on markdown files of increasing size."""
+    results = []
+    for size_kb in args.sizes["parse_text"]:
+        path = workdir / f"document_{size_kb}kb.md"
+        path.write_text(make_text(size_kb), encoding="utf-8")
+        samples = measure(partial(DocumentParser.parse_file, str(path)), args.repeat)
+        results.append(result("parse_text", {"size_kb": size_kb}, samples))
+    return results
+
+
+def bench_parse_pdf(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """DocumentParser.parse_file on PDFs of increasing page count (no cache)."""
+    results = []
+    for pages in args.sizes["parse_pdf"]:
+        path = write_text_pdf(workdir / f"document_{pages}p.pdf", pages)
+        samples = measure(partial(DocumentParser.parse_file, str(path)), args.repeat)
+        results.append(
+            result(
+                "parse_pdf",
+                {"pages": pages},
+                samples,
+                size_kb=path.stat().st_size // 1024,
+            )
+        )
+    return results
+
+
+def bench_scrape_html(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """WebScraperTool.scrape_url on saved job-board pages (without network)."""
+    results = []
+    for name, saved_page in load_corpus(args.corpus).items():
+        for size_kb in args.sizes["scrape_html"]:
+            page = inflate_page(saved_page, size_kb) if size_kb else saved_page
+            scraper = WebScraperTool(session=SavedPageSession(page))
+            samples = measure(partial(scraper.scrape_url, JOB_URL), args.repeat)
+            results.append(
+                result(
+                    "scrape_html",
+                    {"page": Path(name).stem, "size_kb": len(page) // 1024},
+                    samples,
+                    engine=scraper.engine,
+                )
+            )
+    return results
+
+
+def bench_clean_markdown(
+    args: argparse.Namespace, workdir: Path
+) -> list[dict[str, Any]]:
+    """CoverLetterFlow._clean_markdown_wrapper on large fenced responses."""
+    from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+
+    results = []
+    for size_kb in args.sizes["clean_markdown"]:
+        content = f"```markdown\n{make_text(size_kb)}\n```"
+        samples = measure(
+            partial(CoverLetterFlow._clean_markdown_wrapper, content), args.repeat
+        )
+        results.append(result("clean_markdown", {"size_kb": size_kb}, samples))
+    return results
+
+
+def bench_format_supporting_docs(
+    args: argparse.Namespace, workdir: Path
+) -> list[dict[str, Any]]:
+    """CoverLetterFlow._format_supporting_docs with many large documents."""
+    from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+
+    document = make_text(SUPPORTING_DOC_KB)
+    results = []
+    for documents in args.sizes["format_supporting_docs"]:
+        flow = CoverLetterFlow(llm=None)
+        flow.state.supporting_docs = [document] * documents
+        samples = measure(flow._format_supporting_docs, args.repeat)
+        results.append(
+            result(
+                "format_supporting_docs",
+                {"documents": documents, "size_kb": SUPPORTING_DOC_KB},
+                samples,
+            )
+        )
+    return results
+
+
+def write_flow_script(workdir: Path) -> Path:
+    """Write a fake LLM script: one revision, then approval."""
+    from cover_letter_writer.utils.fake_llm import default_review
+
+    script = {
+        "rules": [
+            {
+                "match": '"decision"',
+                "responses": [
+                    default_review("NEEDS_IMPROVEMENT", score=6),
+                    default_review("APPROVED", score=8),
+                ],
+            }
+        ]
+    }
+    path = workdir / "flow_script.json"
+    path.write_text(json.dumps(script), encoding="utf-8")
+    return path
+
+
+def run_flow(script: Path, latency: float, inputs: dict[str, Any]) -> Any:
+    """Run one flow against a fresh fake LLM and return the LLM."""
+    from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+    from cover_letter_writer.utils import LLMFactory
+
+    llm = LLMFactory.create_llm(
+        "fake", "fake", script=str(script), latency_seconds=latency
+    )
+    flow = CoverLetterFlow(llm)
+    with contextlib.redirect_stdout(io.StringIO()):
+        flow.kickoff(inputs=inputs)
+    return llm
+
+
+def bench_flow(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """
+    End-to-end CoverLetterFlow runs against the fake LLM.
+
+    Each run writes a draft, gets it revised once and translates the
+    approved letter. The measured value is the flow's own overhead: wall
+    time minus the injected LLM latency.
+    """
+    script = write_flow_script(workdir)
+    inputs = {
+        "job_description": make_text(4),
+        "cv_content": make_text(8),
+        "supporting_docs": [make_text(16)],
+        "translate_to": "de",
+        "convergence_threshold": None,
+    }
+
+    results = []
+    for latency in args.latency:
+        run_flow(script, latency, inputs)
+        walls, overheads = [], []
+        calls = 0
+        for _ in range(args.flow_rounds):
+            started = time.perf_counter()
+            llm = run_flow(script, latency, inputs)
+            wall = time.perf_counter() - started
+            calls = llm.chat_model.calls
+            walls.append(wall)
+            overheads.append(wall - calls * latency)
+        results.append(
+            result(
+                "flow",
+                {"latency_s": latency},
+                overheads,
+                llm_calls=calls,
+                wall_median=round(statistics.median(walls), 6),
+            )
+        )
+    return results
+
+
+def bench_batch(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    """BatchRunner throughput with the fake LLM and injected latency."""
+    from cover_letter_writer.batch import BatchRunner
+    from cover_letter_writer.config import Config
+    from cover_letter_writer.models.batch_models import BatchJob
+    from cover_letter_writer.utils import LLMFactory
+
+    job_file = workdir / "job.md"
+    job_file.write_text(make_text(4), encoding="utf-8")
+    jobs = [
+        BatchJob(job_id=f"job-{index}", job_description=str(job_file))
+        for index in range(args.batch_jobs)
+    ]
+    latency = max(args.latency)
+
+    results = []
+    for workers in args.workers:
+        config = Config()
+        config.set("output.directory", str(workdir / f"batch_{workers}"))
+        samples = []
+        for _ in range(args.flow_rounds):
+            llm = LLMFactory.create_llm("fake", "fake", latency_seconds=latency)
+            runner = BatchRunner(
+                config,
+                llm,
+                cv_content=make_text(8),
+                supporting_docs=[],
+                max_workers=workers,
+            )
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                runner.run(jobs)
+            samples.append(time.perf_counter() - started)
+        results.append(
+            result(
+                "batch",
+                {"jobs": args.batch_jobs, "workers": workers, "latency_s": latency},
+                samples,
+                jobs_per_second=round(args.batch_jobs / statistics.median(samples), 3),
+            )
+        )
+    return results
+
+
+GROUPS = {
+    "parse_text": bench_parse_text,
+    "parse_pdf": bench_parse_pdf,
+    "scrape_html": bench_scrape_html,
+    "clean_markdown": bench_clean_markdown,
+    "format_supporting_docs": bench_format_supporting_docs,
+    "flow": bench_flow,
+    "batch": bench_batch,
+}
+
+
+def environment() -> dict[str, Any]:
+    """Describe the code and machine the results were measured on."""
+    root = Path(__file__).resolve().parent.parent
+
+    def git(*command: str) -> str | None:
+        try:
+            return subprocess.run(
+                ["git", *command],
+                cwd=root,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "suite_version": SUITE_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="+", choices=list(GROUPS), default=list(GROUPS))
+    parser.add_argument("--quick", action="store_true", help="Smaller inputs only")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        nargs="+",
+        default=[0.0, 0.05],
+        help="Injected fake LLM latencies in seconds (flow and batch)",
+    )
+    parser.add_argument("--flow-rounds", type=int, default=5)
+    parser.add_argument("--batch-jobs", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--corpus", type=Path, default=FIXTURE_DIR)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+    args.sizes = QUICK_SIZES if args.quick else FULL_SIZES
+
+    # Keep CrewAI telemetry and its first-run trace upload (network round
+    # trips and an interactive prompt) out of the measured flow runs
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    os.environ.setdefault("CREWAI_TRACING_ENABLED", "false")
+    os.environ.setdefault("CREWAI_TESTING", "true")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for group in args.only:
+            print(f"Running {group}...", file=sys.stderr)
+            results.extend(GROUPS[group](args, Path(tmpdir)))
+
+    print(f"{'benchmark':<58} {'median':>10} {'min':>10} {'stdev':>10}")
+    for row in results:
+        print(
+            f"{row['name']:<58} {row['median'] * 1000:>8.2f}ms "
+            f"{row['min'] * 1000:>8.2f}ms {row['stdev'] * 1000:>8.2f}ms"
+        )
+
+    if args.json:
+        report = {"environment": environment(), "benchmarks": results}
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare two benchmark suite results and flag regressions.
+
+Usage:
+    python benchmarks/compare_results.py BASELINE.json CURRENT.json [--threshold 0.2]
+
+Exits with status 1 if any benchmark got slower than the threshold allows.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def load_results(path: Path) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Load a results file written by bench_suite.py --json."""
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return report["environment"], {row["name"]: row for row in report["benchmarks"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that counts as a regression (0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="Ignore absolute differences below this many milliseconds",
+    )
+    parser.add_argument(
+        "--stat",
+        choices=["median", "min", "mean"],
+        default="median",
+        help="Statistic to compare",
+    )
+    args = parser.parse_args()
+
+    baseline_env, baseline = load_results(args.baseline)
+    current_env, current = load_results(args.current)
+    if baseline_env.get("suite_version") != current_env.get("suite_version"):
+        print("⚠️  Results come from different suite versions and may not compare")
+    print(
+        f"Baseline: {baseline_env.get('commit') or 'unknown'} "
+        f"({baseline_env.get('created_at')})"
+    )
+    print(
+        f"Current:  {current_env.get('commit') or 'unknown'} "
+        f"({current_env.get('created_at')})\n"
+    )
+
+    regressions = []
+    print(f"{'benchmark':<58} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, row in current.items():
+        if name not in baseline:
+            print(f"{name:<58} {'-':>10} {row[args.stat] * 1000:>8.2f}ms {'new':>8}")
+            continue
+        before = baseline[name][args.stat]
+        after = row[args.stat]
+        change = (after - before) / before if before else 0.0
+        regressed = (
+            change > args.threshold and (after - before) * 1000 >= args.min_delta_ms
+        )
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<58} {before * 1000:>8.2f}ms {after * 1000:>8.2f}ms "
+            f"{change:>+7.0%}{' ❌' if regressed else ''}"
+        )
+
+    missing = sorted(set(baseline) - set(current))
+    if missing:
+        print(f"\nNot measured in current run: {', '.join(missing)}")
+
+    if regressions:
+        print(
+            f"\n❌ {len(regressions)} regression(s) above "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+    print(f"\n✅ No regressions above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
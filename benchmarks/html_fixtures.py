@@ -0,0 +1,56 @@
+"""Job-board HTML fixtures for benchmarks."""
+
+import json
+from pathlib import Path
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "html"
+
+
+def load_corpus(directory: Path = FIXTURE_DIR) -> dict[str, bytes]:
+    """
+    Load saved HTML pages.
+
+    Args:
+        directory: Directory containing *.html files
+
+    Returns:
+        Mapping of file name to raw page bytes
+    """
+    return {path.name: path.read_bytes() for path in sorted(directory.glob("*.html"))}
+
+
+def inflate_page(page: bytes, target_kb: int) -> bytes:
+    """
+    Grow a page to roughly target_kb the way SPA job boards do.
+
+    Adds a serialized client state blob and a long "similar jobs" list,
+    which is what makes real job-board pages several megabytes in size.
+
+    Args:
+        page: Raw HTML page
+        target_kb: Approximate size of the result in kilobytes
+
+    Returns:
+        Inflated page
+    """
+    missing = target_kb * 1024 - len(page)
+    if missing <= 0:
+        return page
+
+    # Half of the added bytes go to the state blob, half to visible markup
+    state = {
+        "jobs": [
+            {"id": index, "title": f"Engineer {index}", "tags": ["python", "cloud"]}
+            for index in range(missing // 2 // 60)
+        ]
+    }
+    cards = "".join(
+        f'<li class="card"><a href="/job/{index}">Similar job {index}</a>'
+        f"<span>Remote</span></li>"
+        for index in range(missing // 2 // 70)
+    )
+    extra = (
+        f'<aside><ul class="similar">{cards}</ul></aside>'
+        f'<script type="application/json">{json.dumps(state)}</script>'
+    ).encode()
+    return page.replace(b"</body>", extra + b"</body>", 1)
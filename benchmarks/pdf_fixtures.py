@@ -0,0 +1,90 @@
+"""Synthetic PDF fixtures for benchmarks (no PDF writer dependency needed)."""
+
+from pathlib import Path
+
+LOREM = (
+    "Led the migration of a monolithic billing platform to event driven services "
+    "and mentored six engineers through the rollout while keeping uptime above "
+    "99.95 percent across three regions"
+)
+
+
+def _escape(text: str) -> str:
+    """Escape a string for a PDF literal."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(path: Path, pages: int, lines_per_page: int = 45) -> Path:
+    """
+    Write a PDF with the given number of text pages.
+
+    Args:
+        path: Output file path
+        pages: Number of pages
+        lines_per_page: Text lines per page
+
+    Returns:
+        Path to the written PDF
+    """
+    objects: list[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog_id = add(b"")  # filled in once the page tree id is known
+    pages_id = add(b"")
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for page_number in range(pages):
+        lines = [
+            f"Page {page_number + 1} line {line + 1}: {LOREM}"[:95]
+            for line in range(lines_per_page)
+        ]
+        stream = (
+            "BT /F1 9 Tf 40 800 Td 12 TL\n"
+            + "\n".join(f"({_escape(line)}) Tj T*" for line in lines)
+            + "\nET"
+        )
+        data = stream.encode("latin-1")
+        content_id = add(
+            b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream"
+        )
+        page_ids.append(
+            add(
+                (
+                    f"<< /Type /Page /Parent {pages_id} 0 R "
+                    f"/MediaBox [0 0 595 842] "
+                    f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                    f"/Contents {content_id} 0 R >>"
+                ).encode("latin-1")
+            )
+        )
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[pages_id - 1] = (
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("latin-1")
+    )
+    objects[catalog_id - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode(
+        "latin-1"
+    )
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        catalog_id,
+        xref_offset,
+    )
+
+    path.write_bytes(bytes(output))
+    return path
@@ -1,18 +1,50 @@
 """Cover Letter Writer - AI-powered cover letter generation."""
 
-from cover_letter_writer.config import Config
-from cover_letter_writer.cover_letter_flow import CoverLetterFlow
-from cover_letter_writer.models import CoverLetterState, ReviewFeedback
-from cover_letter_writer.utils import FileHandler, LLMFactory
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cover_letter_writer.async_cover_letter_flow import AsyncCoverLetterFlow
+    from cover_letter_writer.config import Config
+    from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+    from cover_letter_writer.models import CoverLetterState, ReviewFeedback
+    from cover_letter_writer.utils import FileHandler, LLMFactory
+
+# Public names and the modules defining them. They are imported on first
+# access, so importing a submodule (or running the CLI) doesn't load CrewAI
+# and the provider SDKs until they are needed.
+_LAZY_IMPORTS = {
+    "AsyncCoverLetterFlow": "cover_letter_writer.async_cover_letter_flow",
+    "Config": "cover_letter_writer.config",
+    "CoverLetterFlow": "cover_letter_writer.cover_letter_flow",
+    "CoverLetterState": "cover_letter_writer.models",
+    "ReviewFeedback": "cover_letter_writer.models",
+    "FileHandler": "cover_letter_writer.utils",
+    "LLMFactory": "cover_letter_writer.utils",
+}
 
 __all__ = [
+    "AsyncCoverLetterFlow",
     "Config",
     "CoverLetterFlow",
     "CoverLetterState",
-    "ReviewFeedback",
     "FileHandler",
     "LLMFactory",
+    "ReviewFeedback",
 ]
 
 __version__ = "0.2.0"
 
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the module attributes."""
+    return sorted(set(globals()) | set(__all__))
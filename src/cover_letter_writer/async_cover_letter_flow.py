@@ -0,0 +1,188 @@
+"""Asyncio variant of the cover letter generation flow."""
+
+import asyncio
+from typing import Any, Literal
+
+from crewai.flow import listen, or_, router, start
+
+from cover_letter_writer.cover_letter_flow import CoverLetterFlow, flow_step
+from cover_letter_writer.crews.reviewer_crew import ReviewerCrew
+from cover_letter_writer.crews.summarizer_crew import SummarizerCrew
+from cover_letter_writer.crews.translator_crew import TranslatorCrew
+from cover_letter_writer.crews.writer_crew import WriterCrew
+
+
+class AsyncCoverLetterFlow(CoverLetterFlow):
+    """
+    Cover letter flow whose steps await non-blocking crew kickoffs.
+
+    Uses the same state model, inputs and routing as CoverLetterFlow, so a
+    run produces the same results. Because no step blocks the event loop,
+    many flows can be driven concurrently from a single loop with
+    ``await flow.kickoff_async()``.
+
+    CrewAI registers flow steps per class, so every step is re-declared here.
+    The steps share their logic with CoverLetterFlow and only await
+    ``_kickoff_async`` where the synchronous steps call ``_kickoff``; the
+    routers delegate to the synchronous implementation.
+    """
+
+    async def _run_streamed(self, inputs: dict[str, Any] | None) -> None:
+        """Run the flow for stream() on the current event loop."""
+        await self.kickoff_async(inputs)
+
+    async def _kickoff_async(
+        self, crew_cls: type, llm: Any, step: str, inputs: dict[str, Any]
+    ) -> Any:
+        """Run a pooled crew for a flow step without blocking and return its result."""
+        with self._checkout(crew_cls, llm, step, inputs) as crew:
+            return await crew.kickoff_async(inputs=inputs)
+
+    async def _write_candidate_async(self, index: int) -> tuple[Any, Any]:
+        """Write and review one of several parallel first drafts without blocking."""
+        step = f"create_first_draft[{index + 1}]"
+        inputs = self._candidate_inputs(index)
+        draft_result = await self._kickoff_async(WriterCrew, self.llm, step, inputs)
+
+        inputs = self._review_inputs(self._candidate_draft(draft_result))
+        review_result = await self._kickoff_async(ReviewerCrew, self.llm, step, inputs)
+        return draft_result, review_result
+
+    async def _translate_async(self, language: str) -> str:
+        """Translate the final draft into one language without blocking."""
+        plan = self._translation_plan(language)
+        if plan is not None and plan.complete:
+            return plan.assemble()
+        if plan is not None and plan.found:
+            translated = await self._run_translator_async(language, plan.source_text())
+            merged = self._merge_translation(plan, translated)
+            if merged is not None:
+                return merged
+        translated = await self._run_translator_async(
+            language, self.state.current_draft
+        )
+        self._remember_letter_translation(plan, translated)
+        return translated
+
+    async def _run_translator_async(self, language: str, content: str) -> str:
+        """Run the translator crew on a text without blocking."""
+        # Run translator crew with appropriate LLM
+        inputs = self._translation_inputs(language, content)
+        step = self._translation_step(language)
+        result = await self._kickoff_async(
+            TranslatorCrew, self.translation_llm, step, inputs
+        )
+        return self._clean_markdown_wrapper(self._task_output(result))
+
+    @start()
+    @flow_step
+    async def initialize_flow(self):
+        """Initialize the flow and load all documents."""
+        super().initialize_flow()
+
+    @listen(initialize_flow)
+    @flow_step
+    async def summarize_documents(self):
+        """Condense long documents into digests and select relevant context once."""
+
+        async def summarize(index: int | None, kind: str, text: str) -> None:
+            inputs = self._summary_inputs(kind, text)
+            result = await self._kickoff_async(
+                SummarizerCrew, self.llm, "summarize_documents", inputs
+            )
+            self._store_digest(index, kind, text, result)
+
+        # Documents are independent, so they are condensed concurrently
+        await asyncio.gather(*(summarize(*item) for item in self._pending_digests()))
+
+        # Relevant excerpts are selected once and reused by every iteration
+        self._select_context()
+
+    @listen(summarize_documents)
+    @flow_step
+    async def create_first_draft(self):
+        """Generate the initial cover letter draft."""
+        self._start_iteration(1)
+
+        # Write and review several drafts concurrently and keep the best one
+        candidates = self.state.draft_candidates
+        if candidates > 1:
+            results = await asyncio.gather(
+                *(self._write_candidate_async(index) for index in range(candidates))
+            )
+            self._keep_best_candidate(list(results))
+            return
+
+        # Run writer crew
+        inputs = self._first_draft_inputs()
+        result = await self._kickoff_async(
+            WriterCrew, self.llm, "create_first_draft", inputs
+        )
+        self._store_draft(result, label="First draft")
+
+    @listen("decision_to_revise")
+    @flow_step
+    async def revise_draft(self):
+        """Generate an improved draft based on feedback."""
+        self._start_iteration(self.state.iteration_count + 1)
+
+        # Run writer crew
+        inputs = self._revision_inputs()
+        result = await self._kickoff_async(WriterCrew, self.llm, "revise_draft", inputs)
+        self._store_draft(result, label="Revised draft")
+
+    @listen(or_(create_first_draft, revise_draft))
+    @flow_step
+    async def review_draft(self):
+        """Review the current draft."""
+        if not self._start_review():
+            return
+
+        # Run reviewer crew
+        inputs = self._review_inputs()
+        result = await self._kickoff_async(
+            ReviewerCrew, self.llm, "review_draft", inputs
+        )
+        self._store_review(result)
+
+    @router(review_draft)
+    @flow_step
+    def route_decision(
+        self,
+    ) -> Literal["decision_to_finalize", "decision_to_revise"]:
+        """Route based on reviewer decision (same rules as the sync flow)."""
+        return super().route_decision()
+
+    @listen("decision_to_finalize")
+    @flow_step
+    def complete_flow(self):
+        """Complete the writing phase."""
+        super().complete_flow()
+
+    @router(complete_flow)
+    @flow_step
+    def route_translation(
+        self,
+    ) -> Literal["decision_to_translate", "decision_to_end"]:
+        """Route based on translation requirement (same rules as the sync flow)."""
+        return super().route_translation()
+
+    @listen("decision_to_translate")
+    @flow_step
+    async def translate_cover_letter(self):
+        """Translate the final cover letter to all target languages concurrently."""
+        languages = self._start_translation()
+
+        # Translations are independent, so each language gets its own crew
+        translations = await asyncio.gather(
+            *(self._translate_async(language) for language in languages)
+        )
+
+        for language, translated in zip(languages, translations):
+            self._store_translation(language, translated)
+
+    @listen(or_(translate_cover_letter, "decision_to_end"))
+    @flow_step
+    def finalize_flow(self):
+        """Final cleanup and flow termination."""
+        super().finalize_flow()
@@ -0,0 +1,449 @@
+"""Batch generation of cover letters for many job descriptions in one process."""
+
+import asyncio
+import csv
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from cover_letter_writer.async_cover_letter_flow import AsyncCoverLetterFlow
+from cover_letter_writer.config import Config
+from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+from cover_letter_writer.models.batch_models import BatchJob, BatchJobResult
+from cover_letter_writer.tools.document_cache import DocumentCache
+from cover_letter_writer.tools.document_parser import DocumentParser
+from cover_letter_writer.tools.draft_linter import DraftLinter
+from cover_letter_writer.tools.web_scraper import WebScraperTool
+from cover_letter_writer.utils.checkpoints import FlowCheckpointStore
+from cover_letter_writer.utils.crew_pool import CrewPool, default_crew_pool
+from cover_letter_writer.utils.digest_cache import DigestCache
+from cover_letter_writer.utils.file_handler import FileHandler
+from cover_letter_writer.utils.metrics import MetricsRecorder, timed
+from cover_letter_writer.utils.token_accounting import summarize_usage
+from cover_letter_writer.utils.translation_memory import TranslationMemory
+
+
+def load_manifest(manifest_path: str) -> list[BatchJob]:
+    """
+    Load batch jobs from a CSV or JSONL manifest.
+
+    Each entry needs a ``job_description`` (file path or URL) and may set an
+    ``id`` (used as output folder name) and a per-job ``translate_to``.
+
+    Args:
+        manifest_path: Path to a .csv or .jsonl manifest file
+
+    Returns:
+        List of batch jobs in manifest order
+
+    Raises:
+        FileNotFoundError: If the manifest doesn't exist
+        ValueError: If the manifest format or an entry is invalid
+    """
+    path = Path(manifest_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            entries = list(csv.DictReader(f))
+    elif suffix in [".jsonl", ".ndjson"]:
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    raise ValueError(
+                        f"Invalid JSON on line {line_number} of {manifest_path}: {e}"
+                    ) from e
+    else:
+        raise ValueError(
+            f"Unsupported manifest format: {suffix}. "
+            "Supported formats: .csv, .jsonl, .ndjson"
+        )
+
+    jobs = []
+    seen_ids = set()
+    for index, entry in enumerate(entries, start=1):
+        source = (entry.get("job_description") or "").strip()
+        if not source:
+            raise ValueError(f"Manifest entry {index} has no 'job_description'")
+
+        job_id = _sanitize_job_id(str(entry.get("id") or f"job_{index:03d}"))
+        if job_id in seen_ids:
+            raise ValueError(f"Duplicate job id in manifest: {job_id}")
+        seen_ids.add(job_id)
+
+        jobs.append(
+            BatchJob(
+                job_id=job_id,
+                job_description=source,
+                translate_to=(entry.get("translate_to") or None),
+            )
+        )
+
+    if not jobs:
+        raise ValueError(f"Manifest contains no jobs: {manifest_path}")
+
+    return jobs
+
+
+def _sanitize_job_id(job_id: str) -> str:
+    """Make a job id safe to use as a directory name."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", job_id.strip()).strip("._") or "job"
+
+
+class BatchRunner:
+    """Runs many cover letter flows concurrently for one candidate."""
+
+    def __init__(
+        self,
+        config: Config,
+        llm: Any,
+        cv_content: str,
+        supporting_docs: list[str],
+        translation_llm: Any | None = None,
+        max_workers: int | None = None,
+        document_cache: DocumentCache | None = None,
+        scraper: WebScraperTool | None = None,
+        crew_pool: CrewPool | None = None,
+        digest_cache: DigestCache | None = None,
+        linter: DraftLinter | None = None,
+        translation_memory: TranslationMemory | None = None,
+        checkpoints: FlowCheckpointStore | None = None,
+        resume: bool = False,
+        metrics: MetricsRecorder | None = None,
+    ):
+        """
+        Initialize batch runner.
+
+        The CV and supporting documents are parsed once by the caller and
+        shared by all flows. Flows spend nearly all of their time waiting
+        for the LLM, so they are run on a thread pool (run) or multiplexed
+        as async flows on one event loop (run_async).
+
+        Args:
+            config: Loaded configuration
+            llm: Language model instance shared by all flows
+            cv_content: Parsed CV text
+            supporting_docs: Parsed supporting document texts
+            translation_llm: Optional separate LLM for translation
+            max_workers: Number of concurrent flows (defaults to config)
+            document_cache: Optional extraction cache for job description files
+            scraper: Optional web scraper shared by all jobs (pooled connections)
+            crew_pool: Pool of reusable crews (defaults to the process-wide pool)
+            digest_cache: Optional cache of CV/supporting document digests
+            linter: Optional rule engine checking drafts before the review
+            translation_memory: Optional memory of translated paragraphs shared
+                by all jobs
+            checkpoints: Optional store receiving each job's flow state after
+                every step (keyed by job id)
+            resume: Continue jobs that have a checkpoint instead of starting
+                them over
+            metrics: Optional recorder shared by all jobs, so latency
+                percentiles cover the whole batch
+        """
+        self.config = config
+        self.llm = llm
+        self.translation_llm = translation_llm
+        self.cv_content = cv_content
+        self.supporting_docs = supporting_docs
+        self.max_workers = max(1, max_workers or config.batch_max_workers)
+        self.document_cache = document_cache
+        self.scraper = scraper
+        self.crew_pool = crew_pool or default_crew_pool
+        self.digest_cache = digest_cache
+        self.linter = linter
+        self.translation_memory = translation_memory
+        self.checkpoints = checkpoints
+        self.resume = resume
+        self.metrics = metrics
+
+    def run(self, jobs: list[BatchJob]) -> list[BatchJobResult]:
+        """
+        Run all jobs and return their results in manifest order.
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            One result per job; failed jobs are reported, not raised
+        """
+        results: dict[str, BatchJobResult] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="cover-letter-batch"
+        ) as executor:
+            futures = {executor.submit(self.run_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.job_id] = result
+                self._record_job(result)
+                marker = "✅" if result.error is None else "❌"
+                print(
+                    f"{marker} [{len(results)}/{len(jobs)}] "
+                    f"{result.job_id}: {result.status}"
+                )
+
+        return [results[job.job_id] for job in jobs]
+
+    async def run_async(self, jobs: list[BatchJob]) -> list[BatchJobResult]:
+        """
+        Run all jobs as async flows multiplexed on the current event loop.
+
+        At most ``max_workers`` flows are in flight at any time.
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            One result per job in manifest order; failed jobs are reported
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        completed = 0
+
+        async def run_one(job: BatchJob) -> BatchJobResult:
+            nonlocal completed
+            async with semaphore:
+                result = await self.run_job_async(job)
+            completed += 1
+            self._record_job(result)
+            marker = "✅" if result.error is None else "❌"
+            print(
+                f"{marker} [{completed}/{len(jobs)}] {result.job_id}: {result.status}"
+            )
+            return result
+
+        return list(await asyncio.gather(*(run_one(job) for job in jobs)))
+
+    def run_job(self, job: BatchJob) -> BatchJobResult:
+        """
+        Run the flow for a single job and save its outputs.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            Result of the job
+        """
+        started = time.perf_counter()
+        try:
+            flow = self._restore_flow(CoverLetterFlow, job)
+            if flow is None:
+                with self._timed_parse(job):
+                    job_desc_text = DocumentParser.parse_source(
+                        job.job_description,
+                        cache=self.document_cache,
+                        scraper=self.scraper,
+                    )
+                flow = self._create_flow(CoverLetterFlow, job, job_desc_text)
+            flow.kickoff()
+
+            return self._job_result(job, flow, started)
+
+        except Exception as e:  # noqa: BLE001
+            return self._failed_result(job, e, started)
+
+    async def run_job_async(self, job: BatchJob) -> BatchJobResult:
+        """
+        Run the async flow for a single job and save its outputs.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            Result of the job
+        """
+        started = time.perf_counter()
+        try:
+            flow = self._restore_flow(AsyncCoverLetterFlow, job)
+            if flow is None:
+                with self._timed_parse(job):
+                    job_desc_text = await asyncio.to_thread(
+                        DocumentParser.parse_source,
+                        job.job_description,
+                        cache=self.document_cache,
+                        scraper=self.scraper,
+                    )
+                flow = self._create_flow(AsyncCoverLetterFlow, job, job_desc_text)
+            await flow.kickoff_async()
+
+            return await asyncio.to_thread(self._job_result, job, flow, started)
+
+        except Exception as e:  # noqa: BLE001
+            return self._failed_result(job, e, started)
+
+    def _new_flow(
+        self, flow_cls: type[CoverLetterFlow], job: BatchJob
+    ) -> CoverLetterFlow:
+        """Create a flow sharing the batch's LLMs, caches and checkpoint store."""
+        flow = flow_cls(
+            self.llm,
+            translation_llm=self.translation_llm,
+            crew_pool=self.crew_pool,
+            digest_cache=self.digest_cache,
+            linter=self.linter,
+            translation_memory=self.translation_memory,
+            checkpoints=self.checkpoints,
+            metrics=self.metrics,
+        )
+        # Job ids are unique within the batch and name its checkpoint
+        flow.state.id = job.job_id
+        return flow
+
+    def _restore_flow(
+        self, flow_cls: type[CoverLetterFlow], job: BatchJob
+    ) -> CoverLetterFlow | None:
+        """Restore the flow of a job from its checkpoint when resuming the batch."""
+        if not self.resume or self.checkpoints is None:
+            return None
+        if not self.checkpoints.exists(job.job_id):
+            return None
+        flow = self._new_flow(flow_cls, job)
+        flow.restore(job.job_id)
+        return flow
+
+    def _create_flow(
+        self, flow_cls: type[CoverLetterFlow], job: BatchJob, job_desc_text: str
+    ) -> CoverLetterFlow:
+        """Create a flow with its state initialized for a job."""
+        flow = self._new_flow(flow_cls, job)
+        flow.state.job_description = job_desc_text
+        flow.state.cv_content = self.cv_content
+        flow.state.supporting_docs = list(self.supporting_docs)
+        flow.state.max_iterations = self.config.max_iterations
+        flow.state.plateau_patience = self.config.plateau_patience
+        flow.state.plateau_min_delta = self.config.plateau_min_delta
+        flow.state.convergence_threshold = self.config.convergence_threshold
+        flow.state.draft_candidates = self.config.draft_candidates
+        if self.config.summarization_enabled:
+            flow.state.summarize_min_tokens = self.config.summarization_min_tokens
+        flow.state.summary_target_tokens = self.config.summarization_target_tokens
+        flow.state.supporting_docs_token_budget = (
+            self.config.supporting_docs_token_budget
+        )
+        flow.state.cv_token_budget = self.config.cv_token_budget
+        flow.state.chunk_tokens = self.config.retrieval_chunk_tokens
+        flow.state.translate_to = (
+            job.translate_to or self.config.translation_target_language
+        )
+        return flow
+
+    def _timed_parse(self, job: BatchJob) -> Any:
+        """Time loading (and for URLs scraping) the job description."""
+        source = "url" if DocumentParser.is_url(job.job_description) else "file"
+        return timed(
+            self.metrics,
+            "document_parse_seconds",
+            kind="job_description",
+            source=source,
+        )
+
+    def _record_job(self, result: BatchJobResult) -> None:
+        """Record a finished job and refresh the Prometheus text file."""
+        if self.metrics is None:
+            return
+        status = "failed" if result.error is not None else "succeeded"
+        self.metrics.observe(
+            "batch_job_seconds", result.duration_seconds, status=status
+        )
+        if self.config.metrics_prometheus_file:
+            self.metrics.write_prometheus(self.config.metrics_prometheus_file)
+
+    def _job_result(
+        self, job: BatchJob, flow: CoverLetterFlow, started: float
+    ) -> BatchJobResult:
+        """Save the outputs of a finished flow and build its result."""
+        with timed(self.metrics, "output_write_seconds"):
+            saved = FileHandler.save_flow_outputs(
+                state=flow.state,
+                output_dir=str(self.job_output_dir(job)),
+                cover_letter_filename_pattern=self.config.cover_letter_filename_pattern,
+                feedback_filename_pattern=self.config.feedback_filename_pattern,
+                usage_filename_pattern=self.config.usage_filename_pattern,
+            )
+
+        # The outputs are saved, so the job no longer needs to be resumable
+        if self.checkpoints is not None:
+            self.checkpoints.delete(job.job_id)
+
+        return BatchJobResult(
+            job_id=job.job_id,
+            job_description=job.job_description,
+            status=flow.state.status,
+            iterations=flow.state.iteration_count,
+            final_decision=flow.state.final_decision,
+            final_score=next(
+                (
+                    feedback.aggregate_score
+                    for feedback in reversed(flow.state.feedback_history)
+                    if feedback.aggregate_score is not None
+                ),
+                None,
+            ),
+            output_files={kind: str(path) for kind, path in saved.items()},
+            duration_seconds=time.perf_counter() - started,
+            usage=flow.state.usage,
+        )
+
+    @staticmethod
+    def _failed_result(
+        job: BatchJob, error: Exception, started: float
+    ) -> BatchJobResult:
+        """Build the result of a failed job."""
+        return BatchJobResult(
+            job_id=job.job_id,
+            job_description=job.job_description,
+            status="FAILED",
+            error=str(error),
+            duration_seconds=time.perf_counter() - started,
+        )
+
+    def job_output_dir(self, job: BatchJob) -> Path:
+        """Get the output directory of a job."""
+        return Path(self.config.output_directory) / job.job_id
+
+    def save_summary(self, results: list[BatchJobResult], wall_seconds: float) -> Path:
+        """
+        Save the batch summary to the output directory.
+
+        Args:
+            results: Results returned by run()
+            wall_seconds: Total wall-clock time of the batch
+
+        Returns:
+            Path to saved summary file
+        """
+        summary = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "total_jobs": len(results),
+            "succeeded": sum(1 for r in results if r.error is None),
+            "failed": sum(1 for r in results if r.error is not None),
+            "approved": sum(1 for r in results if r.status == "APPROVED"),
+            "max_workers": self.max_workers,
+            "wall_seconds": round(wall_seconds, 3),
+            "crew_pool": self.crew_pool.stats(),
+            "translation_memory": (
+                self.translation_memory.stats()
+                if self.translation_memory is not None
+                else None
+            ),
+            "usage": summarize_usage(call for r in results for call in r.usage),
+            "metrics": self.metrics.summary() if self.metrics is not None else None,
+            "jobs": [
+                r.model_dump() | {"usage": summarize_usage(r.usage)} for r in results
+            ],
+        }
+        return FileHandler.save_batch_summary(
+            summary=summary,
+            output_dir=self.config.output_directory,
+            filename_pattern=self.config.batch_summary_filename_pattern,
+        )
@@ -7,9 +7,6 @@ from typing import Any
 import yaml
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 class Config:
     """Configuration class with hierarchical loading."""
@@ -20,14 +17,25 @@ class Config:
             "provider": "openai",
             "model": "gpt-5.1",
             "temperature": 0.7,
+            "prompt_caching": False,
+            "streaming": False,
+            "fake": {"script": None, "latency_seconds": 0.0},
+            "replay": {"cassette": None, "latency_seconds": 0.0},
+            "record_cassette": None,
         },
         "writer": {
             "max_iterations": 3,
+            "plateau_patience": None,
+            "plateau_min_delta": 0.25,
+            "convergence_threshold": None,
+            "draft_candidates": 1,
         },
         "output": {
             "directory": "./output",
             "cover_letter_filename_pattern": "cover_letter_optimized_{timestamp}.md",
             "feedback_filename_pattern": "cover_letter_review_history_{timestamp}.md",
+            "usage_filename_pattern": "token_usage_{timestamp}.json",
+            "metrics_filename_pattern": "metrics_{timestamp}.json",
         },
         "translation": {
             "enabled": False,
@@ -35,6 +43,67 @@ class Config:
             "llm_provider": None,
             "llm_model": None,
         },
+        "documents": {
+            "pdf_workers": 1,
+            "pdf_parallel_threshold": 20,
+            "supporting_max_pages": None,
+            "supporting_max_chars": None,
+        },
+        "summarization": {
+            "enabled": False,
+            "min_tokens": 1500,
+            "target_tokens": 600,
+        },
+        "lint": {
+            "enabled": False,
+            "auto_fix": True,
+            "min_words": 200,
+            "max_words": 600,
+            "banned_phrases": None,
+        },
+        "retrieval": {
+            "supporting_docs_token_budget": None,
+            "cv_token_budget": None,
+            "chunk_tokens": 150,
+        },
+        "scraping": {
+            "html_engine": "auto",
+        },
+        "cache": {
+            "directory": "~/.cache/cover_letter_writer",
+            "llm": {
+                "mode": "bypass",
+                "max_size_mb": 512,
+                "ttl_hours": 720,
+            },
+            "documents": {
+                "enabled": True,
+            },
+            "http": {
+                "enabled": True,
+                "max_size_mb": 128,
+            },
+            "digests": {
+                "enabled": True,
+            },
+            "translations": {
+                "enabled": False,
+            },
+        },
+        "checkpoints": {
+            "enabled": True,
+            "directory": None,
+        },
+        "metrics": {
+            "enabled": True,
+            "prometheus_file": None,
+            "prometheus_port": None,
+        },
+        "batch": {
+            "max_workers": 4,
+            "use_async": False,
+            "summary_filename_pattern": "batch_summary_{timestamp}.json",
+        },
     }
 
     def __init__(self, config_file: str | None = None):
@@ -50,6 +119,9 @@ class Config:
         Args:
             config_file: Path to config file (YAML)
         """
+        # Load environment variables from .env file (variables already set
+        # in the environment win)
+        load_dotenv()
         self.config = self._load_config(config_file)
 
     def _load_config(self, config_file: str | None) -> dict[str, Any]:
@@ -96,10 +168,38 @@ class Config:
             config["llm"]["model"] = os.getenv("LLM_MODEL")
         if os.getenv("LLM_TEMPERATURE"):
             config["llm"]["temperature"] = float(os.getenv("LLM_TEMPERATURE"))
+        if os.getenv("LLM_STREAMING"):
+            config["llm"]["streaming"] = os.getenv("LLM_STREAMING").lower() in [
+                "1",
+                "true",
+                "yes",
+            ]
+        if os.getenv("LLM_PROMPT_CACHING"):
+            config["llm"]["prompt_caching"] = os.getenv(
+                "LLM_PROMPT_CACHING"
+            ).lower() in ["1", "true", "yes"]
+        if os.getenv("LLM_FAKE_SCRIPT"):
+            config["llm"]["fake"]["script"] = os.getenv("LLM_FAKE_SCRIPT")
+        if os.getenv("LLM_FAKE_LATENCY_SECONDS"):
+            config["llm"]["fake"]["latency_seconds"] = float(
+                os.getenv("LLM_FAKE_LATENCY_SECONDS")
+            )
+        if os.getenv("LLM_REPLAY_CASSETTE"):
+            config["llm"]["replay"]["cassette"] = os.getenv("LLM_REPLAY_CASSETTE")
+        if os.getenv("LLM_RECORD_CASSETTE"):
+            config["llm"]["record_cassette"] = os.getenv("LLM_RECORD_CASSETTE")
 
         # Writer configuration
         if os.getenv("MAX_ITERATIONS"):
             config["writer"]["max_iterations"] = int(os.getenv("MAX_ITERATIONS"))
+        if os.getenv("PLATEAU_PATIENCE"):
+            config["writer"]["plateau_patience"] = int(os.getenv("PLATEAU_PATIENCE"))
+        if os.getenv("DRAFT_CANDIDATES"):
+            config["writer"]["draft_candidates"] = int(os.getenv("DRAFT_CANDIDATES"))
+        if os.getenv("CONVERGENCE_THRESHOLD"):
+            config["writer"]["convergence_threshold"] = float(
+                os.getenv("CONVERGENCE_THRESHOLD")
+            )
 
         # Output configuration
         if os.getenv("OUTPUT_DIRECTORY"):
@@ -122,6 +222,94 @@ class Config:
         if os.getenv("TRANSLATION_LLM_MODEL"):
             config["translation"]["llm_model"] = os.getenv("TRANSLATION_LLM_MODEL")
 
+        # Document parsing configuration
+        if os.getenv("PDF_WORKERS"):
+            config["documents"]["pdf_workers"] = int(os.getenv("PDF_WORKERS"))
+        if os.getenv("SUPPORTING_DOCS_MAX_PAGES"):
+            config["documents"]["supporting_max_pages"] = int(
+                os.getenv("SUPPORTING_DOCS_MAX_PAGES")
+            )
+        if os.getenv("SUPPORTING_DOCS_MAX_CHARS"):
+            config["documents"]["supporting_max_chars"] = int(
+                os.getenv("SUPPORTING_DOCS_MAX_CHARS")
+            )
+
+        # Summarization configuration
+        if os.getenv("SUMMARIZE_DOCUMENTS"):
+            config["summarization"]["enabled"] = os.getenv(
+                "SUMMARIZE_DOCUMENTS"
+            ).lower() in ["1", "true", "yes"]
+
+        # Lint configuration
+        if os.getenv("LINT_DRAFTS"):
+            config["lint"]["enabled"] = os.getenv("LINT_DRAFTS").lower() in [
+                "1",
+                "true",
+                "yes",
+            ]
+
+        # Retrieval configuration
+        if os.getenv("SUPPORTING_DOCS_TOKEN_BUDGET"):
+            config["retrieval"]["supporting_docs_token_budget"] = int(
+                os.getenv("SUPPORTING_DOCS_TOKEN_BUDGET")
+            )
+        if os.getenv("CV_TOKEN_BUDGET"):
+            config["retrieval"]["cv_token_budget"] = int(os.getenv("CV_TOKEN_BUDGET"))
+
+        # Scraping configuration
+        if os.getenv("HTML_ENGINE"):
+            config["scraping"]["html_engine"] = os.getenv("HTML_ENGINE")
+
+        # Cache configuration
+        if os.getenv("CACHE_DIRECTORY"):
+            config["cache"]["directory"] = os.getenv("CACHE_DIRECTORY")
+        if os.getenv("LLM_CACHE_MODE"):
+            config["cache"]["llm"]["mode"] = os.getenv("LLM_CACHE_MODE")
+        if os.getenv("DOCUMENT_CACHE_ENABLED"):
+            config["cache"]["documents"]["enabled"] = os.getenv(
+                "DOCUMENT_CACHE_ENABLED"
+            ).lower() in ["1", "true", "yes"]
+        if os.getenv("HTTP_CACHE_ENABLED"):
+            config["cache"]["http"]["enabled"] = os.getenv(
+                "HTTP_CACHE_ENABLED"
+            ).lower() in ["1", "true", "yes"]
+        if os.getenv("TRANSLATION_MEMORY_ENABLED"):
+            config["cache"]["translations"]["enabled"] = os.getenv(
+                "TRANSLATION_MEMORY_ENABLED"
+            ).lower() in ["1", "true", "yes"]
+
+        # Checkpoint configuration
+        if os.getenv("CHECKPOINTS_ENABLED"):
+            config["checkpoints"]["enabled"] = os.getenv(
+                "CHECKPOINTS_ENABLED"
+            ).lower() in ["1", "true", "yes"]
+        if os.getenv("CHECKPOINT_DIRECTORY"):
+            config["checkpoints"]["directory"] = os.getenv("CHECKPOINT_DIRECTORY")
+
+        # Metrics configuration
+        if os.getenv("METRICS_ENABLED"):
+            config["metrics"]["enabled"] = os.getenv("METRICS_ENABLED").lower() in [
+                "1",
+                "true",
+                "yes",
+            ]
+        if os.getenv("METRICS_PROMETHEUS_FILE"):
+            config["metrics"]["prometheus_file"] = os.getenv("METRICS_PROMETHEUS_FILE")
+        if os.getenv("METRICS_PROMETHEUS_PORT"):
+            config["metrics"]["prometheus_port"] = int(
+                os.getenv("METRICS_PROMETHEUS_PORT")
+            )
+
+        # Batch configuration
+        if os.getenv("BATCH_MAX_WORKERS"):
+            config["batch"]["max_workers"] = int(os.getenv("BATCH_MAX_WORKERS"))
+        if os.getenv("BATCH_USE_ASYNC"):
+            config["batch"]["use_async"] = os.getenv("BATCH_USE_ASYNC").lower() in [
+                "1",
+                "true",
+                "yes",
+            ]
+
         return config
 
     @staticmethod
@@ -197,11 +385,66 @@ class Config:
         """Get LLM temperature."""
         return self.get("llm.temperature", 0.7)
 
+    @property
+    def llm_streaming(self) -> bool:
+        """Get whether LLM tokens are streamed to the terminal as they arrive."""
+        return self.get("llm.streaming", False)
+
+    @property
+    def llm_prompt_caching(self) -> bool:
+        """Get whether the stable prompt prefix is marked for provider caching."""
+        return self.get("llm.prompt_caching", False)
+
+    @property
+    def llm_fake_script(self) -> str | None:
+        """Get the response script of the fake provider (None = default responses)."""
+        return self.get("llm.fake.script", None)
+
+    @property
+    def llm_fake_latency_seconds(self) -> float:
+        """Get the artificial latency of each fake provider call."""
+        return self.get("llm.fake.latency_seconds", 0.0)
+
+    @property
+    def llm_replay_cassette(self) -> str | None:
+        """Get the cassette the replay provider answers from."""
+        return self.get("llm.replay.cassette", None)
+
+    @property
+    def llm_replay_latency_seconds(self) -> float | None:
+        """Get the latency of each replayed call (None = the recorded latency)."""
+        return self.get("llm.replay.latency_seconds", 0.0)
+
+    @property
+    def llm_record_cassette(self) -> str | None:
+        """Get the cassette LLM calls are recorded to (None = no recording)."""
+        return self.get("llm.record_cassette", None)
+
     @property
     def max_iterations(self) -> int:
         """Get max iterations."""
         return self.get("writer.max_iterations", 3)
 
+    @property
+    def plateau_patience(self) -> int | None:
+        """Get iterations without score improvement before stopping (None disables)."""
+        return self.get("writer.plateau_patience")
+
+    @property
+    def plateau_min_delta(self) -> float:
+        """Get minimum aggregate review score gain that counts as improvement."""
+        return self.get("writer.plateau_min_delta", 0.25)
+
+    @property
+    def draft_candidates(self) -> int:
+        """Get number of first drafts written and reviewed concurrently."""
+        return self.get("writer.draft_candidates", 1)
+
+    @property
+    def convergence_threshold(self) -> float | None:
+        """Get the draft change ratio below which revisions stop (None disables)."""
+        return self.get("writer.convergence_threshold")
+
     @property
     def output_directory(self) -> str:
         """Get output directory."""
@@ -223,6 +466,14 @@ class Config:
             "cover_letter_review_history_{timestamp}.md",
         )
 
+    @property
+    def usage_filename_pattern(self) -> str:
+        """Get token usage report filename pattern."""
+        return self.get(
+            "output.usage_filename_pattern",
+            "token_usage_{timestamp}.json",
+        )
+
     @property
     def translation_enabled(self) -> bool:
         """Get translation enabled status."""
@@ -230,8 +481,11 @@ class Config:
 
     @property
     def translation_target_language(self) -> str | None:
-        """Get translation target language."""
-        return self.get("translation.target_language", None)
+        """Get translation target language code(s), comma-separated."""
+        language = self.get("translation.target_language", None)
+        if isinstance(language, list):
+            return ",".join(language) or None
+        return language
 
     @property
     def translation_llm_provider(self) -> str | None:
@@ -243,6 +497,183 @@ class Config:
         """Get translation LLM model (None means use main LLM)."""
         return self.get("translation.llm_model", None)
 
+    @property
+    def pdf_workers(self) -> int:
+        """Get number of processes used to extract PDF pages (1 = serial)."""
+        return self.get("documents.pdf_workers", 1)
+
+    @property
+    def pdf_parallel_threshold(self) -> int:
+        """Get minimum page count before PDF pages are extracted in parallel."""
+        return self.get("documents.pdf_parallel_threshold", 20)
+
+    @property
+    def supporting_docs_max_pages(self) -> int | None:
+        """Get page limit per supporting PDF (None means no limit)."""
+        return self.get("documents.supporting_max_pages", None)
+
+    @property
+    def supporting_docs_max_chars(self) -> int | None:
+        """Get character limit per supporting document (None means no limit)."""
+        return self.get("documents.supporting_max_chars", None)
+
+    @property
+    def summarization_enabled(self) -> bool:
+        """Get whether long documents are condensed into digests once per run."""
+        return self.get("summarization.enabled", False)
+
+    @property
+    def summarization_min_tokens(self) -> int:
+        """Get token count above which a document is condensed."""
+        return self.get("summarization.min_tokens", 1500)
+
+    @property
+    def summarization_target_tokens(self) -> int:
+        """Get target digest length in tokens."""
+        return self.get("summarization.target_tokens", 600)
+
+    @property
+    def lint_enabled(self) -> bool:
+        """Get whether drafts are linted locally before the review."""
+        return self.get("lint.enabled", False)
+
+    @property
+    def lint_auto_fix(self) -> bool:
+        """Get whether dashes and chatty preambles are fixed without the writer."""
+        return self.get("lint.auto_fix", True)
+
+    @property
+    def lint_min_words(self) -> int | None:
+        """Get minimum cover letter length in words (None disables the check)."""
+        return self.get("lint.min_words", 200)
+
+    @property
+    def lint_max_words(self) -> int | None:
+        """Get maximum cover letter length in words (None disables the check)."""
+        return self.get("lint.max_words", 600)
+
+    @property
+    def lint_banned_phrases(self) -> list[str] | None:
+        """Get banned expressions (None uses the writer guidelines' list)."""
+        return self.get("lint.banned_phrases")
+
+    @property
+    def supporting_docs_token_budget(self) -> int | None:
+        """Get token budget for relevant supporting document excerpts."""
+        return self.get("retrieval.supporting_docs_token_budget", None)
+
+    @property
+    def cv_token_budget(self) -> int | None:
+        """Get token budget for relevant CV excerpts (None sends the full CV)."""
+        return self.get("retrieval.cv_token_budget", None)
+
+    @property
+    def retrieval_chunk_tokens(self) -> int:
+        """Get target chunk size in tokens for relevance ranking."""
+        return self.get("retrieval.chunk_tokens", 150)
+
+    @property
+    def html_engine(self) -> str:
+        """Get HTML extraction engine (auto, selectolax, lxml, html.parser)."""
+        return self.get("scraping.html_engine", "auto")
+
+    @property
+    def cache_directory(self) -> str:
+        """Get directory of the on-disk caches."""
+        return self.get("cache.directory", "~/.cache/cover_letter_writer")
+
+    @property
+    def llm_cache_mode(self) -> str:
+        """Get LLM response cache mode (bypass, read_only, read_write)."""
+        return self.get("cache.llm.mode", "bypass")
+
+    @property
+    def llm_cache_max_size_mb(self) -> float | None:
+        """Get maximum LLM response cache size in MB (None means unlimited)."""
+        return self.get("cache.llm.max_size_mb", 512)
+
+    @property
+    def llm_cache_ttl_hours(self) -> float | None:
+        """Get time-to-live of cached LLM responses (None means no expiry)."""
+        return self.get("cache.llm.ttl_hours", 720)
+
+    @property
+    def document_cache_enabled(self) -> bool:
+        """Get whether extracted document text is cached on disk."""
+        return self.get("cache.documents.enabled", True)
+
+    @property
+    def http_cache_enabled(self) -> bool:
+        """Get whether fetched web pages are cached for revalidation."""
+        return self.get("cache.http.enabled", True)
+
+    @property
+    def http_cache_max_size_mb(self) -> float | None:
+        """Get maximum HTTP cache size in MB (None means unlimited)."""
+        return self.get("cache.http.max_size_mb", 128)
+
+    @property
+    def digest_cache_enabled(self) -> bool:
+        """Get whether document digests are cached on disk."""
+        return self.get("cache.digests.enabled", True)
+
+    @property
+    def translation_memory_enabled(self) -> bool:
+        """Get whether translated paragraphs are remembered and reused."""
+        return self.get("cache.translations.enabled", False)
+
+    @property
+    def metrics_filename_pattern(self) -> str:
+        """Get metrics report filename pattern."""
+        return self.get(
+            "output.metrics_filename_pattern",
+            "metrics_{timestamp}.json",
+        )
+
+    @property
+    def metrics_enabled(self) -> bool:
+        """Get whether step, kickoff and LLM metrics are recorded."""
+        return self.get("metrics.enabled", True)
+
+    @property
+    def metrics_prometheus_file(self) -> str | None:
+        """Get file receiving the metrics in Prometheus text format (None: off)."""
+        return self.get("metrics.prometheus_file")
+
+    @property
+    def metrics_prometheus_port(self) -> int | None:
+        """Get port serving the metrics at /metrics during batches (None: off)."""
+        return self.get("metrics.prometheus_port")
+
+    @property
+    def checkpoints_enabled(self) -> bool:
+        """Get whether the flow state is checkpointed after every step."""
+        return self.get("checkpoints.enabled", True)
+
+    @property
+    def checkpoint_directory(self) -> str:
+        """Get directory of run checkpoints (defaults to <cache dir>/checkpoints)."""
+        return self.get("checkpoints.directory") or str(
+            Path(self.cache_directory) / "checkpoints"
+        )
+
+    @property
+    def batch_max_workers(self) -> int:
+        """Get number of concurrent flows in batch mode."""
+        return self.get("batch.max_workers", 4)
+
+    @property
+    def batch_use_async(self) -> bool:
+        """Get whether batch mode multiplexes async flows on one event loop."""
+        return self.get("batch.use_async", False)
+
+    @property
+    def batch_summary_filename_pattern(self) -> str:
+        """Get batch summary filename pattern."""
+        return self.get(
+            "batch.summary_filename_pattern", "batch_summary_{timestamp}.json"
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Return configuration as dictionary."""
         return self.config.copy()
@@ -1,38 +1,166 @@
 """Cover Letter Generation Flow using CrewAI Flow."""
 
+import asyncio
+import functools
+import inspect
 import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Literal
 
 from crewai.flow import Flow, listen, or_, router, start
+from pydantic import ValidationError
 
 from cover_letter_writer.crews.reviewer_crew import ReviewerCrew
+from cover_letter_writer.crews.summarizer_crew import SummarizerCrew
 from cover_letter_writer.crews.translator_crew import TranslatorCrew
 from cover_letter_writer.crews.writer_crew import WriterCrew
-from cover_letter_writer.models.state_models import CoverLetterState, ReviewFeedback
+from cover_letter_writer.models.state_models import (
+    CoverLetterState,
+    ReviewFeedback,
+    ReviewResult,
+)
+from cover_letter_writer.tools.document_retriever import (
+    Chunk,
+    estimate_tokens,
+    fits_budget,
+    select_chunks,
+)
+from cover_letter_writer.tools.draft_diff import change_ratio
+from cover_letter_writer.tools.draft_linter import DraftLinter
+from cover_letter_writer.utils.checkpoints import FlowCheckpointStore
+from cover_letter_writer.utils.crew_pool import CrewPool, default_crew_pool
+from cover_letter_writer.utils.digest_cache import DigestCache
+from cover_letter_writer.utils.metrics import MetricsRecorder
+from cover_letter_writer.utils.streaming import stream_tokens
+from cover_letter_writer.utils.token_accounting import track_usage
+from cover_letter_writer.utils.translation_memory import (
+    TranslationMemory,
+    TranslationPlan,
+)
+
+# Instructions that make parallel first drafts take different approaches
+# (also keeps their prompts, and so their cached responses, distinct)
+CANDIDATE_ANGLES = [
+    "",
+    "Open with the candidate's most impressive concrete achievement.",
+    "Open with what draws the candidate to this company and role.",
+    "Lead with the job's most important requirement and how the candidate meets it.",
+]
+
+
+def flow_step(step: Callable) -> Callable:
+    """
+    Record, time and checkpoint a completed flow step.
+
+    When the flow was restored from a checkpoint, steps completed before it
+    are replayed without doing any work (routers return the recorded route),
+    so the run continues at the first unfinished step. Apply below the
+    CrewAI step decorator.
+
+    Args:
+        step: Flow step method
+
+    Returns:
+        Wrapped step method
+    """
+    name = step.__name__
+
+    if inspect.iscoroutinefunction(step):
+
+        @functools.wraps(step)
+        async def run_async_step(
+            self: "CoverLetterFlow", *args: Any, **kwargs: Any
+        ) -> Any:
+            # Steps delegating to the parent implementation are recorded once
+            if self._active_step is not None:
+                return await step(self, *args, **kwargs)
+            replayed, output = self._replay_step(name)
+            if replayed:
+                return output
+            self._active_step = name
+            started = time.perf_counter()
+            try:
+                output = await step(self, *args, **kwargs)
+            finally:
+                self._active_step = None
+            self._complete_step(name, output, time.perf_counter() - started)
+            return output
+
+        return run_async_step
+
+    @functools.wraps(step)
+    def run_step(self: "CoverLetterFlow", *args: Any, **kwargs: Any) -> Any:
+        # Steps delegating to the parent implementation are recorded once
+        if self._active_step is not None:
+            return step(self, *args, **kwargs)
+        replayed, output = self._replay_step(name)
+        if replayed:
+            return output
+        self._active_step = name
+        started = time.perf_counter()
+        try:
+            output = step(self, *args, **kwargs)
+        finally:
+            self._active_step = None
+        self._complete_step(name, output, time.perf_counter() - started)
+        return output
+
+    return run_step
 
 
 class CoverLetterFlow(Flow[CoverLetterState]):
     """Flow for iterative cover letter generation with review and revision."""
 
-    def __init__(self, llm: Any, translation_llm: Any | None = None):
+    def __init__(
+        self,
+        llm: Any,
+        translation_llm: Any | None = None,
+        crew_pool: CrewPool | None = None,
+        digest_cache: DigestCache | None = None,
+        on_token: Callable[[str, str], None] | None = None,
+        linter: DraftLinter | None = None,
+        translation_memory: TranslationMemory | None = None,
+        checkpoints: FlowCheckpointStore | None = None,
+        metrics: MetricsRecorder | None = None,
+    ):
         """
         Initialize Cover Letter Generation Flow.
 
         Args:
             llm: Language model instance for generation
             translation_llm: Optional separate LLM for translation (uses main LLM if None)
+            crew_pool: Pool of reusable crews (defaults to the process-wide pool)
+            digest_cache: Optional cache of document digests from earlier runs
+            on_token: Optional callback receiving (flow step, text) for every
+                token streamed by the crews' LLM
+            linter: Optional rule engine checking drafts before the review
+            translation_memory: Optional memory of translated paragraphs
+            checkpoints: Optional store receiving the state after every step
+                (keyed by the flow id, state.id)
+            metrics: Optional recorder of step, kickoff and LLM metrics
         """
         super().__init__()
         self.llm = llm
         self.translation_llm = translation_llm or llm
+        self.crew_pool = crew_pool or default_crew_pool
+        self.digest_cache = digest_cache
+        self.on_token = on_token
+        self.linter = linter
+        self.translation_memory = translation_memory
+        self.checkpoints = checkpoints
+        self.metrics = metrics
+        self._step_position = 0
+        self._active_step: str | None = None
 
     @start()
+    @flow_step
     def initialize_flow(self):
         """Initialize the flow and load all documents."""
-        print(f"\n{'=' * 80}")
-        print("COVER LETTER GENERATOR - STARTING")
-        print(f"{'=' * 80}\n")
+        self._print_banner("COVER LETTER GENERATOR - STARTING")
         print(f"Job Description length: {len(self.state.job_description)} characters")
         print(f"CV length: {len(self.state.cv_content)} characters")
         print(f"Supporting Documents: {len(self.state.supporting_docs)}")
@@ -42,141 +170,708 @@ class CoverLetterFlow(Flow[CoverLetterState]):
         self.state.status = "WRITING"
 
     @listen(initialize_flow)
+    @flow_step
+    def summarize_documents(self):
+        """Condense long documents into digests and select relevant context once."""
+        for index, kind, text in self._pending_digests():
+            inputs = self._summary_inputs(kind, text)
+            result = self._kickoff(
+                SummarizerCrew, self.llm, "summarize_documents", inputs
+            )
+            self._store_digest(index, kind, text, result)
+
+        # Relevant excerpts are selected once and reused by every iteration
+        self._select_context()
+
+    @listen(summarize_documents)
+    @flow_step
     def create_first_draft(self):
         """Generate the initial cover letter draft."""
-        self.state.iteration_count = 1
+        self._start_iteration(1)
 
-        print(f"\n{'=' * 80}")
-        print(f"ITERATION {self.state.iteration_count} - WRITING PHASE")
-        print(f"{'=' * 80}\n")
+        # Write and review several drafts concurrently and keep the best one
+        candidates = self.state.draft_candidates
+        if candidates > 1:
+            with ThreadPoolExecutor(max_workers=candidates) as executor:
+                results = list(executor.map(self._write_candidate, range(candidates)))
+            self._keep_best_candidate(results)
+            return
 
-        # Prepare supporting docs text
-        supporting_docs_text = self._format_supporting_docs()
+        # Run writer crew
+        inputs = self._first_draft_inputs()
+        result = self._kickoff(WriterCrew, self.llm, "create_first_draft", inputs)
+        self._store_draft(result, label="First draft")
+
+    @listen("decision_to_revise")
+    @flow_step
+    def revise_draft(self):
+        """Generate an improved draft based on feedback."""
+        self._start_iteration(self.state.iteration_count + 1)
 
         # Run writer crew
-        result = (
-            WriterCrew(self.llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "job_description": self.state.job_description,
-                    "cv_content": self.state.cv_content,
-                    "supporting_documents": supporting_docs_text,
-                    "reviewer_feedback": "This is the initial draft. Please create a compelling cover letter.",
-                    "draft_content": "No previous draft.",
-                }
-            )
-        )
+        inputs = self._revision_inputs()
+        result = self._kickoff(WriterCrew, self.llm, "revise_draft", inputs)
+        self._store_draft(result, label="Revised draft")
 
-        # Extract the writer's output
-        if hasattr(result, "tasks_output") and len(result.tasks_output) > 0:
-            draft = result.tasks_output[0].raw
+    @listen(or_(create_first_draft, revise_draft))
+    @flow_step
+    def review_draft(self):
+        """Review the current draft."""
+        if not self._start_review():
+            return
+
+        # Run reviewer crew
+        inputs = self._review_inputs()
+        result = self._kickoff(ReviewerCrew, self.llm, "review_draft", inputs)
+        self._store_review(result)
+
+    @router(review_draft)
+    @flow_step
+    def route_decision(
+        self,
+    ) -> Literal["decision_to_finalize", "decision_to_revise"]:
+        """
+        Route based on reviewer decision.
+
+        Returns:
+            Next method to execute
+        """
+        decision = self.state.final_decision
+
+        # Check if approved
+        if decision == "APPROVED":
+            self._print_banner("COVER LETTER APPROVED - Flow Complete")
+            self.state.status = "APPROVED"
+            return "decision_to_finalize"
+
+        # Stop if the last revision left the draft essentially unchanged
+        if self.state.feedback_history[-1].source == "convergence":
+            self._print_banner("DRAFTS CONVERGED - Flow Complete")
+            self.state.status = "CONVERGED"
+            return "decision_to_finalize"
+
+        # Check if max iterations reached
+        if self.state.iteration_count >= self.state.max_iterations:
+            self._print_banner("MAX ITERATIONS REACHED - Flow Complete")
+            self.state.status = "MAX_ITERATIONS_REACHED"
+            return "decision_to_finalize"
+
+        # Stop early if further revisions stopped improving the scores
+        if self._score_plateaued():
+            self._print_banner("REVIEW SCORES PLATEAUED - Flow Complete")
+            self.state.status = "SCORE_PLATEAU"
+            return "decision_to_finalize"
+
+        # Continue to revision
+        print("\nContinuing to revision phase...")
+        self.state.status = "REVISING"
+        return "decision_to_revise"
+
+    @listen("decision_to_finalize")
+    @flow_step
+    def complete_flow(self):
+        """Complete the writing phase."""
+        self._print_banner("COVER LETTER WRITING COMPLETE")
+        print(f"Final Status: {self.state.status}")
+        print(f"Total Iterations: {self.state.iteration_count}")
+        print(f"Total Feedback Entries: {len(self.state.feedback_history)}\n")
+
+    @router(complete_flow)
+    @flow_step
+    def route_translation(
+        self,
+    ) -> Literal["decision_to_translate", "decision_to_end"]:
+        """
+        Route based on translation requirement.
+
+        Returns:
+            Next method to execute or None to end flow
+        """
+        if self.state.target_languages:
+            languages = ", ".join(self.state.target_languages).upper()
+            print(f"\nTranslation requested to {languages}...")
+            return "decision_to_translate"
         else:
-            draft = result.raw
+            print("\nNo translation requested. Flow complete.")
+            return "decision_to_end"
 
-        # Clean up the draft
-        draft = self._clean_markdown_wrapper(draft)
+    @listen("decision_to_translate")
+    @flow_step
+    def translate_cover_letter(self):
+        """Translate the final cover letter to all target languages concurrently."""
+        languages = self._start_translation()
 
-        # Update state
-        self.state.current_draft = draft
+        # Translations are independent, so each language gets its own crew
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            translations = list(executor.map(self._translate, languages))
 
-        print(f"\nFirst draft length: {len(draft)} characters")
-        print(f"Completed iteration {self.state.iteration_count}\n")
+        for language, translated in zip(languages, translations):
+            self._store_translation(language, translated)
 
-        # Move to review
-        self.state.status = "REVIEWING"
+    @listen(or_(translate_cover_letter, "decision_to_end"))
+    @flow_step
+    def finalize_flow(self):
+        """Final cleanup and flow termination."""
+        self._print_banner("FLOW FINALIZED")
 
-    @listen("decision_to_revise")
-    def revise_draft(self):
-        """Generate an improved draft based on feedback."""
-        self.state.iteration_count += 1
+    async def stream(
+        self, inputs: dict[str, Any] | None = None
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        Run the flow and yield its LLM tokens as they arrive.
+
+        Usage::
+
+            async for step, text in flow.stream(inputs):
+                print(text, end="")
+
+        The final results are in flow.state once the iteration ends.
+
+        Args:
+            inputs: Optional flow inputs (as for kickoff)
+
+        Yields:
+            (flow step, text) per streamed chunk
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        callback = self.on_token
+
+        def forward(step: str, text: str) -> None:
+            # Tokens may arrive from worker threads running the LLM calls
+            loop.call_soon_threadsafe(queue.put_nowait, (step, text))
+            if callback is not None:
+                callback(step, text)
+
+        self.on_token = forward
+        run = asyncio.ensure_future(self._run_streamed(inputs))
+        run.add_done_callback(lambda _: loop.call_soon(queue.put_nowait, done))
+        try:
+            while (item := await queue.get()) is not done:
+                yield item
+            await run
+        finally:
+            if not run.done():
+                run.cancel()
+            self.on_token = callback
+
+    async def _run_streamed(self, inputs: dict[str, Any] | None) -> None:
+        """Run the flow for stream() without blocking the event loop."""
+        await asyncio.to_thread(self.kickoff, inputs)
+
+    def restore(self, run_id: str) -> None:
+        """
+        Restore the state of an interrupted run from its checkpoint.
+
+        A following kickoff() skips the steps completed before the
+        checkpoint and continues with the first unfinished one.
+
+        Args:
+            run_id: Flow id of the interrupted run
+
+        Raises:
+            ValueError: If the flow has no checkpoint store or the
+                checkpoint can't be resumed
+            FileNotFoundError: If the run has no checkpoint
+        """
+        if self.checkpoints is None:
+            raise ValueError("Cannot resume a run without a checkpoint store")
+        saved_state = self.checkpoints.load(run_id)
+        try:
+            restored = type(self.state).model_validate(saved_state | {"id": run_id})
+        except ValidationError as e:
+            raise ValueError(f"Invalid checkpoint of run {run_id}: {e}") from e
+
+        for name in type(self.state).model_fields:
+            setattr(self.state, name, getattr(restored, name))
+        self._step_position = 0
+
+        last_step = (self.state.completed_steps or ["(none)"])[-1].partition("=")[0]
+        print(
+            f"Resuming run {run_id} after step {last_step} "
+            f"(iteration {self.state.iteration_count}, status {self.state.status})"
+        )
+
+    def _replay_step(self, name: str) -> tuple[bool, Any]:
+        """
+        Check whether a step was completed before the restored checkpoint.
+
+        Args:
+            name: Step name
+
+        Returns:
+            (True, recorded router output) for a completed step, else (False, None)
+        """
+        steps = self.state.completed_steps
+        if self._step_position >= len(steps):
+            return False, None
+
+        step, _, route = steps[self._step_position].partition("=")
+        if step != name:
+            # The flow took another path than the checkpointed run; redo from here
+            del steps[self._step_position :]
+            return False, None
+        self._step_position += 1
+        return True, route or None
+
+    def _complete_step(self, name: str, output: Any, seconds: float) -> None:
+        """Record a completed step and its wall time and checkpoint the state."""
+        if self.metrics is not None:
+            self.metrics.observe("flow_step_seconds", seconds, step=name)
+        entry = f"{name}={output}" if isinstance(output, str) else name
+        self.state.completed_steps.append(entry)
+        self._step_position = len(self.state.completed_steps)
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.save(self.state.id, self.state)
+        except OSError as e:
+            print(f"⚠️  Checkpoint not saved after {name}: {e}")
+
+    @contextmanager
+    def _checkout(
+        self, crew_cls: type, llm: Any, step: str, inputs: dict[str, Any]
+    ) -> Iterator[Any]:
+        """
+        Check out a pooled crew and record the token usage and metrics of its kickoff.
 
+        Tokens are streamed to on_token while the crew runs, if set.
+
+        Args:
+            crew_cls: Crew class to run
+            llm: Language model of the crew
+            step: Flow step running the crew
+            inputs: Kickoff inputs (counted per prompt section)
+
+        Yields:
+            Crew ready for kickoff
+        """
+        on_token = self.on_token
+        callback = (lambda text: on_token(step, text)) if on_token else None
+        with self.crew_pool.acquire(crew_cls, llm) as crew:
+            with (
+                track_usage(
+                    crew,
+                    crew_name=crew_cls.__name__.removesuffix("Crew").lower(),
+                    step=step,
+                    inputs=inputs,
+                    iteration=self.state.iteration_count,
+                    model=getattr(llm, "model", None),
+                ) as usage,
+                stream_tokens(callback) as stream,
+            ):
+                yield crew
+            usage.time_to_first_token_seconds = stream.time_to_first_token
+            self.state.usage.append(usage)
+            if self.metrics is not None:
+                self.metrics.record_usage(usage)
+
+    def _kickoff(
+        self, crew_cls: type, llm: Any, step: str, inputs: dict[str, Any]
+    ) -> Any:
+        """Run a pooled crew for a flow step and return its result."""
+        with self._checkout(crew_cls, llm, step, inputs) as crew:
+            return crew.kickoff(inputs=inputs)
+
+    @staticmethod
+    def _print_banner(title: str) -> None:
+        """Print a section banner of the flow progress output."""
         print(f"\n{'=' * 80}")
-        print(f"ITERATION {self.state.iteration_count} - WRITING PHASE")
+        print(title)
         print(f"{'=' * 80}\n")
 
-        # Get latest feedback
-        latest_feedback = self.state.feedback_history[-1].comments
+    def _start_iteration(self, iteration: int) -> None:
+        """Enter the writing phase of an iteration."""
+        self.state.iteration_count = iteration
+        self._print_banner(f"ITERATION {iteration} - WRITING PHASE")
 
-        # Prepare supporting docs text
-        supporting_docs_text = self._format_supporting_docs()
+    def _start_review(self) -> bool:
+        """
+        Enter the review phase and check whether the draft needs a reviewer call.
 
-        # Run writer crew
-        result = (
-            WriterCrew(self.llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "job_description": self.state.job_description,
-                    "cv_content": self.state.cv_content,
-                    "supporting_documents": supporting_docs_text,
-                    "reviewer_feedback": latest_feedback,
-                    "draft_content": self.state.current_draft,
-                }
-            )
+        Drafts failing lint and converged revisions get their feedback here
+        without a review.
+
+        Returns:
+            True if the reviewer crew has to review the current draft
+        """
+        # Parallel first drafts were already reviewed to pick the best one
+        if self._draft_reviewed():
+            return False
+
+        self._print_banner(f"ITERATION {self.state.iteration_count} - REVIEW PHASE")
+
+        # Mechanical violations go straight back to the writer
+        if self._lint_rejected():
+            self._store_lint_feedback()
+            return False
+
+        # A revision that barely changed the draft is not worth another review
+        if self._draft_converged():
+            self._store_skipped_review()
+            return False
+
+        return True
+
+    def _start_translation(self) -> list[str]:
+        """Enter the translation phase and return the target languages."""
+        languages = self.state.target_languages
+        self._print_banner(
+            f"TRANSLATION PHASE - Translating to {', '.join(languages).upper()}"
         )
+        return languages
 
-        # Extract the writer's output
-        if hasattr(result, "tasks_output") and len(result.tasks_output) > 0:
-            revised_draft = result.tasks_output[0].raw
+    def _pending_digests(self) -> list[tuple[int | None, str, str]]:
+        """
+        Apply cached digests and list the long documents still to be condensed.
+
+        Returns:
+            (index, kind, text) per document, with index None for the CV
+        """
+        min_tokens = self.state.summarize_min_tokens
+        if min_tokens is None:
+            return []
+
+        self.state.supporting_doc_digests = [None] * len(self.state.supporting_docs)
+        documents = [(None, "CV", self.state.cv_content)] + [
+            (index, "supporting document", doc)
+            for index, doc in enumerate(self.state.supporting_docs)
+        ]
+
+        pending = []
+        for index, kind, text in documents:
+            if estimate_tokens(text) <= min_tokens:
+                continue
+            digest = None
+            if self.digest_cache is not None:
+                digest = self.digest_cache.get(self._digest_key(kind, text))
+            if digest is None:
+                pending.append((index, kind, text))
+            else:
+                self._set_digest(index, digest)
+                print(f"{self._document_label(index)}: digest loaded from cache")
+        return pending
+
+    def _summary_inputs(self, kind: str, text: str) -> dict[str, str]:
+        """Build summarizer crew inputs for one document."""
+        return {
+            "document_kind": kind,
+            "document_content": text,
+            "target_tokens": str(self.state.summary_target_tokens),
+        }
+
+    def _digest_key(self, kind: str, text: str) -> str:
+        """Build the digest cache key of a document."""
+        return DigestCache.make_key(
+            text,
+            document_kind=kind,
+            model=getattr(self.llm, "model", None),
+            target_tokens=self.state.summary_target_tokens,
+        )
+
+    def _store_digest(
+        self, index: int | None, kind: str, text: str, result: Any
+    ) -> None:
+        """
+        Clean a summarizer crew result, store it in the state and the cache.
+
+        Args:
+            index: Supporting document index, or None for the CV
+            kind: Document kind the digest was requested for
+            text: Original document text
+            result: Summarizer crew result
+        """
+        digest = self._clean_markdown_wrapper(self._task_output(result))
+        self._set_digest(index, digest)
+        if self.digest_cache is not None:
+            self.digest_cache.put(self._digest_key(kind, text), digest)
+
+        print(
+            f"{self._document_label(index)}: condensed ~{estimate_tokens(text)} "
+            f"to ~{estimate_tokens(digest)} tokens"
+        )
+
+    def _set_digest(self, index: int | None, digest: str) -> None:
+        """Store the digest of the CV (index None) or a supporting document."""
+        if index is None:
+            self.state.cv_digest = digest
         else:
-            revised_draft = result.raw
+            self.state.supporting_doc_digests[index] = digest
+
+    @staticmethod
+    def _document_label(index: int | None) -> str:
+        """Name a document in progress output."""
+        return "CV" if index is None else f"Supporting Document {index + 1}"
+
+    def _first_draft_inputs(self) -> dict[str, str]:
+        """Build writer crew inputs for the initial draft."""
+        return {
+            "job_description": self.state.job_description,
+            "cv_content": self._cv_content(),
+            "supporting_documents": self._format_supporting_docs(),
+            "reviewer_feedback": "This is the initial draft. Please create a compelling cover letter.",
+            "draft_content": "No previous draft.",
+        }
+
+    def _revision_inputs(self) -> dict[str, str]:
+        """Build writer crew inputs for a revision based on the latest feedback."""
+        return {
+            "job_description": self.state.job_description,
+            "cv_content": self._cv_content(),
+            "supporting_documents": self._format_supporting_docs(),
+            "reviewer_feedback": self.state.feedback_history[-1].comments,
+            "draft_content": self.state.current_draft,
+        }
+
+    def _candidate_inputs(self, index: int) -> dict[str, str]:
+        """Build writer crew inputs for one of several parallel first drafts."""
+        inputs = self._first_draft_inputs()
+        angle = CANDIDATE_ANGLES[index % len(CANDIDATE_ANGLES)]
+        inputs["reviewer_feedback"] += (
+            f" This is draft variant {index + 1} of {self.state.draft_candidates}."
+            f" {angle}"
+        ).rstrip()
+        return inputs
+
+    def _review_inputs(self, draft: str | None = None) -> dict[str, str]:
+        """Build reviewer crew inputs for a draft (the current draft by default)."""
+        return {
+            "job_description": self.state.job_description,
+            "cv_content": self._cv_content(),
+            "supporting_documents": self._format_supporting_docs(),
+            "draft_content": self.state.current_draft if draft is None else draft,
+            "reviewer_feedback": "",
+        }
+
+    def _translation_inputs(self, language: str, content: str) -> dict[str, str]:
+        """Build translator crew inputs for a text to translate."""
+        return {
+            "cover_letter_content": content,
+            "target_language": language,
+        }
+
+    def _translation_step(self, language: str) -> str:
+        """Name the translation step of a language in usage records and streams."""
+        if len(self.state.target_languages) == 1:
+            return "translate_cover_letter"
+        return f"translate_cover_letter[{language}]"
+
+    def _translate(self, language: str) -> str:
+        """
+        Translate the final draft into one language.
+
+        Paragraphs found in the translation memory are reused; only the
+        others are sent to the translator. Without any paragraph found, the
+        plain draft is translated and its paragraphs are remembered.
+
+        Args:
+            language: Target language code
 
+        Returns:
+            Translated cover letter
+        """
+        plan = self._translation_plan(language)
+        if plan is not None and plan.complete:
+            return plan.assemble()
+        if plan is not None and plan.found:
+            translated = self._run_translator(language, plan.source_text())
+            merged = self._merge_translation(plan, translated)
+            if merged is not None:
+                return merged
+        translated = self._run_translator(language, self.state.current_draft)
+        self._remember_letter_translation(plan, translated)
+        return translated
+
+    def _run_translator(self, language: str, content: str) -> str:
+        """Run the translator crew on a text and return the cleaned translation."""
+        # Run translator crew with appropriate LLM
+        inputs = self._translation_inputs(language, content)
+        step = self._translation_step(language)
+        result = self._kickoff(TranslatorCrew, self.translation_llm, step, inputs)
+        return self._clean_markdown_wrapper(self._task_output(result))
+
+    def _translation_plan(self, language: str) -> TranslationPlan | None:
+        """Look up the paragraphs of the final draft in the translation memory."""
+        if self.translation_memory is None:
+            return None
+        plan = self.translation_memory.plan(
+            self.state.current_draft,
+            language,
+            model=getattr(self.translation_llm, "model", None),
+        )
+        print(
+            f"Translation memory ({language.upper()}): "
+            f"{plan.found} paragraph(s) reused, {len(plan.missing)} to translate"
+        )
+        return plan
+
+    def _merge_translation(self, plan: TranslationPlan, translated: str) -> str | None:
+        """
+        Merge translated paragraphs into a plan and remember them.
+
+        Args:
+            plan: Plan whose missing paragraphs were translated
+            translated: Translator output for plan.source_text()
+
+        Returns:
+            Reassembled letter, or None if the translator lost paragraph markers
+        """
+        if not plan.merge(translated):
+            print(
+                f"⚠️  Paragraph markers missing in the {plan.language.upper()} "
+                "translation; translating the whole letter instead."
+            )
+            return None
+        self.translation_memory.remember(plan)
+        return plan.assemble()
+
+    def _remember_letter_translation(
+        self, plan: TranslationPlan | None, translated: str
+    ) -> None:
+        """Remember the paragraphs of a whole-letter translation if they line up."""
+        if plan is not None and plan.merge_letter(translated):
+            self.translation_memory.remember(plan)
+
+    @staticmethod
+    def _task_output(result: Any) -> str:
+        """Extract the raw output of the first task from a crew result."""
+        if hasattr(result, "tasks_output") and len(result.tasks_output) > 0:
+            return result.tasks_output[0].raw
+        return result.raw
+
+    def _store_draft(self, result: Any, label: str) -> None:
+        """
+        Clean a writer crew result and store it as the current draft.
+
+        Args:
+            result: Writer crew result
+            label: Draft label used in progress output
+        """
         # Clean up the draft
-        revised_draft = self._clean_markdown_wrapper(revised_draft)
+        draft = self._clean_markdown_wrapper(self._task_output(result))
+
+        # Check mechanical requirements, fixing what can be fixed locally
+        if self.linter is not None:
+            draft = self._lint_draft(draft)
+
+        # Measure how much the revision changed the previous draft
+        previous = self.state.current_draft
+        ratio = change_ratio(previous, draft) if previous else None
 
         # Update state
-        self.state.current_draft = revised_draft
+        self.state.current_draft = draft
+        self.state.draft_change_ratio = ratio
 
-        print(f"\nRevised draft length: {len(revised_draft)} characters")
+        print(f"\n{label} length: {len(draft)} characters")
+        if ratio is not None:
+            print(f"Changed since previous draft: {ratio:.1%}")
         print(f"Completed iteration {self.state.iteration_count}\n")
 
         # Move to review
         self.state.status = "REVIEWING"
 
-    @listen(or_(create_first_draft, revise_draft))
-    def review_draft(self):
-        """Review the current draft."""
-        print(f"\n{'=' * 80}")
-        print(f"ITERATION {self.state.iteration_count} - REVIEW PHASE")
-        print(f"{'=' * 80}\n")
+    def _candidate_draft(self, result: Any) -> str:
+        """Clean and auto-fix a candidate draft the way _store_draft would."""
+        draft = self._clean_markdown_wrapper(self._task_output(result))
+        return self.linter.lint(draft).draft if self.linter is not None else draft
 
-        # Prepare supporting docs text
-        supporting_docs_text = self._format_supporting_docs()
+    def _write_candidate(self, index: int) -> tuple[Any, Any]:
+        """
+        Write and review one of several parallel first drafts.
 
-        # Run reviewer crew
-        result = (
-            ReviewerCrew(self.llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "job_description": self.state.job_description,
-                    "cv_content": self.state.cv_content,
-                    "supporting_documents": supporting_docs_text,
-                    "draft_content": self.state.current_draft,
-                    "reviewer_feedback": "",
-                }
-            )
+        Args:
+            index: Candidate number (selects the drafting angle)
+
+        Returns:
+            Writer crew result and reviewer crew result
+        """
+        step = f"create_first_draft[{index + 1}]"
+        inputs = self._candidate_inputs(index)
+        draft_result = self._kickoff(WriterCrew, self.llm, step, inputs)
+
+        inputs = self._review_inputs(self._candidate_draft(draft_result))
+        review_result = self._kickoff(ReviewerCrew, self.llm, step, inputs)
+        return draft_result, review_result
+
+    def _keep_best_candidate(self, candidates: list[tuple[Any, Any]]) -> None:
+        """
+        Store the best-reviewed parallel first draft and its review.
+
+        Approved drafts win, then the highest aggregate score; the first
+        candidate wins ties.
+
+        Args:
+            candidates: Writer and reviewer crew results per candidate
+        """
+        reviews = [
+            self._parse_review(self._task_output(review)) for _, review in candidates
+        ]
+        self.state.candidate_scores = [
+            review.scores.aggregate if review is not None else None
+            for review in reviews
+        ]
+        best = max(
+            range(len(candidates)),
+            key=lambda index: (
+                reviews[index] is not None and reviews[index].decision == "APPROVED",
+                self.state.candidate_scores[index] or 0.0,
+            ),
+        )
+
+        scores = ", ".join(
+            f"{score:.2f}" if score is not None else "n/a"
+            for score in self.state.candidate_scores
         )
+        print(f"\nBest of {len(candidates)} drafts: #{best + 1} (scores: {scores})")
 
+        draft_result, review_result = candidates[best]
+        self._store_draft(draft_result, label=f"Best draft (#{best + 1})")
+        self._store_review(review_result)
+
+    def _draft_reviewed(self) -> bool:
+        """Check whether the current iteration already has feedback."""
+        history = self.state.feedback_history
+        return bool(history) and history[-1].iteration == self.state.iteration_count
+
+    def _store_review(self, result: Any) -> None:
+        """
+        Parse a reviewer crew result and append it to the feedback history.
+
+        Args:
+            result: Reviewer crew result
+        """
         # Extract reviewer's feedback
-        if hasattr(result, "tasks_output") and len(result.tasks_output) > 0:
-            review_output = result.tasks_output[0].raw
-        else:
-            review_output = result.raw
+        review_output = self._task_output(result)
 
         print("\n✅ Review completed!")
 
-        # Parse the review to check if approved
-        review_upper = review_output.upper()
-        if "DECISION: APPROVED" in review_upper or "DECISION:APPROVED" in review_upper:
-            decision = "APPROVED"
-            comments = review_output
+        # Prefer the structured review; fall back to matching the decision text
+        review = self._parse_review(review_output)
+        if review is not None:
+            decision = review.decision
+            scores = review.scores
+            review_text = self._format_review(review)
+            print(f"Aggregate Score: {scores.aggregate:.2f}/10")
+        else:
+            review_upper = review_output.upper()
+            if (
+                "DECISION: APPROVED" in review_upper
+                or "DECISION:APPROVED" in review_upper
+            ):
+                decision = "APPROVED"
+            else:
+                decision = "NEEDS_IMPROVEMENT"
+            scores = None
+            review_text = review_output
+            print("⚠️  Review is not structured; no scores available.")
+
+        if decision == "APPROVED":
+            comments = review_text
             print("✅ Draft APPROVED by reviewer!")
         else:
-            decision = "NEEDS_IMPROVEMENT"
             comments = (
-                f"Based on the review, please improve the draft:\n\n{review_output}"
+                f"Based on the review, please improve the draft:\n\n{review_text}"
             )
             print("⚠️  Draft needs improvement. Feedback provided for next iteration.")
 
@@ -185,6 +880,9 @@ class CoverLetterFlow(Flow[CoverLetterState]):
             iteration=self.state.iteration_count,
             decision=decision,
             comments=comments,
+            scores=scores,
+            change_ratio=self.state.draft_change_ratio,
+            lint_violations=self.state.lint_violations,
             timestamp=datetime.now(),
         )
 
@@ -197,114 +895,258 @@ class CoverLetterFlow(Flow[CoverLetterState]):
         # Store decision for routing
         self.state.final_decision = decision
 
-    @router(review_draft)
-    def route_decision(
-        self,
-    ) -> Literal["decision_to_finalize", "decision_to_revise"]:
+    @staticmethod
+    def _parse_review(review_output: str) -> ReviewResult | None:
         """
-        Route based on reviewer decision.
+        Parse the reviewer's JSON answer.
+
+        Args:
+            review_output: Raw reviewer output (may contain text around the JSON)
 
         Returns:
-            Next method to execute
+            Validated review, or None if the output is not a valid review
         """
-        decision = self.state.final_decision
+        start, end = review_output.find("{"), review_output.rfind("}")
+        if start < 0 or end < start:
+            return None
+        try:
+            return ReviewResult.model_validate_json(review_output[start : end + 1])
+        except ValidationError:
+            return None
 
-        # Check if approved
-        if decision == "APPROVED":
-            print(f"\n{'=' * 80}")
-            print("COVER LETTER APPROVED - Flow Complete")
-            print(f"{'=' * 80}\n")
-            self.state.status = "APPROVED"
-            return "decision_to_finalize"
-
-        # Check if max iterations reached
-        if self.state.iteration_count >= self.state.max_iterations:
-            print(f"\n{'=' * 80}")
-            print("MAX ITERATIONS REACHED - Flow Complete")
-            print(f"{'=' * 80}\n")
-            self.state.status = "MAX_ITERATIONS_REACHED"
-            return "decision_to_finalize"
+    @staticmethod
+    def _format_review(review: ReviewResult) -> str:
+        """Render a structured review as feedback text for the writer."""
+        scores = ", ".join(
+            f"{name.replace('_', ' ')} {score}/10"
+            for name, score in review.scores.model_dump().items()
+        )
+        lines = [
+            f"DECISION: {review.decision}",
+            "",
+            f"SCORES (aggregate {review.scores.aggregate:.2f}/10): {scores}",
+            "",
+            "STRENGTHS:",
+            *(f"- {strength}" for strength in review.strengths),
+        ]
+        if review.improvements:
+            lines += [
+                "",
+                "AREAS FOR IMPROVEMENT:",
+                *(f"- {improvement}" for improvement in review.improvements),
+            ]
+        return "\n".join(lines)
+
+    def _score_plateaued(self) -> bool:
+        """
+        Check whether the last plateau_patience reviews brought no improvement.
 
-        # Continue to revision
-        print("\nContinuing to revision phase...")
-        self.state.status = "REVISING"
-        return "decision_to_revise"
+        The best aggregate score of the recent reviews has to beat the best
+        earlier score by at least plateau_min_delta; unscored reviews never
+        count as a plateau.
+        """
+        patience = self.state.plateau_patience
+        scores = [
+            feedback.aggregate_score
+            for feedback in self.state.feedback_history
+            if feedback.source == "reviewer"
+        ]
+        if patience is None or len(scores) <= patience or None in scores:
+            return False
+        improvement = max(scores[-patience:]) - max(scores[:-patience])
+        return improvement < self.state.plateau_min_delta
+
+    def _lint_draft(self, draft: str) -> str:
+        """
+        Lint a draft and remember violations the writer has to fix.
 
-    @listen("decision_to_finalize")
-    def complete_flow(self):
-        """Complete the writing phase."""
-        print(f"\n{'=' * 80}")
-        print("COVER LETTER WRITING COMPLETE")
-        print(f"{'=' * 80}\n")
-        print(f"Final Status: {self.state.status}")
-        print(f"Total Iterations: {self.state.iteration_count}")
-        print(f"Total Feedback Entries: {len(self.state.feedback_history)}\n")
+        Args:
+            draft: Cleaned writer output
 
-    @router(complete_flow)
-    def route_translation(
-        self,
-    ) -> Literal["decision_to_translate", "decision_to_end"]:
+        Returns:
+            Draft with auto-fixable violations fixed
         """
-        Route based on translation requirement.
+        report = self.linter.lint(draft)
+        self.state.lint_violations = report.counts
+        self.state.lint_feedback = report.feedback() if report.blocking else None
+
+        if report.issues:
+            print(
+                "Lint violations: "
+                + ", ".join(
+                    f"{issue.rule} {issue.count}" + (" (fixed)" if issue.fixed else "")
+                    for issue in report.issues
+                )
+            )
+        return report.draft
 
-        Returns:
-            Next method to execute or None to end flow
+    def _lint_rejected(self) -> bool:
         """
-        if self.state.translate_to:
-            print(f"\nTranslation requested to {self.state.translate_to.upper()}...")
-            return "decision_to_translate"
-        else:
-            print("\nNo translation requested. Flow complete.")
-            return "decision_to_end"
+        Check whether the draft goes back to the writer because of lint violations.
 
-    @listen("decision_to_translate")
-    def translate_cover_letter(self):
-        """Translate the final cover letter to the target language."""
-        print(f"\n{'=' * 80}")
-        print(f"TRANSLATION PHASE - Translating to {self.state.translate_to.upper()}")
-        print(f"{'=' * 80}\n")
+        A draft is returned at most once in a row, so violations the writer
+        can't fix don't use up all iterations without a review, and the
+        draft of the last iteration is always reviewed.
+        """
+        if self.state.lint_feedback is None:
+            return False
+        if self.state.iteration_count >= self.state.max_iterations:
+            return False
+        history = self.state.feedback_history
+        return not history or history[-1].source != "lint"
+
+    def _store_lint_feedback(self) -> None:
+        """Send unfixed lint violations back to the writer without a review."""
+        print(
+            "⚠️  Draft failed automated checks; returning it to the writer unreviewed."
+        )
 
-        # Run translator crew with appropriate LLM
-        result = (
-            TranslatorCrew(self.translation_llm)
-            .crew()
-            .kickoff(
-                inputs={
-                    "cover_letter_content": self.state.current_draft,
-                    "target_language": self.state.translate_to,
-                }
+        self.state.feedback_history.append(
+            ReviewFeedback(
+                iteration=self.state.iteration_count,
+                source="lint",
+                decision="NEEDS_IMPROVEMENT",
+                comments=self.state.lint_feedback,
+                change_ratio=self.state.draft_change_ratio,
+                lint_violations=self.state.lint_violations,
+                timestamp=datetime.now(),
             )
         )
+        self.state.final_decision = "NEEDS_IMPROVEMENT"
+
+    def _draft_converged(self) -> bool:
+        """
+        Check whether the last revision changed less than convergence_threshold.
+
+        Only revisions answering a review count; revisions answering lint
+        feedback are expected to be small, so they are always reviewed.
+        """
+        threshold = self.state.convergence_threshold
+        ratio = self.state.draft_change_ratio
+        if threshold is None or ratio is None or not self.state.feedback_history:
+            return False
+        last_source = self.state.feedback_history[-1].source
+        return last_source == "reviewer" and ratio < threshold
+
+    def _store_skipped_review(self) -> None:
+        """Record a converged revision in the feedback history without reviewing it."""
+        ratio = self.state.draft_change_ratio
+        decision = self.state.final_decision or "NEEDS_IMPROVEMENT"
+        print(
+            f"⏭️  Review skipped: the revision changed only {ratio:.1%} of the draft "
+            f"(threshold {self.state.convergence_threshold:.1%})."
+        )
 
-        translated_draft = result.raw if hasattr(result, "raw") else str(result)
+        self.state.feedback_history.append(
+            ReviewFeedback(
+                iteration=self.state.iteration_count,
+                source="convergence",
+                decision=decision,
+                comments=(
+                    f"Review skipped: the revision changed only {ratio:.1%} of the "
+                    "previous draft, so the drafts have converged."
+                ),
+                change_ratio=ratio,
+                lint_violations=self.state.lint_violations,
+                timestamp=datetime.now(),
+            )
+        )
+        self.state.final_decision = decision
 
-        # Clean up the translated draft
-        translated_draft = self._clean_markdown_wrapper(translated_draft)
+    def _store_translation(self, language: str, translated_draft: str) -> None:
+        """
+        Store the cover letter translated into a language.
 
+        Args:
+            language: Target language code
+            translated_draft: Cleaned translation
+        """
         # Update state
-        self.state.translated_cover_letter = translated_draft
+        self.state.translations[language] = translated_draft
+        if language == self.state.target_languages[0]:
+            self.state.translated_cover_letter = translated_draft
 
         print(f"\nTranslated cover letter length: {len(translated_draft)} characters")
-        print(f"Translation to {self.state.translate_to.upper()} complete\n")
+        print(f"Translation to {language.upper()} complete\n")
 
-    @listen(or_(translate_cover_letter, "decision_to_end"))
-    def finalize_flow(self):
-        """Final cleanup and flow termination."""
-        print(f"\n{'=' * 80}")
-        print("FLOW FINALIZED")
-        print(f"{'=' * 80}\n")
+    def _select_context(self) -> None:
+        """
+        Rank CV and supporting document chunks against the job description.
+
+        Only documents exceeding their token budget are reduced, to the
+        most relevant chunks that fit the budget.
+        """
+        docs_budget = self.state.supporting_docs_token_budget
+        docs = self._supporting_doc_texts()
+        if docs_budget is not None and docs and not fits_budget(docs, docs_budget):
+            chunks = select_chunks(
+                docs, self.state.job_description, docs_budget, self.state.chunk_tokens
+            )
+            self.state.selected_supporting_docs = self._format_chunks(chunks)
+            print(
+                f"Supporting Documents: selected {len(chunks)} relevant chunk(s), "
+                f"~{estimate_tokens(self.state.selected_supporting_docs)} of "
+                f"~{sum(estimate_tokens(doc) for doc in docs)} tokens"
+            )
+
+        cv_budget = self.state.cv_token_budget
+        cv = self.state.cv_digest or self.state.cv_content
+        if cv_budget is not None and cv and not fits_budget([cv], cv_budget):
+            chunks = select_chunks(
+                [cv], self.state.job_description, cv_budget, self.state.chunk_tokens
+            )
+            self.state.selected_cv = "\n\n".join(chunk.text for chunk in chunks)
+            print(
+                f"CV: selected {len(chunks)} relevant chunk(s), "
+                f"~{estimate_tokens(self.state.selected_cv)} of "
+                f"~{estimate_tokens(cv)} tokens"
+            )
+
+    @staticmethod
+    def _format_chunks(chunks: list[Chunk]) -> str:
+        """Group selected chunks by document, marking omitted text with [...]."""
+        sections: dict[int, str] = {}
+        previous: Chunk | None = None
+        for chunk in chunks:
+            if chunk.source not in sections:
+                sections[chunk.source] = chunk.text
+            elif chunk.position == previous.position + 1:
+                sections[chunk.source] += f"\n\n{chunk.text}"
+            else:
+                sections[chunk.source] += f"\n\n[...]\n\n{chunk.text}"
+            previous = chunk
+        return "\n\n".join(
+            f"Document {source + 1} (excerpts):\n{text}"
+            for source, text in sections.items()
+        )
+
+    def _cv_content(self) -> str:
+        """Return the selected CV excerpts, else the CV digest or the full CV."""
+        if self.state.selected_cv is not None:
+            return self.state.selected_cv
+        return self.state.cv_digest or self.state.cv_content
+
+    def _supporting_doc_texts(self) -> list[str]:
+        """Return the supporting documents, replacing condensed ones by their digest."""
+        digests = self.state.supporting_doc_digests
+        return [
+            (digests[index] if index < len(digests) else None) or doc
+            for index, doc in enumerate(self.state.supporting_docs)
+        ]
 
     def _format_supporting_docs(self) -> str:
         """
         Format supporting documents for display.
 
         Returns:
-            Formatted supporting documents text
+            Formatted supporting documents text (relevant excerpts if selected)
         """
+        if self.state.selected_supporting_docs is not None:
+            return self.state.selected_supporting_docs
         if self.state.supporting_docs:
             return "\n\n".join(
                 f"Document {i + 1}:\n{doc}"
-                for i, doc in enumerate(self.state.supporting_docs)
+                for i, doc in enumerate(self._supporting_doc_texts())
             )
         return "No additional documents provided."
 
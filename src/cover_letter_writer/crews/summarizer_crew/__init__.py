@@ -0,0 +1,5 @@
+"""Summarizer crew for condensing long candidate documents."""
+
+from cover_letter_writer.crews.summarizer_crew.summarizer_crew import SummarizerCrew
+
+__all__ = ["SummarizerCrew"]
@@ -0,0 +1,50 @@
+"""Summarizer crew for condensing long candidate documents."""
+
+from typing import Any
+
+from crewai import Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, crew, task
+
+from cover_letter_writer.utils.crew_pool import cached_configs
+
+
+@cached_configs
+@CrewBase
+class SummarizerCrew:
+    """Crew for condensing long CVs and supporting documents into digests."""
+
+    agents_config = "config/agents.yaml"
+    tasks_config = "config/tasks.yaml"
+
+    def __init__(self, llm: Any):
+        """
+        Initialize Summarizer crew.
+
+        Args:
+            llm: Language model instance
+        """
+        self.llm = llm
+
+    @agent
+    def document_summarizer(self) -> Agent:
+        return Agent(
+            config=self.agents_config["document_summarizer"],
+            llm=self.llm,
+        )
+
+    @task
+    def summarize_document(self) -> Task:
+        return Task(
+            config=self.tasks_config["summarize_document"],
+            agent=self.document_summarizer(),
+        )
+
+    @crew
+    def crew(self) -> Crew:
+        """Creates the Summarizer Crew"""
+        return Crew(
+            agents=self.agents,  # Automatically created by the @agent decorator
+            tasks=self.tasks,  # Automatically created by the @task decorator
+            process=Process.sequential,
+            verbose=False,
+        )
@@ -5,7 +5,10 @@ from typing import Any
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+from cover_letter_writer.utils.crew_pool import cached_configs
 
+
+@cached_configs
 @CrewBase
 class TranslatorCrew:
     """Crew for translating cover letters to different languages."""
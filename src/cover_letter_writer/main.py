@@ -5,14 +5,38 @@ Cover Letter Writer - Main Entry Point
 This module provides CLI interface for generating cover letters using CrewAI.
 """
 
+import asyncio
+import sqlite3
 import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
 from cover_letter_writer.config import Config
-from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+from cover_letter_writer.models.usage_models import CrewCallUsage
+from cover_letter_writer.tools.document_cache import DocumentCache
 from cover_letter_writer.tools.document_parser import DocumentParser
-from cover_letter_writer.utils import FileHandler, LLMFactory
+from cover_letter_writer.tools.draft_linter import DraftLinter
+from cover_letter_writer.tools.http_cache import HTTPCache
+from cover_letter_writer.tools.pdf_reader import PDFReaderTool
+from cover_letter_writer.tools.web_scraper import WebScraperTool
+from cover_letter_writer.utils import FileHandler
+from cover_letter_writer.utils.checkpoints import FlowCheckpointStore
+from cover_letter_writer.utils.crew_pool import default_crew_pool
+from cover_letter_writer.utils.digest_cache import DigestCache
+from cover_letter_writer.utils.llm_factory import SUPPORTED_PROVIDERS
+from cover_letter_writer.utils.metrics import MetricsRecorder, serve_prometheus, timed
+from cover_letter_writer.utils.streaming import print_tokens
+from cover_letter_writer.utils.token_accounting import summarize_usage
+from cover_letter_writer.utils.translation_memory import TranslationMemory
+
+# The flow and the LLM modules load CrewAI and the provider SDKs, which take
+# seconds to import. They are imported where a run needs them, so --help and
+# option errors come back immediately.
+if TYPE_CHECKING:
+    from cover_letter_writer.cover_letter_flow import CoverLetterFlow
 
 
 @click.command(
@@ -22,14 +46,13 @@ from cover_letter_writer.utils import FileHandler, LLMFactory
 @click.option(
     "--job-description",
     "-j",
-    required=True,
-    help="Path to job description file or URL to job posting",
+    help="Path to job description file or URL to job posting "
+    "(required unless resuming)",
 )
 @click.option(
     "--cv",
     "-c",
-    required=True,
-    help="Path to your CV/resume file (PDF or Markdown)",
+    help="Path to your CV/resume file, PDF or Markdown (required unless resuming)",
 )
 @click.option(
     "--additional-docs",
@@ -38,11 +61,17 @@ from cover_letter_writer.utils import FileHandler, LLMFactory
     default=[],
     help="Additional supporting documents (can be specified multiple times)",
 )
+@click.option(
+    "--resume",
+    metavar="RUN_ID",
+    help="Continue an interrupted run at its first unfinished step (inputs and "
+    "settings come from the run's checkpoint)",
+)
 @click.option(
     "--llm-provider",
     "-p",
-    type=click.Choice(["openai", "anthropic", "ollama"], case_sensitive=False),
-    help="LLM provider (openai, anthropic, ollama)",
+    type=click.Choice(SUPPORTED_PROVIDERS, case_sensitive=False),
+    help="LLM provider (openai, anthropic, ollama; fake and replay run offline)",
 )
 @click.option(
     "--llm-model",
@@ -55,6 +84,12 @@ from cover_letter_writer.utils import FileHandler, LLMFactory
     type=int,
     help="Maximum number of iterations",
 )
+@click.option(
+    "--drafts",
+    type=click.IntRange(min=1),
+    help="Write N first drafts concurrently and keep the best reviewed one "
+    "(config: writer.draft_candidates)",
+)
 @click.option(
     "--config",
     type=click.Path(exists=True),
@@ -68,7 +103,7 @@ from cover_letter_writer.utils import FileHandler, LLMFactory
 @click.option(
     "--translate-to",
     "-t",
-    help="Target language code for translation (e.g., 'de', 'fr')",
+    help="Target language code(s) for translation, comma-separated (e.g., 'de' or 'de,fr,nl')",
 )
 @click.option(
     "--translation-llm-provider",
@@ -78,132 +113,148 @@ from cover_letter_writer.utils import FileHandler, LLMFactory
     "--translation-llm-model",
     help="LLM model for translation (if different from main)",
 )
+@click.option(
+    "--llm-cache",
+    type=click.Choice(["bypass", "read_only", "read_write"], case_sensitive=False),
+    help="LLM response cache mode (default: bypass, config: cache.llm.mode)",
+)
+@click.option(
+    "--record-cassette",
+    type=click.Path(dir_okay=False),
+    help="Append every LLM call to a cassette for offline replay "
+    "(config: llm.record_cassette)",
+)
+@click.option(
+    "--replay-cassette",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Answer LLM calls from a recorded cassette instead of a live model "
+    "(sets the provider to replay)",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Print LLM tokens as they arrive (config: llm.streaming)",
+)
+@click.option(
+    "--summarize",
+    is_flag=True,
+    help="Condense long CV/supporting documents into digests once (config: summarization.enabled)",
+)
 @click.option(
     "--debug",
     is_flag=True,
     help="Enable debug mode with full stack traces",
 )
 def main(
-    job_description: str,
-    cv: str,
+    job_description: str | None,
+    cv: str | None,
     additional_docs: tuple[str, ...],
+    resume: str | None,
     llm_provider: str | None,
     llm_model: str | None,
     max_iterations: int | None,
+    drafts: int | None,
     config: str | None,
     output_dir: str | None,
     translate_to: str | None,
     translation_llm_provider: str | None,
     translation_llm_model: str | None,
+    llm_cache: str | None,
+    record_cassette: str | None,
+    replay_cassette: str | None,
+    stream: bool,
+    summarize: bool,
     debug: bool,
 ) -> int:
     """Main entry point for the cover letter writer CLI."""
+    if resume is None and not (job_description and cv):
+        raise click.UsageError(
+            "Options '--job-description' and '--cv' are required "
+            "unless '--resume' is given."
+        )
+
+    flow = None
     try:
         # Load configuration
         cfg = Config(config_file=config)
 
         # Override with CLI arguments
-        if llm_provider:
-            cfg.set("llm.provider", llm_provider)
-        if llm_model:
-            cfg.set("llm.model", llm_model)
-        if max_iterations:
-            cfg.set("writer.max_iterations", max_iterations)
-        if output_dir:
-            cfg.set("output.directory", output_dir)
-        if translate_to:
-            cfg.set("translation.target_language", translate_to)
-            cfg.set("translation.enabled", True)
-        if translation_llm_provider:
-            cfg.set("translation.llm_provider", translation_llm_provider)
-        if translation_llm_model:
-            cfg.set("translation.llm_model", translation_llm_model)
+        _apply_cli_overrides(
+            cfg,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            max_iterations=max_iterations,
+            output_dir=output_dir,
+            drafts=drafts,
+            translate_to=translate_to,
+            translation_llm_provider=translation_llm_provider,
+            translation_llm_model=translation_llm_model,
+            llm_cache=llm_cache,
+            record_cassette=record_cassette,
+            replay_cassette=replay_cassette,
+            summarize=summarize,
+            stream=stream,
+        )
 
         # Display configuration
-        print("\n" + "=" * 80)
-        print("COVER LETTER WRITER - Configuration")
-        print("=" * 80)
-        print(f"LLM Provider: {cfg.llm_provider}")
-        print(f"LLM Model: {cfg.llm_model}")
-        print(f"Max Iterations: {cfg.max_iterations}")
-        print(f"Output Directory: {cfg.output_directory}")
-        if cfg.translation_target_language:
-            print(f"Translation: {cfg.translation_target_language.upper()}")
-            if cfg.translation_llm_provider:
-                print(
-                    f"Translation LLM: {cfg.translation_llm_provider}/{cfg.translation_llm_model or 'default'}"
-                )
-        print("=" * 80 + "\n")
+        _print_configuration(cfg)
 
-        # Parse job description
-        print("Loading job description...")
-        try:
-            job_desc_text = DocumentParser.parse_source(job_description)
-            print(f"✅ Job description loaded ({len(job_desc_text)} characters)\n")
-        except Exception as e:
+        checkpoints = _open_checkpoint_store(cfg)
+        if resume is not None and checkpoints is None:
             raise click.ClickException(
-                f"Failed to load job description: {str(e)}"
-            ) from e
+                "Cannot resume: checkpoints are disabled (checkpoints.enabled)"
+            )
 
-        # Parse CV
-        print("Loading CV...")
-        try:
-            cv_text = DocumentParser.parse_file(cv)
-            print(f"✅ CV loaded ({len(cv_text)} characters)\n")
-        except Exception as e:
-            raise click.ClickException(f"Failed to load CV: {str(e)}") from e
+        metrics = MetricsRecorder() if cfg.metrics_enabled else None
 
-        # Parse additional documents
-        supporting_docs_content = []
-        if additional_docs:
-            print(f"Loading {len(additional_docs)} additional document(s)...")
-            try:
-                for doc_path in additional_docs:
-                    doc_content = DocumentParser.parse_file(doc_path)
-                    supporting_docs_content.append(doc_content)
-                print("✅ All documents loaded\n")
-            except Exception as e:
-                raise click.ClickException(
-                    f"Failed to load additional documents: {str(e)}"
-                ) from e
-
-        # Create LLM instance
-        print("Initializing LLM...")
-        try:
-            llm = LLMFactory.create_llm(
-                provider=cfg.llm_provider,
-                model=cfg.llm_model,
-                temperature=cfg.llm_temperature,
+        if resume is None:
+            job_desc_text, cv_text, supporting_docs_content = _load_flow_inputs(
+                cfg, job_description, cv, additional_docs, metrics=metrics
             )
-            print("✅ LLM initialized\n")
-        except Exception as e:
-            raise click.ClickException(f"Failed to initialize LLM: {str(e)}") from e
 
-        # Create translation LLM if needed
-        translation_llm = None
-        if cfg.translation_target_language and cfg.translation_llm_provider:
-            print("Initializing translation LLM...")
-            try:
-                translation_llm = LLMFactory.create_llm(
-                    provider=cfg.translation_llm_provider,
-                    model=cfg.translation_llm_model or cfg.llm_model,
-                    temperature=cfg.llm_temperature,
-                )
-                print("✅ Translation LLM initialized\n")
-            except Exception as e:
-                print(f"⚠️  Failed to initialize translation LLM: {str(e)}")
-                print("   Using main LLM for translation instead\n")
-                translation_llm = None
+        # Create LLM instances
+        llm, translation_llm = _create_llms(cfg)
 
         # Run generation flow
-        flow = CoverLetterFlow(llm, translation_llm=translation_llm)
+        from cover_letter_writer.cover_letter_flow import CoverLetterFlow
 
-        # Initialize state with inputs
-        flow.state.job_description = job_desc_text
-        flow.state.cv_content = cv_text
-        flow.state.supporting_docs = supporting_docs_content
-        flow.state.max_iterations = cfg.max_iterations
-        flow.state.translate_to = cfg.translation_target_language
+        flow = CoverLetterFlow(
+            llm,
+            translation_llm=translation_llm,
+            digest_cache=_open_digest_cache(cfg),
+            on_token=print_tokens() if cfg.llm_streaming else None,
+            linter=_create_linter(cfg),
+            translation_memory=_open_translation_memory(cfg),
+            checkpoints=checkpoints,
+            metrics=metrics,
+        )
+
+        if resume is not None:
+            # Inputs, settings and completed steps come from the checkpoint
+            try:
+                flow.restore(resume)
+            except (FileNotFoundError, ValueError) as e:
+                raise click.ClickException(f"Failed to resume run: {e}") from e
+        else:
+            # Initialize state with inputs
+            flow.state.job_description = job_desc_text
+            flow.state.cv_content = cv_text
+            flow.state.supporting_docs = supporting_docs_content
+            flow.state.max_iterations = cfg.max_iterations
+            flow.state.plateau_patience = cfg.plateau_patience
+            flow.state.plateau_min_delta = cfg.plateau_min_delta
+            flow.state.convergence_threshold = cfg.convergence_threshold
+            flow.state.draft_candidates = cfg.draft_candidates
+            if cfg.summarization_enabled:
+                flow.state.summarize_min_tokens = cfg.summarization_min_tokens
+            flow.state.summary_target_tokens = cfg.summarization_target_tokens
+            flow.state.supporting_docs_token_budget = cfg.supporting_docs_token_budget
+            flow.state.cv_token_budget = cfg.cv_token_budget
+            flow.state.chunk_tokens = cfg.retrieval_chunk_tokens
+            flow.state.translate_to = cfg.translation_target_language
+
+        if checkpoints is not None:
+            print(f"Run ID: {flow.state.id}\n")
 
         # Run the flow
         flow.kickoff()
@@ -213,40 +264,29 @@ def main(
         print("SAVING OUTPUTS")
         print("=" * 80 + "\n")
 
-        # Save final cover letter
-        cover_letter_path = FileHandler.save_cover_letter(
-            cover_letter_content=flow.state.current_draft,
-            output_dir=cfg.output_directory,
-            filename_pattern=cfg.cover_letter_filename_pattern,
-        )
-        print(f"✅ Final cover letter saved: {cover_letter_path}")
-
-        # Save translated cover letter if available
-        if flow.state.translated_cover_letter:
-            # Use the same base filename as the English cover letter (without extension)
-            base_filename = (
-                cover_letter_path.stem
-            )  # e.g., "cover_letter_optimized_20251113_123456"
-            translated_cover_letter_path = FileHandler.save_translated_cover_letter(
-                cover_letter_content=flow.state.translated_cover_letter,
+        with timed(metrics, "output_write_seconds"):
+            saved = FileHandler.save_flow_outputs(
+                state=flow.state,
                 output_dir=cfg.output_directory,
-                language_code=cfg.translation_target_language,
-                base_filename=base_filename,
+                cover_letter_filename_pattern=cfg.cover_letter_filename_pattern,
+                feedback_filename_pattern=cfg.feedback_filename_pattern,
+                usage_filename_pattern=cfg.usage_filename_pattern,
             )
+        print(f"✅ Final cover letter saved: {saved['cover_letter']}")
+        for language in flow.state.translations:
             print(
-                f"✅ Translated cover letter ({cfg.translation_target_language.upper()}) saved: {translated_cover_letter_path}"
+                f"✅ Translated cover letter ({language.upper()}) "
+                f"saved: {saved[f'translation_{language}']}"
             )
+        print(f"✅ Feedback history saved: {saved['feedback']}")
+        if "usage" in saved:
+            print(f"✅ Token usage saved: {saved['usage']}")
+        if metrics is not None:
+            print(f"✅ Metrics saved: {_save_metrics(cfg, metrics)}")
 
-        # Save feedback history
-        feedback_content = FileHandler.format_feedback_history(
-            flow.state.feedback_history
-        )
-        feedback_path = FileHandler.save_feedback_history(
-            feedback_content=feedback_content,
-            output_dir=cfg.output_directory,
-            filename_pattern=cfg.feedback_filename_pattern,
-        )
-        print(f"✅ Feedback history saved: {feedback_path}")
+        # The outputs are saved, so the run no longer needs to be resumable
+        if checkpoints is not None:
+            checkpoints.delete(flow.state.id)
 
         # Display summary
         print("\n" + "=" * 80)
@@ -255,11 +295,48 @@ def main(
         print(f"Status: {flow.state.status}")
         print(f"Iterations Completed: {flow.state.iteration_count}")
         print(f"Final Decision: {flow.state.final_decision or 'N/A'}")
+        if flow.state.candidate_scores:
+            scores = ", ".join(
+                f"{score:.2f}" if score is not None else "n/a"
+                for score in flow.state.candidate_scores
+            )
+            print(f"First Draft Candidates: {scores}")
+        scores = [
+            feedback.aggregate_score
+            for feedback in flow.state.feedback_history
+            if feedback.aggregate_score is not None
+        ]
+        if scores:
+            print(f"Review Scores: {' -> '.join(f'{score:.2f}' for score in scores)}")
+        changes = [
+            feedback.change_ratio
+            for feedback in flow.state.feedback_history
+            if feedback.change_ratio is not None
+        ]
+        if changes:
+            print(f"Draft Changes: {' -> '.join(f'{ratio:.1%}' for ratio in changes)}")
+        if any(feedback.lint_violations for feedback in flow.state.feedback_history):
+            violations = [
+                sum(feedback.lint_violations.values())
+                for feedback in flow.state.feedback_history
+            ]
+            print(f"Lint Violations: {' -> '.join(map(str, violations))}")
         print(f"Output Directory: {cfg.output_directory}")
+        _print_llm_cache_stats(llm)
+        _print_crew_pool_stats()
+        _print_translation_memory_stats(flow.translation_memory)
+        _print_token_usage(flow.state.usage)
+        _print_step_times(metrics)
         print("=" * 80 + "\n")
 
         if flow.state.status == "APPROVED":
             print("✅ Cover letter was approved by the reviewer!")
+        elif flow.state.status == "CONVERGED":
+            print("⚠️  Stopped early: the last revision barely changed the draft.")
+        elif flow.state.status == "SCORE_PLATEAU":
+            print(
+                "⚠️  Stopped early: review scores stopped improving between revisions."
+            )
         elif flow.state.status == "MAX_ITERATIONS_REACHED":
             print(
                 "⚠️  Maximum iterations reached. Consider running again with more iterations."
@@ -273,16 +350,798 @@ def main(
         raise
     except KeyboardInterrupt:
         print("\n\n⚠️  Process interrupted by user.")
+        _print_resume_hint(flow)
         return 130
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}", file=sys.stderr)
+        print(f"\n❌ Error: {e}", file=sys.stderr)
         if debug:
             import traceback
 
             traceback.print_exc()
+        _print_resume_hint(flow)
         return 1
 
 
+@click.command(
+    context_settings={"max_content_width": 200},
+    help="Generate cover letters for many job descriptions concurrently",
+)
+@click.option(
+    "--manifest",
+    "-f",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="CSV or JSONL manifest with a 'job_description' column/key per job "
+    "(optional: 'id', 'translate_to')",
+)
+@click.option(
+    "--cv",
+    "-c",
+    required=True,
+    help="Path to your CV/resume file (PDF or Markdown)",
+)
+@click.option(
+    "--additional-docs",
+    "-a",
+    multiple=True,
+    default=[],
+    help="Additional supporting documents (can be specified multiple times)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="Number of cover letters generated concurrently",
+)
+@click.option(
+    "--async-flows",
+    is_flag=True,
+    help="Run flows as asyncio tasks on one event loop instead of threads",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue the jobs of an earlier batch from their checkpoints in "
+    "<output-dir>/checkpoints (finished jobs are replayed without LLM calls)",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(min=1, max=65535),
+    help="Serve Prometheus metrics at http://127.0.0.1:PORT/metrics while the "
+    "batch runs (config: metrics.prometheus_port)",
+)
+@click.option(
+    "--llm-provider",
+    "-p",
+    type=click.Choice(SUPPORTED_PROVIDERS, case_sensitive=False),
+    help="LLM provider (openai, anthropic, ollama; fake and replay run offline)",
+)
+@click.option(
+    "--llm-model",
+    "-m",
+    help="Specific LLM model name",
+)
+@click.option(
+    "--max-iterations",
+    "-i",
+    type=int,
+    help="Maximum number of iterations",
+)
+@click.option(
+    "--drafts",
+    type=click.IntRange(min=1),
+    help="Write N first drafts concurrently and keep the best reviewed one "
+    "(config: writer.draft_candidates)",
+)
+@click.option(
+    "--config",
+    type=click.Path(exists=True),
+    help="Path to config file",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    help="Output directory for results (one sub-directory per job)",
+)
+@click.option(
+    "--translate-to",
+    "-t",
+    help="Default target language code(s) for translation, comma-separated (e.g., 'de' or 'de,fr,nl')",
+)
+@click.option(
+    "--translation-llm-provider",
+    help="LLM provider for translation (if different from main)",
+)
+@click.option(
+    "--translation-llm-model",
+    help="LLM model for translation (if different from main)",
+)
+@click.option(
+    "--llm-cache",
+    type=click.Choice(["bypass", "read_only", "read_write"], case_sensitive=False),
+    help="LLM response cache mode (default: bypass, config: cache.llm.mode)",
+)
+@click.option(
+    "--record-cassette",
+    type=click.Path(dir_okay=False),
+    help="Append every LLM call to a cassette for offline replay "
+    "(config: llm.record_cassette)",
+)
+@click.option(
+    "--replay-cassette",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Answer LLM calls from a recorded cassette instead of a live model "
+    "(sets the provider to replay)",
+)
+@click.option(
+    "--summarize",
+    is_flag=True,
+    help="Condense long CV/supporting documents into digests once (config: summarization.enabled)",
+)
+@click.option(
+    "--debug",
+    is_flag=True,
+    help="Enable debug mode with full stack traces",
+)
+def batch(
+    manifest: str,
+    cv: str,
+    additional_docs: tuple[str, ...],
+    workers: int | None,
+    async_flows: bool,
+    resume: bool,
+    metrics_port: int | None,
+    llm_provider: str | None,
+    llm_model: str | None,
+    max_iterations: int | None,
+    drafts: int | None,
+    config: str | None,
+    output_dir: str | None,
+    translate_to: str | None,
+    translation_llm_provider: str | None,
+    translation_llm_model: str | None,
+    llm_cache: str | None,
+    record_cassette: str | None,
+    replay_cassette: str | None,
+    summarize: bool,
+    debug: bool,
+) -> int:
+    """Batch entry point: one candidate, many job descriptions."""
+    from cover_letter_writer.batch import BatchRunner, load_manifest
+
+    try:
+        cfg = Config(config_file=config)
+
+        _apply_cli_overrides(
+            cfg,
+            llm_provider=llm_provider,
+            llm_model=llm_model,
+            max_iterations=max_iterations,
+            output_dir=output_dir,
+            drafts=drafts,
+            translate_to=translate_to,
+            translation_llm_provider=translation_llm_provider,
+            translation_llm_model=translation_llm_model,
+            llm_cache=llm_cache,
+            record_cassette=record_cassette,
+            replay_cassette=replay_cassette,
+            summarize=summarize,
+        )
+        if workers:
+            cfg.set("batch.max_workers", workers)
+        if async_flows:
+            cfg.set("batch.use_async", True)
+        if metrics_port:
+            cfg.set("metrics.prometheus_port", metrics_port)
+
+        _print_configuration(cfg)
+
+        if resume and not cfg.checkpoints_enabled:
+            raise click.ClickException(
+                "Cannot resume: checkpoints are disabled (checkpoints.enabled)"
+            )
+
+        # Load manifest
+        try:
+            jobs = load_manifest(manifest)
+        except Exception as e:
+            raise click.ClickException(f"Failed to load manifest: {e}") from e
+        print(f"✅ Manifest loaded ({len(jobs)} job(s))\n")
+
+        metrics = MetricsRecorder() if cfg.metrics_enabled else None
+        if metrics is not None and cfg.metrics_prometheus_port:
+            serve_prometheus(metrics, cfg.metrics_prometheus_port)
+            print(
+                "Serving metrics at "
+                f"http://127.0.0.1:{cfg.metrics_prometheus_port}/metrics\n"
+            )
+
+        # Shared documents are parsed once for all jobs
+        document_cache = _open_document_cache(cfg)
+        cv_text, supporting_docs_content = _load_candidate_documents(
+            cv,
+            additional_docs,
+            cache=document_cache,
+            pdf_reader=_create_pdf_reader(cfg),
+            max_pages=cfg.supporting_docs_max_pages,
+            max_chars=cfg.supporting_docs_max_chars,
+            metrics=metrics,
+        )
+
+        llm, translation_llm = _create_llms(cfg)
+
+        runner = BatchRunner(
+            config=cfg,
+            llm=llm,
+            cv_content=cv_text,
+            supporting_docs=supporting_docs_content,
+            translation_llm=translation_llm,
+            document_cache=document_cache,
+            scraper=_create_web_scraper(cfg),
+            digest_cache=_open_digest_cache(cfg),
+            linter=_create_linter(cfg),
+            translation_memory=_open_translation_memory(cfg),
+            checkpoints=_open_batch_checkpoint_store(cfg),
+            resume=resume,
+            metrics=metrics,
+        )
+
+        print(f"Running {len(jobs)} job(s) with {runner.max_workers} worker(s)...\n")
+        started = time.perf_counter()
+        if cfg.batch_use_async:
+            results = asyncio.run(runner.run_async(jobs))
+        else:
+            results = runner.run(jobs)
+        wall_seconds = time.perf_counter() - started
+
+        summary_path = runner.save_summary(results, wall_seconds)
+
+        failed = [r for r in results if r.error is not None]
+
+        print("\n" + "=" * 80)
+        print("BATCH SUMMARY")
+        print("=" * 80)
+        print(f"Jobs: {len(results)}")
+        print(f"Succeeded: {len(results) - len(failed)}")
+        print(f"Failed: {len(failed)}")
+        print(f"Wall Time: {wall_seconds:.1f}s")
+        print(f"Summary: {summary_path}")
+        if metrics is not None:
+            print(f"Metrics: {_save_metrics(cfg, metrics)}")
+            _print_job_percentiles(metrics)
+        _print_llm_cache_stats(llm)
+        _print_crew_pool_stats()
+        _print_translation_memory_stats(runner.translation_memory)
+        _print_token_usage([call for r in results for call in r.usage])
+        _print_step_times(metrics)
+        print("=" * 80 + "\n")
+
+        for result in failed:
+            print(f"❌ {result.job_id}: {result.error}")
+
+        return 1 if failed else 0
+
+    except click.ClickException:
+        raise
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Process interrupted by user.")
+        return 130
+    except Exception as e:  # noqa: BLE001
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        if debug:
+            import traceback
+
+            traceback.print_exc()
+        return 1
+
+
+@click.command(
+    context_settings={"max_content_width": 200},
+    help="Extract and cache the text of all PDF documents in a directory",
+)
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--config",
+    type=click.Path(exists=True),
+    help="Path to config file",
+)
+@click.option(
+    "--no-recursive",
+    is_flag=True,
+    help="Only scan the top-level directory",
+)
+def precompute_document_cache(
+    directory: str, config: str | None, no_recursive: bool
+) -> int:
+    """Fill the document cache so later runs skip PDF extraction."""
+    cfg = Config(config_file=config)
+    cache = DocumentCache.open(cfg.cache_directory)
+
+    print(f"Caching documents in {directory}...")
+    # The CV is read without limits, additional documents with the configured ones
+    counts = cache.precompute(
+        directory,
+        recursive=not no_recursive,
+        pdf_reader=_create_pdf_reader(cfg),
+        max_pages=cfg.supporting_docs_max_pages,
+        max_chars=cfg.supporting_docs_max_chars,
+    )
+    print(
+        f"✅ {counts['cached']} newly cached, "
+        f"{counts['already_cached']} already cached, {counts['failed']} failed"
+    )
+    return 1 if counts["failed"] else 0
+
+
+def _apply_cli_overrides(
+    cfg: Config,
+    llm_provider: str | None,
+    llm_model: str | None,
+    max_iterations: int | None,
+    output_dir: str | None,
+    translate_to: str | None,
+    translation_llm_provider: str | None,
+    translation_llm_model: str | None,
+    llm_cache: str | None = None,
+    record_cassette: str | None = None,
+    replay_cassette: str | None = None,
+    summarize: bool = False,
+    stream: bool = False,
+    drafts: int | None = None,
+) -> None:
+    """Override configuration values with CLI arguments."""
+    if llm_provider:
+        cfg.set("llm.provider", llm_provider)
+    if llm_model:
+        cfg.set("llm.model", llm_model)
+    if max_iterations:
+        cfg.set("writer.max_iterations", max_iterations)
+    if output_dir:
+        cfg.set("output.directory", output_dir)
+    if translate_to:
+        cfg.set("translation.target_language", translate_to)
+        cfg.set("translation.enabled", True)
+    if translation_llm_provider:
+        cfg.set("translation.llm_provider", translation_llm_provider)
+    if translation_llm_model:
+        cfg.set("translation.llm_model", translation_llm_model)
+    if llm_cache:
+        cfg.set("cache.llm.mode", llm_cache.lower())
+    if record_cassette:
+        cfg.set("llm.record_cassette", record_cassette)
+    if replay_cassette:
+        cfg.set("llm.provider", "replay")
+        cfg.set("llm.replay.cassette", replay_cassette)
+    if summarize:
+        cfg.set("summarization.enabled", True)
+    if stream:
+        cfg.set("llm.streaming", True)
+    if drafts:
+        cfg.set("writer.draft_candidates", drafts)
+
+
+def _print_configuration(cfg: Config) -> None:
+    """Display the effective configuration."""
+    print("\n" + "=" * 80)
+    print("COVER LETTER WRITER - Configuration")
+    print("=" * 80)
+    print(f"LLM Provider: {cfg.llm_provider}")
+    print(f"LLM Model: {cfg.llm_model}")
+    print(f"Max Iterations: {cfg.max_iterations}")
+    if cfg.draft_candidates > 1:
+        print(f"Parallel First Drafts: {cfg.draft_candidates}")
+    print(f"Output Directory: {cfg.output_directory}")
+    if cfg.llm_cache_mode != "bypass":
+        print(f"LLM Cache: {cfg.llm_cache_mode} ({cfg.cache_directory})")
+    if cfg.llm_provider == "replay":
+        print(f"Replaying Cassette: {cfg.llm_replay_cassette}")
+    if cfg.llm_record_cassette:
+        print(f"Recording Cassette: {cfg.llm_record_cassette}")
+    if cfg.summarization_enabled:
+        print(f"Summarization: documents over {cfg.summarization_min_tokens} tokens")
+    if cfg.translation_target_language:
+        print(f"Translation: {cfg.translation_target_language.upper()}")
+        if cfg.translation_llm_provider:
+            print(
+                f"Translation LLM: {cfg.translation_llm_provider}/{cfg.translation_llm_model or 'default'}"
+            )
+    print("=" * 80 + "\n")
+
+
+def _print_llm_cache_stats(llm: Any) -> None:
+    """Display LLM response cache hits and misses if a cache is in use."""
+    from cover_letter_writer.utils.llm_cache import LLMResponseCache
+
+    cache = getattr(llm, "cache", None)
+    if isinstance(cache, LLMResponseCache):
+        stats = cache.stats()
+        print(f"LLM Cache: {stats['hits']} hit(s), {stats['misses']} miss(es)")
+
+
+def _print_crew_pool_stats() -> None:
+    """Display how often crews were built versus reused."""
+    stats = default_crew_pool.stats()
+    print(
+        f"Crews: {stats['builds']} built ({stats['build_ms']:.0f} ms), "
+        f"{stats['reuses']} reused (~{stats['saved_ms']:.0f} ms saved)"
+    )
+
+
+def _print_translation_memory_stats(memory: TranslationMemory | None) -> None:
+    """Display how many paragraphs were reused from the translation memory."""
+    if memory is None:
+        return
+    stats = memory.stats()
+    if stats["hits"] or stats["misses"]:
+        print(
+            f"Translation Memory: {stats['hits']} paragraph(s) reused, "
+            f"{stats['misses']} translated (hit rate {stats['hit_rate']:.0%})"
+        )
+
+
+def _print_token_usage(usage: list[CrewCallUsage]) -> None:
+    """Display provider token usage and the local per-section prompt breakdown."""
+    if not usage:
+        return
+    summary = summarize_usage(usage)
+    print(
+        f"Tokens: {summary['prompt_tokens']} prompt "
+        f"({summary['cached_prompt_tokens']} cached, "
+        f"{summary['cache_hit_rate']:.0%} cache hit rate), "
+        f"{summary['completion_tokens']} completion in {summary['requests']} request(s)"
+    )
+    total = summary["local_prompt_tokens"] or 1
+    sections = ", ".join(
+        f"{name} {tokens} ({tokens * 100 / total:.0f}%)"
+        for name, tokens in summary["sections"].items()
+    )
+    print(f"Prompt Sections ({usage[0].tokenizer}): {sections}")
+    for name, crew in summary["crews"].items():
+        if crew["avg_time_to_first_token_seconds"] is not None:
+            print(
+                f"Latency ({name}): {crew['avg_time_to_first_token_seconds']:.2f}s "
+                f"avg. time to first token, {crew['duration_seconds']:.1f}s total "
+                f"in {crew['calls']} call(s)"
+            )
+
+
+def _open_document_cache(cfg: Config) -> DocumentCache | None:
+    """Open the extracted-document cache if enabled (failures disable it)."""
+    if not cfg.document_cache_enabled:
+        return None
+    try:
+        return DocumentCache.open(cfg.cache_directory)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  Document cache unavailable: {e}\n")
+        return None
+
+
+def _open_digest_cache(cfg: Config) -> DigestCache | None:
+    """Open the document digest cache if summarization uses it (failures disable it)."""
+    if not cfg.summarization_enabled or not cfg.digest_cache_enabled:
+        return None
+    try:
+        return DigestCache.open(cfg.cache_directory)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  Digest cache unavailable: {e}\n")
+        return None
+
+
+def _open_translation_memory(cfg: Config) -> TranslationMemory | None:
+    """Open the translation memory if enabled (failures disable it)."""
+    if not cfg.translation_memory_enabled:
+        return None
+    try:
+        return TranslationMemory.open(cfg.cache_directory)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  Translation memory unavailable: {e}\n")
+        return None
+
+
+def _save_metrics(cfg: Config, metrics: MetricsRecorder) -> Path:
+    """Save the metrics as JSON and, if configured, as a Prometheus text file."""
+    if cfg.metrics_prometheus_file:
+        metrics.write_prometheus(cfg.metrics_prometheus_file)
+    return FileHandler.save_json(
+        data=metrics.summary(),
+        output_dir=cfg.output_directory,
+        filename_pattern=cfg.metrics_filename_pattern,
+    )
+
+
+def _print_step_times(metrics: MetricsRecorder | None) -> None:
+    """Display the flow steps that took the most time."""
+    if metrics is None:
+        return
+    steps = metrics.summary()["timings"].get("flow_step_seconds", [])
+    slowest = sorted(steps, key=lambda entry: -entry["sum"])[:3]
+    if slowest:
+        times = ", ".join(
+            f"{entry['labels']['step']} {entry['sum']:.1f}s" for entry in slowest
+        )
+        print(f"Slowest Steps: {times}")
+
+
+def _print_job_percentiles(metrics: MetricsRecorder) -> None:
+    """Display the p50/p95/p99 wall time of the successful batch jobs."""
+    jobs = metrics.summary()["timings"].get("batch_job_seconds", [])
+    for entry in jobs:
+        if entry["labels"].get("status") == "succeeded":
+            print(
+                f"Job Time: p50 {entry['p50']:.1f}s, p95 {entry['p95']:.1f}s, "
+                f"p99 {entry['p99']:.1f}s"
+            )
+
+
+def _open_checkpoint_store(cfg: Config) -> FlowCheckpointStore | None:
+    """Open the run checkpoint store if checkpoints are enabled."""
+    if not cfg.checkpoints_enabled:
+        return None
+    return FlowCheckpointStore(cfg.checkpoint_directory)
+
+
+def _open_batch_checkpoint_store(cfg: Config) -> FlowCheckpointStore | None:
+    """Open the checkpoint store of a batch in its output directory if enabled."""
+    if not cfg.checkpoints_enabled:
+        return None
+    return FlowCheckpointStore(str(Path(cfg.output_directory) / "checkpoints"))
+
+
+def _print_resume_hint(flow: "CoverLetterFlow | None") -> None:
+    """Tell how to resume a run that stopped after a checkpoint was saved."""
+    if flow is None or flow.checkpoints is None:
+        return
+    if flow.checkpoints.exists(flow.state.id):
+        print(f"\nResume this run with: cover-letter-writer --resume {flow.state.id}")
+
+
+def _create_linter(cfg: Config) -> DraftLinter | None:
+    """Create the draft linter if linting is enabled."""
+    if not cfg.lint_enabled:
+        return None
+    return DraftLinter(
+        banned_phrases=cfg.lint_banned_phrases,
+        min_words=cfg.lint_min_words,
+        max_words=cfg.lint_max_words,
+        auto_fix=cfg.lint_auto_fix,
+    )
+
+
+def _create_web_scraper(cfg: Config) -> WebScraperTool | None:
+    """
+    Create a web scraper using the shared pooled session and the HTTP cache.
+
+    Returns None if the scraping dependencies are missing, so URL sources
+    fail with the usual installation hint.
+    """
+    cache = None
+    if cfg.http_cache_enabled:
+        try:
+            cache = HTTPCache.open(
+                cfg.cache_directory, max_size_mb=cfg.http_cache_max_size_mb
+            )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  HTTP cache unavailable: {e}\n")
+    try:
+        return WebScraperTool(cache=cache, engine=cfg.html_engine)
+    except ValueError as e:
+        print(f"⚠️  Web scraper unavailable: {e}\n")
+        return None
+
+
+def _create_pdf_reader(cfg: Config) -> PDFReaderTool:
+    """Create a PDF reader configured for (optionally parallel) extraction."""
+    return PDFReaderTool(
+        max_workers=cfg.pdf_workers, parallel_threshold=cfg.pdf_parallel_threshold
+    )
+
+
+def _load_flow_inputs(
+    cfg: Config,
+    job_description: str,
+    cv: str,
+    additional_docs: tuple[str, ...],
+    metrics: MetricsRecorder | None = None,
+) -> tuple[str, str, list[str]]:
+    """
+    Load the job description, CV and supporting documents of a run.
+
+    Loading times are recorded as document_parse_seconds if metrics is given.
+
+    Returns:
+        Tuple of (job description text, CV text, supporting document texts)
+
+    Raises:
+        click.ClickException: If the job description can't be loaded
+    """
+    document_cache = _open_document_cache(cfg)
+    pdf_reader = _create_pdf_reader(cfg)
+
+    # Parse job description
+    print("Loading job description...")
+    try:
+        with timed(
+            metrics,
+            "document_parse_seconds",
+            kind="job_description",
+            source="url" if DocumentParser.is_url(job_description) else "file",
+        ):
+            job_desc_text = DocumentParser.parse_source(
+                job_description,
+                cache=document_cache,
+                pdf_reader=pdf_reader,
+                scraper=_create_web_scraper(cfg),
+            )
+        print(f"✅ Job description loaded ({len(job_desc_text)} characters)\n")
+    except Exception as e:
+        raise click.ClickException(f"Failed to load job description: {e}") from e
+
+    # Parse CV and additional documents
+    cv_text, supporting_docs_content = _load_candidate_documents(
+        cv,
+        additional_docs,
+        cache=document_cache,
+        pdf_reader=pdf_reader,
+        max_pages=cfg.supporting_docs_max_pages,
+        max_chars=cfg.supporting_docs_max_chars,
+        metrics=metrics,
+    )
+    return job_desc_text, cv_text, supporting_docs_content
+
+
+def _load_candidate_documents(
+    cv: str,
+    additional_docs: tuple[str, ...],
+    cache: DocumentCache | None = None,
+    pdf_reader: PDFReaderTool | None = None,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    metrics: MetricsRecorder | None = None,
+) -> tuple[str, list[str]]:
+    """
+    Parse the CV and additional supporting documents.
+
+    The page/character limits only apply to the supporting documents, which
+    are often long attachments of which only the beginning is useful.
+    Parse times are recorded as document_parse_seconds if metrics is given.
+
+    Returns:
+        Tuple of CV text and list of supporting document texts
+
+    Raises:
+        click.ClickException: If a document cannot be loaded
+    """
+    # Parse CV
+    print("Loading CV...")
+    try:
+        with timed(metrics, "document_parse_seconds", kind="cv", source="file"):
+            cv_text = DocumentParser.parse_file(cv, cache=cache, pdf_reader=pdf_reader)
+        print(f"✅ CV loaded ({len(cv_text)} characters)\n")
+    except Exception as e:
+        raise click.ClickException(f"Failed to load CV: {e}") from e
+
+    # Parse additional documents
+    supporting_docs_content = []
+    if additional_docs:
+        print(f"Loading {len(additional_docs)} additional document(s)...")
+        try:
+            for doc_path in additional_docs:
+                with timed(
+                    metrics, "document_parse_seconds", kind="supporting", source="file"
+                ):
+                    doc_content = DocumentParser.parse_file(
+                        doc_path,
+                        cache=cache,
+                        pdf_reader=pdf_reader,
+                        max_pages=max_pages,
+                        max_chars=max_chars,
+                    )
+                supporting_docs_content.append(doc_content)
+            print("✅ All documents loaded\n")
+        except Exception as e:
+            raise click.ClickException(
+                f"Failed to load additional documents: {e}"
+            ) from e
+
+    return cv_text, supporting_docs_content
+
+
+def _create_llms(cfg: Config) -> tuple[Any, Any | None]:
+    """
+    Create the main LLM and, if configured, a separate translation LLM.
+
+    Returns:
+        Tuple of main LLM and translation LLM (None means use main LLM)
+
+    Raises:
+        click.ClickException: If the main LLM cannot be initialized
+    """
+    from cover_letter_writer.utils.cassettes import CassetteRecorder
+    from cover_letter_writer.utils.llm_cache import LLMResponseCache
+    from cover_letter_writer.utils.llm_factory import LLMFactory
+
+    # Open the response cache shared by all LLMs
+    llm_cache = None
+    if cfg.llm_cache_mode != "bypass":
+        try:
+            llm_cache = LLMResponseCache.open(
+                directory=cfg.cache_directory,
+                mode=cfg.llm_cache_mode,
+                max_size_mb=cfg.llm_cache_max_size_mb,
+                ttl_hours=cfg.llm_cache_ttl_hours,
+            )
+        except Exception as e:
+            raise click.ClickException(f"Failed to open LLM cache: {e}") from e
+
+    # Calls of the main and translation LLM go to the same cassette
+    recorder = None
+    if cfg.llm_record_cassette:
+        recorder = CassetteRecorder(cfg.llm_record_cassette)
+
+    # Create LLM instance
+    print("Initializing LLM...")
+    try:
+        llm = LLMFactory.create_llm(
+            provider=cfg.llm_provider,
+            model=cfg.llm_model,
+            temperature=cfg.llm_temperature,
+            cache=llm_cache,
+            prompt_caching=cfg.llm_prompt_caching,
+            streaming=cfg.llm_streaming,
+            recorder=recorder,
+            **_offline_llm_options(cfg, cfg.llm_provider),
+        )
+        print("✅ LLM initialized\n")
+    except Exception as e:
+        raise click.ClickException(f"Failed to initialize LLM: {e}") from e
+
+    # Create translation LLM if needed
+    translation_llm = None
+    if cfg.translation_target_language and cfg.translation_llm_provider:
+        print("Initializing translation LLM...")
+        try:
+            translation_llm = LLMFactory.create_llm(
+                provider=cfg.translation_llm_provider,
+                model=cfg.translation_llm_model or cfg.llm_model,
+                temperature=cfg.llm_temperature,
+                cache=llm_cache,
+                streaming=cfg.llm_streaming,
+                recorder=recorder,
+                **_offline_llm_options(cfg, cfg.translation_llm_provider),
+            )
+            print("✅ Translation LLM initialized\n")
+        except Exception as e:
+            print(f"⚠️  Failed to initialize translation LLM: {e}")
+            print("   Using main LLM for translation instead\n")
+            translation_llm = None
+
+    return llm, translation_llm
+
+
+def _offline_llm_options(cfg: Config, provider: str) -> dict[str, Any]:
+    """
+    Get the LLMFactory arguments of the offline fake and replay providers.
+
+    Args:
+        cfg: Configuration
+        provider: LLM provider name
+
+    Returns:
+        Provider-specific keyword arguments (empty for live providers)
+    """
+    if provider.lower() == "fake":
+        return {
+            "script": cfg.llm_fake_script,
+            "latency_seconds": cfg.llm_fake_latency_seconds,
+        }
+    if provider.lower() == "replay":
+        return {
+            "cassette": cfg.llm_replay_cassette,
+            "latency_seconds": cfg.llm_replay_latency_seconds,
+        }
+    return {}
+
+
 def kickoff():
     """Entry point for 'crewai run' command."""
     sys.exit(main(standalone_mode=False))
@@ -291,6 +1150,7 @@ def kickoff():
 def plot():
     """Generate a plot of the flow structure."""
     print("Generating flow plot...")
+    from cover_letter_writer.cover_letter_flow import CoverLetterFlow
     from cover_letter_writer.utils import LLMFactory
 
     # Create a dummy LLM for plotting
@@ -1,9 +1,20 @@
 """Pydantic models for Cover Letter Writer state management."""
 
+from cover_letter_writer.models.batch_models import BatchJob, BatchJobResult
 from cover_letter_writer.models.state_models import (
     CoverLetterState,
     ReviewFeedback,
+    ReviewResult,
+    ReviewScores,
 )
+from cover_letter_writer.models.usage_models import CrewCallUsage
 
-__all__ = ["CoverLetterState", "ReviewFeedback"]
-
+__all__ = [
+    "BatchJob",
+    "BatchJobResult",
+    "CoverLetterState",
+    "CrewCallUsage",
+    "ReviewFeedback",
+    "ReviewResult",
+    "ReviewScores",
+]
@@ -0,0 +1,40 @@
+"""Pydantic models for batch cover letter generation."""
+
+from pydantic import BaseModel, Field
+
+from cover_letter_writer.models.usage_models import CrewCallUsage
+
+
+class BatchJob(BaseModel):
+    """A single job entry from a batch manifest."""
+
+    job_id: str = Field(..., description="Unique identifier used for the output folder")
+    job_description: str = Field(
+        ..., description="Path to job description file or URL to job posting"
+    )
+    translate_to: str | None = Field(
+        None, description="Optional per-job target language code(s), e.g. 'de;fr'"
+    )
+
+
+class BatchJobResult(BaseModel):
+    """Outcome of one batch job."""
+
+    job_id: str = Field(..., description="Identifier of the job")
+    job_description: str = Field(..., description="Job description source")
+    status: str = Field(..., description="Final flow status or FAILED")
+    iterations: int = Field(0, description="Number of writer iterations completed")
+    final_decision: str | None = Field(None, description="Final reviewer decision")
+    final_score: float | None = Field(
+        None, description="Aggregate score of the last scored review (1-10)"
+    )
+    output_files: dict[str, str] = Field(
+        default_factory=dict, description="Saved output files by kind"
+    )
+    error: str | None = Field(None, description="Error message if the job failed")
+    duration_seconds: float = Field(0.0, description="Wall-clock time of the job")
+    usage: list[CrewCallUsage] = Field(
+        default_factory=list,
+        exclude=True,
+        description="Token usage of the job's crew kickoffs (summarized on save)",
+    )
@@ -1,20 +1,94 @@
 """Pydantic models for Cover Letter Writer state management."""
 
+import re
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from cover_letter_writer.models.usage_models import CrewCallUsage
+
+
+class ReviewScores(BaseModel):
+    """Reviewer scores (1-10) for each review criterion."""
+
+    professional_quality: int = Field(..., ge=1, le=10, description="Writing style")
+    grammar_and_formatting: int = Field(
+        ..., ge=1, le=10, description="Grammar, spelling and formatting"
+    )
+    job_requirements: int = Field(
+        ..., ge=1, le=10, description="How well it addresses the job requirements"
+    )
+    candidate_qualifications: int = Field(
+        ..., ge=1, le=10, description="How well it highlights relevant qualifications"
+    )
+    persuasiveness: int = Field(
+        ..., ge=1, le=10, description="Persuasiveness and impact"
+    )
+    structure_and_flow: int = Field(..., ge=1, le=10, description="Structure and flow")
+    human_voice: int = Field(
+        ..., ge=1, le=10, description="Indistinguishable from human writing"
+    )
+    no_dashes: int = Field(
+        ..., ge=1, le=10, description="Free of em-dashes and en-dashes"
+    )
+    supported_claims: int = Field(
+        ..., ge=1, le=10, description="All expertise supported by the documents"
+    )
+
+    @property
+    def aggregate(self) -> float:
+        """Mean score over all criteria."""
+        scores = list(self.model_dump().values())
+        return round(sum(scores) / len(scores), 2)
+
+
+class ReviewResult(BaseModel):
+    """Structured output of the reviewer crew."""
+
+    decision: Literal["APPROVED", "NEEDS_IMPROVEMENT"] = Field(
+        ..., description="Reviewer decision"
+    )
+    scores: ReviewScores = Field(..., description="Scores per review criterion")
+    strengths: list[str] = Field(
+        default_factory=list, description="Specific strengths of the draft"
+    )
+    improvements: list[str] = Field(
+        default_factory=list, description="Specific, actionable improvements"
+    )
+
 
 class ReviewFeedback(BaseModel):
     """Model for reviewer feedback."""
 
     iteration: int = Field(..., description="Iteration number")
+    source: Literal["reviewer", "lint", "convergence"] = Field(
+        "reviewer",
+        description="Who produced the feedback: the reviewer crew, the local lint "
+        "pass, or the convergence check that skipped the review",
+    )
     decision: str = Field(..., description="APPROVED or NEEDS_IMPROVEMENT")
     comments: str = Field(..., description="Detailed feedback comments")
+    scores: ReviewScores | None = Field(
+        None, description="Scores per criterion (None if the review was unstructured)"
+    )
+    change_ratio: float | None = Field(
+        None,
+        description="Share of the draft changed since the previous iteration "
+        "(None for the first draft)",
+    )
+    lint_violations: dict[str, int] = Field(
+        default_factory=dict, description="Lint violations of the draft per rule"
+    )
     timestamp: datetime = Field(
         default_factory=datetime.now, description="Timestamp of feedback"
     )
 
+    @property
+    def aggregate_score(self) -> float | None:
+        """Mean score over all criteria, if the review was scored."""
+        return self.scores.aggregate if self.scores is not None else None
+
 
 class CoverLetterState(BaseModel):
     """State model for cover letter generation flow."""
@@ -26,31 +100,113 @@ class CoverLetterState(BaseModel):
         default_factory=list, description="Additional supporting documents"
     )
 
+    # Pre-summarization (None keeps documents verbatim)
+    summarize_min_tokens: int | None = Field(
+        None, description="Documents longer than this are condensed into digests"
+    )
+    summary_target_tokens: int = Field(
+        600, description="Target digest length in tokens"
+    )
+    cv_digest: str | None = Field(None, description="Condensed CV used by the prompts")
+    supporting_doc_digests: list[str | None] = Field(
+        default_factory=list,
+        description="Condensed supporting documents (None keeps a document verbatim)",
+    )
+
+    # Context selection (None budgets pass documents in full)
+    supporting_docs_token_budget: int | None = Field(
+        None, description="Token budget for the selected supporting document chunks"
+    )
+    cv_token_budget: int | None = Field(
+        None, description="Token budget for the selected CV chunks"
+    )
+    chunk_tokens: int = Field(150, description="Target chunk size in tokens")
+    selected_supporting_docs: str | None = Field(
+        None, description="Relevant supporting document excerpts for the prompts"
+    )
+    selected_cv: str | None = Field(
+        None, description="Relevant CV excerpts for the prompts"
+    )
+
     # Processing
     current_draft: str = Field(
         "", description="Current version of cover letter being processed"
     )
     iteration_count: int = Field(0, description="Current iteration number")
     max_iterations: int = Field(3, description="Maximum number of iterations")
+    plateau_patience: int | None = Field(
+        None,
+        description="Stop after this many iterations without score improvement "
+        "(None disables early stopping)",
+    )
+    plateau_min_delta: float = Field(
+        0.25, description="Minimum aggregate score gain that counts as improvement"
+    )
+    convergence_threshold: float | None = Field(
+        None,
+        description="Finalize when a revision changes less than this share of the "
+        "draft (None disables the check)",
+    )
+    draft_change_ratio: float | None = Field(
+        None, description="Share of the current draft changed by the last revision"
+    )
+    lint_violations: dict[str, int] = Field(
+        default_factory=dict,
+        description="Lint violations of the current draft per rule (incl. auto-fixed)",
+    )
+    lint_feedback: str | None = Field(
+        None, description="Unfixed lint violations to send back to the writer"
+    )
+
+    draft_candidates: int = Field(
+        1,
+        ge=1,
+        description="First drafts written and reviewed concurrently; the best "
+        "reviewed one is kept",
+    )
+    candidate_scores: list[float | None] = Field(
+        default_factory=list,
+        description="Aggregate review scores of the parallel first drafts",
+    )
 
     # Feedback tracking
     feedback_history: list[ReviewFeedback] = Field(
         default_factory=list, description="History of all reviewer feedback"
     )
 
+    # Token accounting
+    usage: list[CrewCallUsage] = Field(
+        default_factory=list, description="Token usage of every crew kickoff"
+    )
+
     # Status
     status: str = Field("INITIALIZED", description="Current flow status")
+    completed_steps: list[str] = Field(
+        default_factory=list,
+        description="Flow steps completed so far, in order (routers as 'step=route'); "
+        "replayed without work when resuming from a checkpoint",
+    )
     final_decision: str | None = Field(
         None, description="Final decision from reviewer"
     )
 
     # Translation
     translate_to: str | None = Field(
-        None, description="Target language code (e.g., 'de', 'fr')"
+        None,
+        description="Target language code(s), comma-separated (e.g., 'de' or 'de,fr,nl')",
+    )
+    translations: dict[str, str] = Field(
+        default_factory=dict, description="Translated cover letters by language code"
     )
     translated_cover_letter: str | None = Field(
-        None, description="Translated cover letter content"
+        None, description="Translated cover letter content (first target language)"
     )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @property
+    def target_languages(self) -> list[str]:
+        """Target language codes in the order given, without duplicates."""
+        codes = re.split(r"[\s,;]+", (self.translate_to or "").lower())
+        return list(dict.fromkeys(code for code in codes if code))
+
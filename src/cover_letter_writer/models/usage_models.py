@@ -0,0 +1,39 @@
+"""Pydantic models for token accounting."""
+
+from pydantic import BaseModel, Field
+
+
+class CrewCallUsage(BaseModel):
+    """Token usage of one crew kickoff."""
+
+    crew: str = Field(..., description="Crew name (writer, reviewer, translator)")
+    step: str = Field(..., description="Flow step that ran the crew")
+    iteration: int = Field(0, description="Writer/reviewer iteration number")
+    tokenizer: str = Field(..., description="Tokenizer used for local counts")
+    sections: dict[str, int] = Field(
+        default_factory=dict,
+        description="Locally counted prompt tokens per template section",
+    )
+    prompt_tokens: int = Field(0, description="Provider-reported prompt tokens")
+    completion_tokens: int = Field(0, description="Provider-reported completion tokens")
+    cached_prompt_tokens: int = Field(
+        0, description="Provider-reported prompt tokens served from its cache"
+    )
+    requests: int = Field(0, description="Number of LLM requests made")
+    failed_requests: int = Field(
+        0, description="LLM requests that raised an error (retried by the agent)"
+    )
+    duration_seconds: float = Field(0.0, description="Wall-clock time of the kickoff")
+    llm_seconds: float | None = Field(
+        None,
+        description="Time spent waiting for LLM responses (None if not reported "
+        "by the LLM wrapper)",
+    )
+    time_to_first_token_seconds: float | None = Field(
+        None, description="Time until the first streamed token (None if not streamed)"
+    )
+
+    @property
+    def local_prompt_tokens(self) -> int:
+        """Total locally counted prompt tokens."""
+        return sum(self.sections.values())
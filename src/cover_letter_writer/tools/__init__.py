@@ -1,13 +1,17 @@
 """Tools for document processing."""
 
+from cover_letter_writer.tools.document_cache import DocumentCache
 from cover_letter_writer.tools.document_parser import DocumentParser
+from cover_letter_writer.tools.http_cache import HTTPCache
 from cover_letter_writer.tools.pdf_reader import PDFReaderTool, read_pdf
 from cover_letter_writer.tools.web_scraper import WebScraperTool, scrape_web_page
 
 __all__ = [
+    "DocumentCache",
     "DocumentParser",
+    "HTTPCache",
     "PDFReaderTool",
-    "read_pdf",
     "WebScraperTool",
+    "read_pdf",
     "scrape_web_page",
 ]
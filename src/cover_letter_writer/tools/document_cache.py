@@ -0,0 +1,125 @@
+"""Persistent cache of extracted document text keyed by file fingerprint."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from cover_letter_writer.utils.cache_store import SQLiteCache
+
+# Bump when text extraction changes so stale entries are no longer used
+PARSER_VERSION = "1"
+
+# File types whose extraction is expensive enough to be worth caching
+CACHED_SUFFIXES = [".pdf"]
+
+
+class DocumentCache(SQLiteCache):
+    """Cache of extracted document text stored in a local SQLite database."""
+
+    filename = "documents.sqlite3"
+
+    @staticmethod
+    def fingerprint(
+        file_path: str, max_pages: int | None = None, max_chars: int | None = None
+    ) -> str:
+        """
+        Build the cache key of a file.
+
+        The key covers the resolved path, size, modification time, content
+        hash and parser version, so any change to the file or the extraction
+        code results in a cache miss. Extraction limits are part of the key
+        because they change the extracted text.
+
+        Args:
+            file_path: Path to the file
+            max_pages: Page limit used for extraction
+            max_chars: Character limit used for extraction
+
+        Returns:
+            SHA-256 hex digest identifying the file and parser
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+
+        content_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                content_hash.update(block)
+
+        payload = json.dumps(
+            [
+                str(path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                content_hash.hexdigest(),
+                PARSER_VERSION,
+                max_pages,
+                max_chars,
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def precompute(
+        self,
+        directory: str,
+        recursive: bool = True,
+        pdf_reader: Any | None = None,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Extract and cache all cacheable documents in a directory.
+
+        The limits are part of the cache key, so each document is cached
+        twice if limits are given: without limits, as the CV is read, and
+        under the limits supporting documents are read with.
+
+        Args:
+            directory: Directory to scan
+            recursive: Also scan sub-directories
+            pdf_reader: Optional configured PDFReaderTool
+            max_pages: Only extract the first max_pages pages of each PDF
+            max_chars: Stop extracting after max_chars characters
+
+        Returns:
+            Counts of documents that were "cached", "already_cached" or "failed"
+
+        Raises:
+            ValueError: If directory is not a directory
+        """
+        # Imported here to avoid a circular import with DocumentParser
+        from cover_letter_writer.tools.document_parser import DocumentParser
+
+        root = Path(directory)
+        if not root.is_dir():
+            raise ValueError(f"Path is not a directory: {directory}")
+
+        limits = [(None, None)]
+        if max_pages is not None or max_chars is not None:
+            limits.append((max_pages, max_chars))
+
+        counts = {"cached": 0, "already_cached": 0, "failed": 0}
+        pattern = "**/*" if recursive else "*"
+        for path in sorted(root.glob(pattern)):
+            if not path.is_file() or path.suffix.lower() not in CACHED_SUFFIXES:
+                continue
+            try:
+                misses_before = self.misses
+                for pages, chars in limits:
+                    DocumentParser.parse_file(
+                        str(path),
+                        cache=self,
+                        pdf_reader=pdf_reader,
+                        max_pages=pages,
+                        max_chars=chars,
+                    )
+                if self.misses > misses_before:
+                    counts["cached"] += 1
+                else:
+                    counts["already_cached"] += 1
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Failed to cache {path}: {e}")
+                counts["failed"] += 1
+
+        return counts
@@ -2,15 +2,22 @@
 
 from pathlib import Path
 
-from cover_letter_writer.tools.pdf_reader import read_pdf
-from cover_letter_writer.tools.web_scraper import scrape_web_page
+from cover_letter_writer.tools.document_cache import CACHED_SUFFIXES, DocumentCache
+from cover_letter_writer.tools.pdf_reader import PDFReaderTool, read_pdf
+from cover_letter_writer.tools.web_scraper import WebScraperTool, scrape_web_page
 
 
 class DocumentParser:
     """Parser for handling various document formats."""
 
     @staticmethod
-    def parse_file(file_path: str) -> str:
+    def parse_file(
+        file_path: str,
+        cache: DocumentCache | None = None,
+        pdf_reader: PDFReaderTool | None = None,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+    ) -> str:
         """
         Parse a file and extract its text content.
 
@@ -18,6 +25,10 @@ class DocumentParser:
 
         Args:
             file_path: Path to the file
+            cache: Optional extraction cache; PDFs found in it are not re-parsed
+            pdf_reader: Optional configured PDF reader (e.g. parallel extraction)
+            max_pages: Only extract the first max_pages pages of a PDF
+            max_chars: Stop reading after max_chars characters
 
         Returns:
             Extracted text content
@@ -36,17 +47,34 @@ class DocumentParser:
 
         suffix = path.suffix.lower()
 
+        if cache is not None and suffix in CACHED_SUFFIXES:
+            key = cache.fingerprint(file_path, max_pages=max_pages, max_chars=max_chars)
+            text = cache.get(key)
+            if text is None:
+                text = DocumentParser.parse_file(
+                    file_path,
+                    pdf_reader=pdf_reader,
+                    max_pages=max_pages,
+                    max_chars=max_chars,
+                )
+                cache.put(key, text)
+            return text
+
         # Handle text and markdown files
         if suffix in [".txt", ".md", ".markdown"]:
             try:
-                return path.read_text(encoding="utf-8")
+                return DocumentParser._read_text(path, "utf-8", max_chars)
             except UnicodeDecodeError:
                 # Try with different encoding
-                return path.read_text(encoding="latin-1")
+                return DocumentParser._read_text(path, "latin-1", max_chars)
 
         # Handle PDF files
         elif suffix == ".pdf":
-            return read_pdf(file_path)
+            if pdf_reader is not None:
+                return pdf_reader.extract_text(
+                    file_path, max_pages=max_pages, max_chars=max_chars
+                )
+            return read_pdf(file_path, max_pages=max_pages, max_chars=max_chars)
 
         else:
             raise ValueError(
@@ -55,12 +83,33 @@ class DocumentParser:
             )
 
     @staticmethod
-    def parse_source(source: str) -> str:
+    def _read_text(path: Path, encoding: str, max_chars: int | None) -> str:
+        """Read a text file, reading at most max_chars characters."""
+        if max_chars is None:
+            return path.read_text(encoding=encoding)
+        with open(path, encoding=encoding) as f:
+            return f.read(max_chars)
+
+    @staticmethod
+    def is_url(source: str) -> bool:
+        """Return whether a source is a web page URL rather than a file path."""
+        return source.startswith(("http://", "https://"))
+
+    @staticmethod
+    def parse_source(
+        source: str,
+        cache: DocumentCache | None = None,
+        pdf_reader: PDFReaderTool | None = None,
+        scraper: WebScraperTool | None = None,
+    ) -> str:
         """
         Parse a source that can be either a file path or URL.
 
         Args:
             source: File path or URL
+            cache: Optional extraction cache for files
+            pdf_reader: Optional configured PDF reader
+            scraper: Optional configured web scraper (e.g. with an HTTP cache)
 
         Returns:
             Extracted text content
@@ -69,19 +118,31 @@ class DocumentParser:
             ValueError: If source cannot be parsed
         """
         # Check if it's a URL
-        if source.startswith(("http://", "https://")):
+        if DocumentParser.is_url(source):
+            if scraper is not None:
+                return scraper.scrape_url(source)
             return scrape_web_page(source)
 
         # Otherwise treat as file path
-        return DocumentParser.parse_file(source)
+        return DocumentParser.parse_file(source, cache=cache, pdf_reader=pdf_reader)
 
     @staticmethod
-    def parse_multiple_files(file_paths: list[str]) -> list[str]:
+    def parse_multiple_files(
+        file_paths: list[str],
+        cache: DocumentCache | None = None,
+        pdf_reader: PDFReaderTool | None = None,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+    ) -> list[str]:
         """
         Parse multiple files and return their contents.
 
         Args:
             file_paths: List of file paths
+            cache: Optional extraction cache
+            pdf_reader: Optional configured PDF reader
+            max_pages: Only extract the first max_pages pages of each PDF
+            max_chars: Limit each document to max_chars characters
 
         Returns:
             List of extracted text contents
@@ -92,7 +153,13 @@ class DocumentParser:
         contents = []
         for file_path in file_paths:
             try:
-                content = DocumentParser.parse_file(file_path)
+                content = DocumentParser.parse_file(
+                    file_path,
+                    cache=cache,
+                    pdf_reader=pdf_reader,
+                    max_pages=max_pages,
+                    max_chars=max_chars,
+                )
                 contents.append(content)
             except Exception as e:
                 raise ValueError(f"Failed to parse {file_path}: {str(e)}") from e
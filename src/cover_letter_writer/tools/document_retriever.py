@@ -0,0 +1,198 @@
+"""Local BM25 ranking of document chunks against a job description."""
+
+import math
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Rough characters-per-token ratio of English prose for GPT/Claude tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word terms for ranking."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass
+class Chunk:
+    """A contiguous piece of a source document."""
+
+    source: int
+    position: int
+    text: str
+
+    @property
+    def tokens(self) -> int:
+        """Approximate LLM token count of the chunk."""
+        return estimate_tokens(self.text)
+
+
+def chunk_document(text: str, source: int, chunk_tokens: int = 150) -> list[Chunk]:
+    """
+    Split a document into chunks of roughly chunk_tokens tokens.
+
+    Paragraphs are kept together where possible; paragraphs longer than the
+    chunk size are split at line, then word boundaries.
+
+    Args:
+        text: Document text
+        source: Index of the document (kept on every chunk)
+        chunk_tokens: Target chunk size in tokens
+
+    Returns:
+        Chunks in document order
+    """
+    max_chars = chunk_tokens * CHARS_PER_TOKEN
+    pieces: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for line in paragraph.splitlines():
+            line = line.strip()
+            while len(line) > max_chars:
+                cut = line.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(line[:cut].strip())
+                line = line[cut:].strip()
+            if line:
+                pieces.append(line)
+
+    # Merge small neighbouring pieces up to the chunk size
+    merged: list[str] = []
+    for piece in pieces:
+        if merged and len(merged[-1]) + len(piece) + 2 <= max_chars:
+            merged[-1] = f"{merged[-1]}\n\n{piece}"
+        else:
+            merged.append(piece)
+
+    return [
+        Chunk(source=source, position=index, text=chunk)
+        for index, chunk in enumerate(merged)
+    ]
+
+
+class BM25Index:
+    """BM25 index over chunks, scored with vectorized NumPy operations."""
+
+    def __init__(self, chunks: list[Chunk], k1: float = 1.5, b: float = 0.75):
+        """
+        Build the index.
+
+        Args:
+            chunks: Chunks to index
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+        """
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+
+        self.vocabulary: dict[str, int] = {}
+        rows, cols = [], []
+        for row, chunk in enumerate(chunks):
+            for term in tokenize(chunk.text):
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+
+        # Dense term-frequency matrix (chunks x terms); documents are small
+        self.term_freqs = np.zeros((len(chunks), len(self.vocabulary)), np.float32)
+        np.add.at(self.term_freqs, (rows, cols), 1.0)
+
+        self.lengths = self.term_freqs.sum(axis=1)
+        average_length = self.lengths.mean() if len(chunks) else 0.0
+        self.length_norm = self.k1 * (
+            1 - self.b + self.b * self.lengths / max(average_length, 1.0)
+        )
+
+        doc_freqs = (self.term_freqs > 0).sum(axis=0)
+        self.idf = np.log(1 + (len(chunks) - doc_freqs + 0.5) / (doc_freqs + 0.5))
+
+    def score(self, query: str) -> np.ndarray:
+        """
+        Score every chunk against a query.
+
+        Args:
+            query: Query text (the job description)
+
+        Returns:
+            BM25 score per chunk
+        """
+        term_ids: dict[int, int] = {}
+        for term in tokenize(query):
+            term_id = self.vocabulary.get(term)
+            if term_id is not None:
+                term_ids[term_id] = term_ids.get(term_id, 0) + 1
+        if not term_ids or not self.chunks:
+            return np.zeros(len(self.chunks), np.float32)
+
+        ids = np.fromiter(term_ids.keys(), dtype=np.int64)
+        query_counts = np.fromiter(term_ids.values(), dtype=np.float32)
+        tf = self.term_freqs[:, ids]
+        saturation = tf * (self.k1 + 1) / (tf + self.length_norm[:, None])
+        return saturation @ (self.idf[ids] * query_counts)
+
+
+def select_chunks(
+    documents: list[str], query: str, token_budget: int, chunk_tokens: int = 150
+) -> list[Chunk]:
+    """
+    Select the chunks most relevant to a query that fit a token budget.
+
+    Chunks are taken greedily by descending BM25 score, skipping chunks that
+    no longer fit, and returned in their original document order.
+
+    Args:
+        documents: Documents to select from
+        query: Query text (the job description)
+        token_budget: Maximum total tokens of the selected chunks
+        chunk_tokens: Target chunk size in tokens
+
+    Returns:
+        Selected chunks in document order
+    """
+    chunks = [
+        chunk
+        for source, text in enumerate(documents)
+        for chunk in chunk_document(text, source, chunk_tokens)
+    ]
+    if not chunks:
+        return []
+
+    scores = BM25Index(chunks).score(query)
+    # Stable sort keeps document order among equally relevant chunks
+    ranking = np.argsort(-scores, kind="stable")
+
+    selected, used = [], 0
+    for index in ranking:
+        chunk = chunks[index]
+        if used + chunk.tokens <= token_budget:
+            selected.append(chunk)
+            used += chunk.tokens
+
+    return sorted(selected, key=lambda chunk: (chunk.source, chunk.position))
+
+
+def fits_budget(documents: list[str], token_budget: int) -> bool:
+    """Return whether documents fit the budget without any selection."""
+    return sum(estimate_tokens(text) for text in documents) <= token_budget
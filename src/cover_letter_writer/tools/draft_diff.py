@@ -0,0 +1,28 @@
+"""Local comparison of successive cover letter drafts."""
+
+import difflib
+import re
+
+WORD_PATTERN = re.compile(r"\S+")
+
+
+def change_ratio(previous: str, current: str) -> float:
+    """
+    Measure how much a draft changed compared to its previous version.
+
+    Drafts are compared word by word, so re-wrapped lines and whitespace
+    changes don't count as changes.
+
+    Args:
+        previous: Previous draft
+        current: Revised draft
+
+    Returns:
+        Share of changed words, from 0.0 (identical) to 1.0 (nothing in common)
+    """
+    old_words = WORD_PATTERN.findall(previous)
+    new_words = WORD_PATTERN.findall(current)
+    if not old_words and not new_words:
+        return 0.0
+    matcher = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False)
+    return round(1 - matcher.ratio(), 4)
@@ -0,0 +1,205 @@
+"""Deterministic checks of cover letter drafts that need no LLM."""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+# Overused "AI-sounding" expressions banned by the writer task guidelines
+# (crews/writer_crew/config/tasks.yaml); keep both lists in sync
+DEFAULT_BANNED_PHRASES = [
+    "robust",
+    "delve",
+    "utilize",
+    "endeavor",
+    "in today's world",
+    "as a matter of fact",
+    "exactly",
+]
+
+DASH_PATTERN = re.compile(r"[–—]|(?<=\s)--(?=\s)")
+NUMBER_RANGE_PATTERN = re.compile(r"(\d)\s*–\s*(\d)")
+SPACED_DASH_PATTERN = re.compile(r"\s*(?:[–—]|(?<=\s)--(?=\s))\s*")
+WORD_PATTERN = re.compile(r"\b[\w'’-]+\b")
+
+# Chatty lines LLMs put before or after the letter itself
+PREAMBLE_PATTERN = re.compile(
+    r"^\s*(?:(?:sure|certainly|of course|absolutely)\b.*"
+    r"|(?:here is|here's|below is|the following is)\b.*:)\s*$",
+    re.IGNORECASE,
+)
+POSTAMBLE_PATTERN = re.compile(
+    r"^\s*(?:let me know\b|i hope this\b|feel free to\b|would you like me to\b).*$",
+    re.IGNORECASE,
+)
+
+RULE_DASHES = "dashes"
+RULE_PREAMBLE = "preamble"
+RULE_BANNED_PHRASES = "banned_phrases"
+RULE_LENGTH = "length"
+
+
+@dataclass
+class LintIssue:
+    """A violation of one lint rule."""
+
+    rule: str
+    message: str
+    count: int = 1
+    fixed: bool = False
+
+
+@dataclass
+class LintReport:
+    """Lint result of a draft."""
+
+    draft: str
+    issues: list[LintIssue] = field(default_factory=list)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of violations per rule, including auto-fixed ones."""
+        counts: Counter[str] = Counter()
+        for issue in self.issues:
+            counts[issue.rule] += issue.count
+        return dict(counts)
+
+    @property
+    def blocking(self) -> list[LintIssue]:
+        """Violations that were not fixed and have to go back to the writer."""
+        return [issue for issue in self.issues if not issue.fixed]
+
+    def feedback(self) -> str:
+        """Render the blocking violations as revision instructions for the writer."""
+        lines = [
+            "DECISION: NEEDS_IMPROVEMENT",
+            "",
+            "The draft failed automated checks and was not reviewed yet.",
+            "Fix the following issues and keep the rest of the draft unchanged:",
+            *(f"- {issue.message}" for issue in self.blocking),
+        ]
+        return "\n".join(lines)
+
+
+class DraftLinter:
+    """Rule engine for the mechanical cover letter requirements."""
+
+    def __init__(
+        self,
+        banned_phrases: list[str] | None = None,
+        min_words: int | None = 200,
+        max_words: int | None = 600,
+        auto_fix: bool = True,
+    ):
+        """
+        Initialize draft linter.
+
+        Args:
+            banned_phrases: Expressions the letter must not use
+                (defaults to the writer guidelines' list)
+            min_words: Minimum letter length in words (None disables the check)
+            max_words: Maximum letter length in words (None disables the check)
+            auto_fix: Fix dashes and chatty preambles in place instead of
+                sending them back to the writer
+        """
+        self.banned_phrases = (
+            DEFAULT_BANNED_PHRASES if banned_phrases is None else banned_phrases
+        )
+        self.min_words = min_words
+        self.max_words = max_words
+        self.auto_fix = auto_fix
+        self._banned_patterns = {
+            phrase: re.compile(rf"\b{re.escape(phrase)}\w*\b", re.IGNORECASE)
+            for phrase in self.banned_phrases
+        }
+
+    def lint(self, draft: str) -> LintReport:
+        """
+        Check a draft against all rules.
+
+        Args:
+            draft: Cover letter draft
+
+        Returns:
+            Report with the (possibly auto-fixed) draft and all violations
+        """
+        report = LintReport(draft=draft)
+        self._check_preamble(report)
+        self._check_dashes(report)
+        self._check_banned_phrases(report)
+        self._check_length(report)
+        return report
+
+    def _check_preamble(self, report: LintReport) -> None:
+        """Find chatty lines before the salutation or after the signature."""
+        lines = report.draft.strip().splitlines()
+        start, end = 0, len(lines)
+        while start < end and (
+            not lines[start].strip() or PREAMBLE_PATTERN.match(lines[start])
+        ):
+            start += 1
+        while end > start and (
+            not lines[end - 1].strip() or POSTAMBLE_PATTERN.match(lines[end - 1])
+        ):
+            end -= 1
+
+        extra = [line for line in lines[:start] + lines[end:] if line.strip()]
+        if not extra:
+            return
+        report.issues.append(
+            LintIssue(
+                rule=RULE_PREAMBLE,
+                message="Remove text that is not part of the letter: "
+                + "; ".join(f'"{line.strip()}"' for line in extra),
+                count=len(extra),
+                fixed=self.auto_fix,
+            )
+        )
+        if self.auto_fix:
+            report.draft = "\n".join(lines[start:end]).strip()
+
+    def _check_dashes(self, report: LintReport) -> None:
+        """Find em-dashes and en-dashes, which the letter must not use."""
+        count = len(DASH_PATTERN.findall(report.draft))
+        if not count:
+            return
+        report.issues.append(
+            LintIssue(
+                rule=RULE_DASHES,
+                message=f"Replace the {count} em-dash(es) or en-dash(es) with "
+                "commas, periods or parentheses.",
+                count=count,
+                fixed=self.auto_fix,
+            )
+        )
+        if self.auto_fix:
+            draft = NUMBER_RANGE_PATTERN.sub(r"\1-\2", report.draft)
+            report.draft = SPACED_DASH_PATTERN.sub(", ", draft)
+
+    def _check_banned_phrases(self, report: LintReport) -> None:
+        """Find overused AI-sounding expressions."""
+        found = {
+            phrase: len(pattern.findall(report.draft))
+            for phrase, pattern in self._banned_patterns.items()
+        }
+        found = {phrase: count for phrase, count in found.items() if count}
+        if not found:
+            return
+        report.issues.append(
+            LintIssue(
+                rule=RULE_BANNED_PHRASES,
+                message="Rephrase without these overused expressions: "
+                + ", ".join(f'"{phrase}"' for phrase in found),
+                count=sum(found.values()),
+            )
+        )
+
+    def _check_length(self, report: LintReport) -> None:
+        """Check the letter length in words."""
+        words = len(WORD_PATTERN.findall(report.draft))
+        if self.min_words is not None and words < self.min_words:
+            message = f"Expand the letter to at least {self.min_words} words (it has {words})."
+        elif self.max_words is not None and words > self.max_words:
+            message = f"Shorten the letter to at most {self.max_words} words (it has {words})."
+        else:
+            return
+        report.issues.append(LintIssue(rule=RULE_LENGTH, message=message))
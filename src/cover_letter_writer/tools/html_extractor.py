@@ -0,0 +1,133 @@
+"""HTML-to-text extraction engines for the web scraper."""
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+    etree = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+HTML_ENGINES = ["auto", "selectolax", "lxml", "html.parser"]
+
+# Page chrome that never contains the job description
+REMOVED_TAGS = ["script", "style", "nav", "header", "footer"]
+
+
+def available_engines() -> list[str]:
+    """
+    List the extraction engines whose dependencies are installed.
+
+    Returns:
+        Engine names, fastest first
+    """
+    engines = []
+    if LexborHTMLParser is not None:
+        engines.append("selectolax")
+    if lxml is not None:
+        engines.append("lxml")
+    if BeautifulSoup is not None:
+        engines.append("html.parser")
+    return engines
+
+
+def resolve_engine(engine: str = "auto") -> str:
+    """
+    Resolve an engine name, picking the fastest installed engine for "auto".
+
+    Args:
+        engine: Engine name (see HTML_ENGINES)
+
+    Returns:
+        Name of an installed engine
+
+    Raises:
+        ValueError: If the engine is unknown or its package is not installed
+    """
+    if engine not in HTML_ENGINES:
+        raise ValueError(
+            f"Unsupported HTML engine: {engine}. "
+            f"Supported engines: {', '.join(HTML_ENGINES)}"
+        )
+
+    installed = available_engines()
+    if engine == "auto":
+        if not installed:
+            raise ValueError(
+                "No HTML parser installed. Install with: pip install beautifulsoup4"
+            )
+        return installed[0]
+
+    if engine not in installed:
+        package = {"html.parser": "beautifulsoup4"}.get(engine, engine)
+        raise ValueError(
+            f"HTML engine '{engine}' is not available. "
+            f"Install it with: pip install {package}"
+        )
+    return engine
+
+
+def extract_text(content: bytes | str, engine: str = "auto") -> str:
+    """
+    Extract readable text from an HTML page.
+
+    Script, style and navigation elements are removed, every text node is
+    put on its own line and blank lines are dropped. All engines aim to
+    produce the same output as the BeautifulSoup "html.parser" fallback.
+
+    Args:
+        content: Raw HTML (bytes are decoded using the page's declared charset)
+        engine: Engine name (see HTML_ENGINES)
+
+    Returns:
+        Cleaned text, one text fragment per line
+
+    Raises:
+        ValueError: If the engine is unknown or not installed
+    """
+    engine = resolve_engine(engine)
+    if engine == "selectolax":
+        text = _extract_selectolax(content)
+    elif engine == "lxml":
+        text = _extract_lxml(content)
+    else:
+        text = _extract_beautifulsoup(content)
+
+    # Clean up whitespace
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return "\n".join(lines)
+
+
+def _extract_beautifulsoup(content: bytes | str) -> str:
+    """Extract text with BeautifulSoup's pure-Python parser."""
+    soup = BeautifulSoup(content, "html.parser")
+    for element in soup(REMOVED_TAGS):
+        element.decompose()
+    return soup.get_text(separator="\n", strip=True)
+
+
+def _extract_lxml(content: bytes | str) -> str:
+    """Extract text with lxml's libxml2-based HTML parser."""
+    document = lxml.html.document_fromstring(content)
+    # Keep tails: text following a removed element belongs to its parent
+    etree.strip_elements(document, etree.Comment, *REMOVED_TAGS, with_tail=False)
+    fragments = (text.strip() for text in document.itertext())
+    return "\n".join(text for text in fragments if text)
+
+
+def _extract_selectolax(content: bytes | str) -> str:
+    """Extract text with selectolax's C-backed (lexbor) HTML parser."""
+    tree = LexborHTMLParser(content)
+    tree.strip_tags(REMOVED_TAGS)
+    if tree.root is None:
+        return ""
+    return tree.root.text(separator="\n", strip=True)
@@ -0,0 +1,106 @@
+"""On-disk HTTP response cache supporting conditional GET revalidation."""
+
+import base64
+import json
+from typing import Any
+
+from cover_letter_writer.utils.cache_store import SQLiteCache
+
+
+class HTTPCache(SQLiteCache):
+    """
+    Cache of fetched web pages keyed by URL.
+
+    Only responses carrying an ETag or Last-Modified validator are stored.
+    They are always revalidated with the server (If-None-Match /
+    If-Modified-Since), so a "304 Not Modified" answer replaces a full
+    download while changed pages are still fetched fresh. A revalidated
+    page counts as a hit, a full download as a miss.
+    """
+
+    filename = "http.sqlite3"
+
+    @classmethod
+    def open(cls, directory: str, max_size_mb: float | None = None) -> "HTTPCache":
+        """
+        Open the HTTP cache database in a directory.
+
+        Args:
+            directory: Cache directory
+            max_size_mb: Maximum cache size before LRU eviction
+
+        Returns:
+            Cache instance
+        """
+        return cls(cls.open_store(directory, max_size_mb=max_size_mb))
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """
+        Look up a cached response (counted once the server answers, see record).
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Dict with "etag", "last_modified" and "content" (bytes), or None
+        """
+        value = self.store.get(url)
+        if value is None:
+            return None
+        entry = json.loads(value)
+        entry["content"] = base64.b64decode(entry["content"])
+        return entry
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """
+        Store a response if it carries a validator.
+
+        Args:
+            url: Requested URL
+            content: Response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        if not etag and not last_modified:
+            return
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content": base64.b64encode(content).decode("ascii"),
+        }
+        self.store.put(url, json.dumps(entry))
+
+    @staticmethod
+    def conditional_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+        """
+        Build revalidation request headers for a cached entry.
+
+        Args:
+            entry: Cached entry (or None)
+
+        Returns:
+            If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, revalidated: bool) -> None:
+        """Count a fetch answered by 304 (revalidated) or a full download."""
+        self._count(hits=int(revalidated), misses=int(not revalidated))
+
+    def stats(self) -> dict[str, int]:
+        """Return revalidation and full-download counters."""
+        stats = super().stats()
+        return {"revalidated": stats["hits"], "fetched": stats["misses"]}
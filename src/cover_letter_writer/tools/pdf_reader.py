@@ -1,6 +1,9 @@
 """PDF extraction tool for Cover Letter Writer."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 try:
     from pypdf import PdfReader
@@ -11,12 +14,33 @@ except ImportError:
 class PDFReaderTool:
     """Tool for extracting text from PDF files."""
 
-    def extract_text(self, file_path: str) -> str:
+    def __init__(self, max_workers: int = 1, parallel_threshold: int = 20):
+        """
+        Initialize PDF reader.
+
+        Args:
+            max_workers: Number of worker processes for page extraction
+                (1 extracts serially in the current process)
+            parallel_threshold: Minimum number of pages before pages are
+                split across worker processes
+        """
+        self.max_workers = max(1, max_workers)
+        self.parallel_threshold = parallel_threshold
+
+    def extract_text(
+        self,
+        file_path: str,
+        max_pages: int | None = None,
+        max_chars: int | None = None,
+    ) -> str:
         """
         Extract text content from a PDF file.
 
         Args:
             file_path: Path to the PDF file
+            max_pages: Only extract the first max_pages pages
+            max_chars: Stop extracting once this many characters are collected
+                (the result is truncated to max_chars)
 
         Returns:
             Extracted text content
@@ -24,6 +48,69 @@ class PDFReaderTool:
         Raises:
             ValueError: If PDF extraction fails or pypdf is not installed
         """
+        reader = self._open_reader(file_path)
+
+        try:
+            page_count = len(reader.pages)
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+
+            if max_chars is not None:
+                # Character budgets are only known page by page, so stream
+                extracted_text = self._join_limited(
+                    self._iter_reader_pages(reader, page_count), max_chars
+                )
+            else:
+                if self.max_workers > 1 and page_count >= self.parallel_threshold:
+                    page_texts = self._extract_parallel(file_path, page_count)
+                else:
+                    page_texts = self._iter_reader_pages(reader, page_count)
+
+                text_parts = [text for text in page_texts if text]
+
+                extracted_text = "\n".join(text_parts)
+
+            if not extracted_text.strip():
+                raise ValueError(f"No text could be extracted from PDF: {file_path}")
+
+            return extracted_text
+
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from PDF {file_path}: {e}") from e
+
+    def iter_pages(self, file_path: str, max_pages: int | None = None) -> Iterator[str]:
+        """
+        Lazily yield the text of each page of a PDF file.
+
+        Pages are only parsed when requested, so callers can stop early
+        without extracting the rest of the document. Pages without text
+        are skipped.
+
+        Args:
+            file_path: Path to the PDF file
+            max_pages: Only yield the first max_pages pages
+
+        Yields:
+            Page text, in page order
+
+        Raises:
+            ValueError: If the PDF cannot be opened or a page fails to extract
+        """
+        reader = self._open_reader(file_path)
+        page_count = len(reader.pages)
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+
+        try:
+            for text in self._iter_reader_pages(reader, page_count):
+                if text:
+                    yield text
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from PDF {file_path}: {e}") from e
+
+    @staticmethod
+    def _open_reader(file_path: str) -> Any:
+        """Validate the path and open a PdfReader."""
         if PdfReader is None:
             raise ValueError(
                 "pypdf is not installed. Install it with: pip install pypdf"
@@ -37,37 +124,109 @@ class PDFReaderTool:
             raise ValueError(f"File is not a PDF: {file_path}")
 
         try:
-            reader = PdfReader(str(path))
-            text_parts = []
+            return PdfReader(str(path))
+        except Exception as e:
+            raise ValueError(
+                f"Failed to extract text from PDF {file_path}: {str(e)}"
+            ) from e
 
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
+    @staticmethod
+    def _iter_reader_pages(reader: Any, page_count: int) -> Iterator[str]:
+        """Yield the raw text of the first page_count pages."""
+        for index in range(page_count):
+            yield reader.pages[index].extract_text()
+
+    @staticmethod
+    def _join_limited(page_texts: Iterable[str], max_chars: int) -> str:
+        """Join page texts with newlines, stopping at max_chars characters."""
+        text_parts = []
+        length = 0
+        for text in page_texts:
+            if not text:
+                continue
+            if text_parts:
+                length += 1  # newline separator
+            text_parts.append(text)
+            length += len(text)
+            if length >= max_chars:
+                break
+        return "\n".join(text_parts)[:max_chars]
+
+    def _extract_parallel(self, file_path: str, page_count: int) -> list[str]:
+        """
+        Extract pages in worker processes and return them in page order.
 
-            extracted_text = "\n".join(text_parts)
+        Args:
+            file_path: Path to the PDF file
+            page_count: Number of pages in the PDF
 
-            if not extracted_text.strip():
-                raise ValueError(f"No text could be extracted from PDF: {file_path}")
+        Returns:
+            Text of every page, in page order
+        """
+        chunks = split_page_range(page_count, self.max_workers)
+        workers = min(self.max_workers, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                _extract_page_range,
+                [file_path] * len(chunks),
+                [start for start, _ in chunks],
+                [stop for _, stop in chunks],
+            )
+            # map() yields results in submission order, so pages stay ordered
+            return [text for chunk_texts in results for text in chunk_texts]
 
-            return extracted_text
 
-        except Exception as e:
-            raise ValueError(
-                f"Failed to extract text from PDF {file_path}: {str(e)}"
-            ) from e
+def split_page_range(page_count: int, workers: int) -> list[tuple[int, int]]:
+    """
+    Split pages into contiguous (start, stop) ranges for worker processes.
+
+    Two ranges per worker are used so a slow chunk doesn't leave the other
+    workers idle.
 
+    Args:
+        page_count: Number of pages
+        workers: Number of workers
 
-def read_pdf(file_path: str) -> str:
+    Returns:
+        List of half-open page ranges covering all pages in order
+    """
+    chunk_count = max(1, min(page_count, workers * 2))
+    base, extra = divmod(page_count, chunk_count)
+    ranges = []
+    start = 0
+    for index in range(chunk_count):
+        stop = start + base + (1 if index < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> list[str]:
+    """Extract the text of pages [start, stop) (runs in a worker process)."""
+    reader = PdfReader(file_path)
+    return [reader.pages[index].extract_text() for index in range(start, stop)]
+
+
+def read_pdf(
+    file_path: str,
+    max_workers: int = 1,
+    parallel_threshold: int = 20,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+) -> str:
     """
     Convenience function to extract text from a PDF file.
 
     Args:
         file_path: Path to the PDF file
+        max_workers: Number of worker processes for page extraction
+        parallel_threshold: Minimum number of pages for parallel extraction
+        max_pages: Only extract the first max_pages pages
+        max_chars: Truncate the extracted text to max_chars characters
 
     Returns:
         Extracted text content
     """
-    tool = PDFReaderTool()
-    return tool.extract_text(file_path)
-
+    tool = PDFReaderTool(max_workers=max_workers, parallel_threshold=parallel_threshold)
+    return tool.extract_text(file_path, max_pages=max_pages, max_chars=max_chars)
@@ -1,22 +1,87 @@
 """Web scraping tool for extracting job descriptions from URLs."""
 
+import threading
+from typing import Any
+
+from cover_letter_writer.tools.html_extractor import extract_text, resolve_engine
+from cover_letter_writer.tools.http_cache import HTTPCache
+
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
 except ImportError:
     requests = None
     BeautifulSoup = None
+    HTTPAdapter = None
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def create_session(pool_maxsize: int = 16) -> Any:
+    """
+    Create a requests session with a keep-alive connection pool.
+
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_shared_session() -> Any:
+    """
+    Get the process-wide pooled session.
+
+    Sharing one session lets consecutive scrapes (e.g. many postings from
+    the same job board in a batch run) reuse open TCP/TLS connections.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
 
 
 class WebScraperTool:
     """Tool for scraping text content from web pages."""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        session: Any | None = None,
+        cache: HTTPCache | None = None,
+        engine: str = "auto",
+    ):
         """
         Initialize web scraper.
 
         Args:
             timeout: Request timeout in seconds
+            session: requests.Session to use (defaults to the shared pooled one)
+            cache: Optional HTTP cache for conditional revalidation
+            engine: HTML extraction engine ("auto" picks the fastest installed
+                one; "html.parser" is the pure-Python fallback)
+
+        Raises:
+            ValueError: If required packages are missing or engine is unknown
         """
         if requests is None or BeautifulSoup is None:
             raise ValueError(
@@ -24,6 +89,9 @@ class WebScraperTool:
                 "Install with: pip install requests beautifulsoup4"
             )
         self.timeout = timeout
+        self.session = session if session is not None else get_shared_session()
+        self.cache = cache
+        self.engine = resolve_engine(engine)
 
     def scrape_url(self, url: str) -> str:
         """
@@ -42,29 +110,8 @@ class WebScraperTool:
             raise ValueError(f"Invalid URL format: {url}")
 
         try:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/91.0.4472.124 Safari/537.36"
-                )
-            }
-
-            response = requests.get(url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
-
-            # Get text
-            text = soup.get_text(separator="\n", strip=True)
-
-            # Clean up whitespace
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            cleaned_text = "\n".join(lines)
+            content = self.fetch(url)
+            cleaned_text = extract_text(content, engine=self.engine)
 
             if not cleaned_text:
                 raise ValueError(f"No text content could be extracted from URL: {url}")
@@ -76,18 +123,57 @@ class WebScraperTool:
         except Exception as e:
             raise ValueError(f"Failed to parse content from URL {url}: {str(e)}") from e
 
+    def fetch(self, url: str) -> bytes:
+        """
+        Download a URL, revalidating a cached copy if there is one.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Response body
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        cached = self.cache.get(url) if self.cache is not None else None
+        headers = {"User-Agent": USER_AGENT, **HTTPCache.conditional_headers(cached)}
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached is not None:
+            self.cache.record(revalidated=True)
+            return cached["content"]
+        response.raise_for_status()
+
+        if self.cache is not None:
+            self.cache.record(revalidated=False)
+            self.cache.put(
+                url,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return response.content
+
 
-def scrape_web_page(url: str, timeout: int = 30) -> str:
+def scrape_web_page(
+    url: str,
+    timeout: int = 30,
+    cache: HTTPCache | None = None,
+    engine: str = "auto",
+) -> str:
     """
     Convenience function to scrape text from a web page.
 
     Args:
         url: URL to scrape
         timeout: Request timeout in seconds
+        cache: Optional HTTP cache for conditional revalidation
+        engine: HTML extraction engine
 
     Returns:
         Extracted text content
     """
-    scraper = WebScraperTool(timeout=timeout)
+    scraper = WebScraperTool(timeout=timeout, cache=cache, engine=engine)
     return scraper.scrape_url(url)
 
@@ -1,7 +1,33 @@
 """Utility functions for Cover Letter Writer."""
 
-from cover_letter_writer.utils.file_handler import FileHandler
-from cover_letter_writer.utils.llm_factory import LLMFactory
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["FileHandler", "LLMFactory"]
+if TYPE_CHECKING:
+    from cover_letter_writer.utils.file_handler import FileHandler
+    from cover_letter_writer.utils.llm_cache import LLMResponseCache
+    from cover_letter_writer.utils.llm_factory import LLMFactory
 
+# Imported on first access: the LLM modules load CrewAI, which the light
+# utilities (metrics, checkpoints, caches) don't need
+_LAZY_IMPORTS = {
+    "FileHandler": "cover_letter_writer.utils.file_handler",
+    "LLMFactory": "cover_letter_writer.utils.llm_factory",
+    "LLMResponseCache": "cover_letter_writer.utils.llm_cache",
+}
+
+__all__ = ["FileHandler", "LLMFactory", "LLMResponseCache"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the module attributes."""
+    return sorted(set(globals()) | set(__all__))
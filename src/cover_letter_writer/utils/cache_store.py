@@ -0,0 +1,241 @@
+"""SQLite-backed key/value store used by the on-disk caches."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+class SQLiteCacheStore:
+    """
+    Persistent key/value store with LRU eviction by total size and a TTL.
+
+    A single connection is shared between threads and guarded by a lock,
+    so one store can be used by all flows of a batch run.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        """
+        Open (and create if needed) a cache store.
+
+        Args:
+            path: Path to the SQLite database file
+            max_size_bytes: Evict least recently used entries above this size
+            ttl_seconds: Entries older than this are treated as missing
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_accessed "
+                "ON entries(accessed_at)"
+            )
+
+    def get(self, key: str, touch: bool = True) -> str | None:
+        """
+        Get a value from the store.
+
+        Args:
+            key: Entry key
+            touch: Update the entry's last access time (LRU bookkeeping)
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+
+            if touch:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store a value, evicting old entries if the size limit is exceeded.
+
+        Args:
+            key: Entry key
+            value: Value to store
+        """
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO entries
+                    (key, value, size, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, value, size, now, now),
+            )
+            self._evict(now)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of entries and their total size in bytes."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {"entries": count, "size_bytes": total}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones above max size."""
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM entries WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+
+        if self.max_size_bytes is None:
+            return
+
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total <= self.max_size_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+        stale_keys = []
+        for key, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            stale_keys.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", stale_keys)
+
+
+class SQLiteCache:
+    """
+    Base class of the caches stored in a SQLiteCacheStore.
+
+    Subclasses set the database file name and add their key scheme. Hit and
+    miss counters are guarded by a lock, so one cache can serve all flows of
+    a batch run.
+    """
+
+    # Database file in the cache directory
+    filename = "cache.sqlite3"
+
+    def __init__(self, store: SQLiteCacheStore):
+        """
+        Initialize cache.
+
+        Args:
+            store: Backing key/value store
+        """
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, directory: str) -> "SQLiteCache":
+        """
+        Open the cache database in a directory.
+
+        Args:
+            directory: Cache directory
+
+        Returns:
+            Cache instance
+        """
+        return cls(cls.open_store(directory))
+
+    @classmethod
+    def open_store(
+        cls,
+        directory: str,
+        max_size_mb: float | None = None,
+        ttl_hours: float | None = None,
+    ) -> SQLiteCacheStore:
+        """
+        Open the store of this cache in a directory.
+
+        Args:
+            directory: Cache directory
+            max_size_mb: Maximum cache size before LRU eviction
+            ttl_hours: Time-to-live of entries
+
+        Returns:
+            Key/value store in the cache's database file
+        """
+        return SQLiteCacheStore(
+            str(Path(directory).expanduser() / cls.filename),
+            max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+            ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+        )
+
+    def get(self, key: str) -> str | None:
+        """Look up a value and update hit/miss counters."""
+        value = self.store.get(key)
+        self._count(hits=int(value is not None), misses=int(value is None))
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a value."""
+        self.store.put(key, value)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit and miss counters."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _count(self, hits: int = 0, misses: int = 0) -> None:
+        """Add to the hit and miss counters."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
@@ -0,0 +1,287 @@
+"""Recording of LLM calls to cassettes and offline replay of recorded runs."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from crewai import BaseLLM
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from cover_letter_writer.utils.fake_llm import estimate_usage
+
+
+def make_cassette_key(
+    messages: str | list[dict[str, Any]], stop: list[str] | None = None
+) -> str:
+    """
+    Build the key of a recorded call.
+
+    Unlike the response cache key, the key leaves out provider, model and
+    temperature, so a run recorded with any provider can be replayed.
+
+    Args:
+        messages: Fully rendered prompt (string or role/content messages)
+        stop: Stop words sent with the call
+
+    Returns:
+        SHA-256 hex digest identifying the prompt
+    """
+    payload = json.dumps(
+        {"messages": messages, "stop": stop or []},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CassetteRecorder:
+    """Appends LLM calls to a JSON Lines cassette file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize recorder.
+
+        Args:
+            path: Cassette file (created on the first recorded call; calls of
+                later runs are appended)
+        """
+        self.path = Path(path).expanduser()
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        messages: str | list[dict[str, Any]],
+        stop: list[str] | None,
+        response: str,
+        provider: str,
+        model: str,
+        latency_seconds: float,
+    ) -> None:
+        """
+        Append one call to the cassette.
+
+        Args:
+            messages: Prompt of the call
+            stop: Stop words of the call
+            response: Response text
+            provider: Provider that answered
+            model: Model that answered
+            latency_seconds: Time the call took
+        """
+        entry = {
+            "key": make_cassette_key(messages, stop),
+            "provider": provider,
+            "model": model,
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "latency_seconds": round(latency_seconds, 3),
+            "messages": messages,
+            "stop": stop or [],
+            "response": response,
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.recorded += 1
+
+
+class RecordingLLM(BaseLLM):
+    """CrewAI LLM wrapper that records every call of the inner LLM to a cassette."""
+
+    def __init__(
+        self,
+        inner: BaseLLM,
+        recorder: CassetteRecorder,
+        provider: str,
+        model: str,
+        temperature: float,
+    ):
+        """
+        Initialize recording wrapper.
+
+        Args:
+            inner: LLM that answers the calls (a LangChainLLM or CachingLLM,
+                which take the stop words with each call)
+            recorder: Cassette the calls are appended to
+            provider: LLM provider name (stored with each call)
+            model: Model name (stored with each call)
+            temperature: Temperature setting
+        """
+        super().__init__(model=model, temperature=temperature)
+        self.inner = inner
+        self.recorder = recorder
+        self.provider = provider
+
+    def call(
+        self,
+        messages: str | list[dict[str, Any]],
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+        response_model: Any | None = None,
+        stop: list[str] | None = None,
+    ) -> str:
+        """
+        Call the inner LLM and record the prompt and response.
+
+        Args:
+            messages: Prompt string or list of role/content messages
+            tools: Passed through to the inner LLM
+            callbacks: Passed through to the inner LLM
+            available_functions: Passed through to the inner LLM
+            from_task: Task issuing the call
+            from_agent: Agent issuing the call
+            response_model: Passed through to the inner LLM
+            stop: Stop words of this call (defaults to this LLM's)
+
+        Returns:
+            Response text
+        """
+        # CrewAI sets stop words on the outer LLM. They are passed with the
+        # call because the inner LLM is shared by concurrent kickoffs.
+        if stop is None:
+            stop = getattr(self, "stop", None)
+        stop = list(stop or [])
+        started = time.perf_counter()
+        response = self.inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+            stop=stop,
+        )
+        if isinstance(response, str):
+            self.recorder.record(
+                messages,
+                stop,
+                response,
+                provider=self.provider,
+                model=self.model,
+                latency_seconds=time.perf_counter() - started,
+            )
+        return response
+
+    def supports_function_calling(self) -> bool:
+        """Delegate to the inner LLM."""
+        return self.inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        """Delegate to the inner LLM."""
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        """Delegate to the inner LLM."""
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        """Delegate to the inner LLM."""
+        return self.inner.get_token_usage_summary()
+
+
+class ReplayChatModel:
+    """
+    LangChain-style chat model answering prompts from a recorded cassette.
+
+    Responses are looked up by prompt. A prompt recorded several times (for
+    example an unchanged revision request) gets its responses in recording
+    order, the last one repeating.
+    """
+
+    def __init__(self, path: str, latency_seconds: float | None = 0.0):
+        """
+        Load a cassette.
+
+        Args:
+            path: Cassette file written by CassetteRecorder
+            latency_seconds: Artificial latency of every call; None replays
+                the latency recorded with each call
+
+        Raises:
+            FileNotFoundError: If the cassette doesn't exist
+            ValueError: If the cassette is not valid JSON Lines
+        """
+        self.path = Path(path).expanduser()
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+        self.latency_seconds = latency_seconds
+        self.entries: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        with open(self.path, encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self.entries[entry["key"]].append(entry)
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    raise ValueError(
+                        f"Invalid cassette {path} at line {number}: {e}"
+                    ) from e
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, messages: str | list[dict[str, Any]], stop: list[str] | None = None
+    ) -> dict[str, Any]:
+        """
+        Find the recorded call of a prompt.
+
+        Args:
+            messages: Prompt string or list of role/content messages
+            stop: Stop words of the call
+
+        Returns:
+            Recorded cassette entry
+
+        Raises:
+            ValueError: If the prompt was not recorded
+        """
+        key = make_cassette_key(messages, stop)
+        with self._lock:
+            recorded = self.entries.get(key)
+            if not recorded:
+                self.misses += 1
+                raise ValueError(
+                    f"No recorded response for this prompt in cassette {self.path} "
+                    "(the inputs or prompt templates changed since it was "
+                    "recorded; record it again with llm.record_cassette)"
+                )
+            self.hits += 1
+            return recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+    def invoke(
+        self, messages: str | list[dict[str, Any]], stop: list[str] | None = None
+    ) -> AIMessage:
+        """Return the recorded response of a prompt."""
+        entry = self.lookup(messages, stop)
+        latency = self.latency_seconds
+        if latency is None:
+            latency = entry.get("latency_seconds", 0.0)
+        time.sleep(latency)
+        return AIMessage(
+            content=entry["response"],
+            usage_metadata=estimate_usage(messages, entry["response"]),
+        )
+
+    def stream(
+        self, messages: str | list[dict[str, Any]], stop: list[str] | None = None
+    ) -> Any:
+        """Return the recorded response as a single chunk."""
+        response = self.invoke(messages, stop)
+        yield AIMessageChunk(
+            content=response.content, usage_metadata=response.usage_metadata
+        )
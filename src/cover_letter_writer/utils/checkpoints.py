@@ -0,0 +1,123 @@
+"""Atomic on-disk checkpoints of flow state for resuming interrupted runs."""
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+# Bump when the checkpointed state can no longer be resumed by the flow
+CHECKPOINT_VERSION = "1"
+
+RUN_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class FlowCheckpointStore:
+    """Flow state checkpoints stored as one JSON file per run."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            directory: Directory of the checkpoint files (created on first save)
+        """
+        self.directory = Path(directory).expanduser()
+
+    def path(self, run_id: str) -> Path:
+        """
+        Get the checkpoint file of a run.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Path to the checkpoint file
+
+        Raises:
+            ValueError: If the run id is not a valid file name
+        """
+        if not RUN_ID_PATTERN.match(run_id) or run_id.strip(".") == "":
+            raise ValueError(f"Invalid run id: {run_id}")
+        return self.directory / f"{run_id}.json"
+
+    def exists(self, run_id: str) -> bool:
+        """Return whether a checkpoint of the run exists."""
+        return self.path(run_id).exists()
+
+    def save(self, run_id: str, state: BaseModel) -> Path:
+        """
+        Save the state of a run, replacing its previous checkpoint atomically.
+
+        The state is written to a temporary file in the same directory and
+        moved over the old checkpoint, so a crash while saving leaves the
+        previous checkpoint intact.
+
+        Args:
+            run_id: Run identifier
+            state: Flow state
+
+        Returns:
+            Path to the checkpoint file
+        """
+        path = self.path(run_id)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "run_id": run_id,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "state": state.model_dump(mode="json"),
+        }
+
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=f".{run_id}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        return path
+
+    def load(self, run_id: str) -> dict[str, Any]:
+        """
+        Load the checkpointed state of a run.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            State fields as saved
+
+        Raises:
+            FileNotFoundError: If the run has no checkpoint
+            ValueError: If the checkpoint is unreadable or from another version
+        """
+        path = self.path(run_id)
+        if not path.exists():
+            raise FileNotFoundError(
+                f"No checkpoint found for run {run_id} in {self.directory}"
+            )
+
+        try:
+            checkpoint = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Corrupt checkpoint {path}: {e}") from e
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Checkpoint {path} was written by an incompatible version "
+                f"({checkpoint.get('version')}) and can't be resumed"
+            )
+        return checkpoint["state"]
+
+    def delete(self, run_id: str) -> None:
+        """Delete the checkpoint of a run (no-op if there is none)."""
+        self.path(run_id).unlink(missing_ok=True)
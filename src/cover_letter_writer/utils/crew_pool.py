@@ -0,0 +1,173 @@
+"""Reuse of prepared crews and parsed crew configs across flow iterations."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+
+@cache
+def _parse_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file once per path and modification time."""
+    with open(path, encoding="utf-8") as file:
+        content = yaml.safe_load(file)
+    return content if isinstance(content, dict) else {}
+
+
+def load_yaml_cached(config_path: Path) -> dict[str, Any]:
+    """
+    Load a crew YAML config, parsing each file only once per process.
+
+    Drop-in replacement for CrewBase.load_yaml. A deep copy is returned
+    because CrewBase rewrites the config dicts while building agents.
+
+    Args:
+        config_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(config_path)
+    return copy.deepcopy(_parse_yaml(str(path), path.stat().st_mtime_ns))
+
+
+def cached_configs(crew_cls: type) -> type:
+    """
+    Class decorator making a @CrewBase crew read its configs via the cache.
+
+    Must be applied above @CrewBase, which injects its own load_yaml.
+    """
+    crew_cls.load_yaml = staticmethod(load_yaml_cached)
+    return crew_cls
+
+
+class CrewPool:
+    """
+    Pool of built crews, reused between kickoffs.
+
+    A crew is checked out exclusively for one kickoff, so concurrent flows
+    never share a crew. Crews are kept per crew class and LLM instance;
+    a crew whose kickoff raised is discarded instead of being reused.
+
+    The pool is bounded: at most max_idle_per_key idle crews are kept per
+    crew class and LLM, and only the max_keys most recently used crew
+    class/LLM pairs are kept. Callers that create an LLM per request
+    therefore don't pin every LLM and its crews for the life of the process.
+    """
+
+    def __init__(self, max_keys: int = 32, max_idle_per_key: int = 8):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_keys: Maximum number of crew class/LLM pairs with idle crews
+            max_idle_per_key: Maximum idle crews kept per crew class and LLM
+
+        Raises:
+            ValueError: If a limit is less than 1
+        """
+        if max_keys < 1 or max_idle_per_key < 1:
+            raise ValueError("Crew pool limits must be at least 1")
+        self.max_keys = max_keys
+        self.max_idle_per_key = max_idle_per_key
+        self.builds = 0
+        self.reuses = 0
+        self.evictions = 0
+        self.build_seconds = 0.0
+        # Least recently used keys first
+        self._idle: OrderedDict[tuple[type, int], list[Any]] = OrderedDict()
+        # Keeps pooled LLMs alive so their id() can't be reused by another LLM
+        self._llms: dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, crew_cls: type, llm: Any) -> Iterator[Any]:
+        """
+        Check out a crew built by crew_cls(llm).crew().
+
+        Args:
+            crew_cls: Crew class (e.g. WriterCrew)
+            llm: Language model the crew uses
+
+        Yields:
+            Crew ready for kickoff
+        """
+        key = (crew_cls, id(llm))
+        with self._lock:
+            idle = self._idle.get(key)
+            crew = idle.pop() if idle else None
+            if crew is not None:
+                self.reuses += 1
+                self._idle.move_to_end(key)
+
+        if crew is None:
+            started = time.perf_counter()
+            crew = crew_cls(llm).crew()
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.builds += 1
+                self.build_seconds += elapsed
+
+        yield crew
+
+        # Only reached if the kickoff succeeded
+        with self._lock:
+            self._release(key, llm, crew)
+
+    def _release(self, key: tuple[type, int], llm: Any, crew: Any) -> None:
+        """Return a crew to the pool and evict beyond the limits (lock held)."""
+        idle = self._idle.setdefault(key, [])
+        self._idle.move_to_end(key)
+        if len(idle) >= self.max_idle_per_key:
+            self.evictions += 1
+            return
+        idle.append(crew)
+        self._llms[id(llm)] = llm
+
+        while len(self._idle) > self.max_keys:
+            (_, llm_id), evicted = self._idle.popitem(last=False)
+            self.evictions += len(evicted)
+            if not any(other_id == llm_id for _, other_id in self._idle):
+                self._llms.pop(llm_id, None)
+
+    def clear(self) -> None:
+        """Drop all idle crews."""
+        with self._lock:
+            self._idle.clear()
+            self._llms.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return build/reuse counters and the estimated construction time saved.
+
+        Returns:
+            Dict with "builds", "reuses", "evictions" (idle crews dropped),
+            "build_ms" (total), "avg_build_ms" and "saved_ms" (reuses times
+            the average build time)
+        """
+        with self._lock:
+            builds, reuses, build_seconds = self.builds, self.reuses, self.build_seconds
+            evictions = self.evictions
+        avg_build_ms = build_seconds * 1000 / builds if builds else 0.0
+        return {
+            "builds": builds,
+            "reuses": reuses,
+            "evictions": evictions,
+            "build_ms": round(build_seconds * 1000, 2),
+            "avg_build_ms": round(avg_build_ms, 2),
+            "saved_ms": round(reuses * avg_build_ms, 2),
+        }
+
+
+# Pool shared by all flows in the process
+default_crew_pool = CrewPool()
@@ -0,0 +1,42 @@
+"""Persistent cache of document digests keyed by input hash."""
+
+import hashlib
+import json
+
+from cover_letter_writer.utils.cache_store import SQLiteCache
+
+# Bump when the summarizer prompt changes so stale digests are no longer used
+DIGEST_VERSION = "1"
+
+
+class DigestCache(SQLiteCache):
+    """Cache of LLM-generated document digests stored in a local SQLite database."""
+
+    filename = "digests.sqlite3"
+
+    @staticmethod
+    def make_key(
+        text: str, document_kind: str, model: str | None, target_tokens: int
+    ) -> str:
+        """
+        Build the cache key of a digest.
+
+        Args:
+            text: Original document text
+            document_kind: Kind of document named in the prompt (e.g. "CV")
+            model: Model that writes the digest
+            target_tokens: Requested digest length
+
+        Returns:
+            SHA-256 hex digest identifying the input and summarizer settings
+        """
+        payload = json.dumps(
+            [
+                DIGEST_VERSION,
+                model,
+                document_kind,
+                target_tokens,
+                hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,245 @@
+"""Scripted chat model for running the flow offline without a live LLM."""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from cover_letter_writer.models import ReviewScores
+from cover_letter_writer.tools.document_retriever import estimate_tokens
+from cover_letter_writer.utils.llm_adapter import message_text
+
+# CrewAI agents without tools finish by writing this marker before the answer
+FINAL_ANSWER_PREFIX = "Thought: I now can give a great answer\nFinal Answer: "
+
+REVIEW_PROMPT_PATTERN = re.compile(r'"decision":\s*"APPROVED or NEEDS_IMPROVEMENT"')
+TRANSLATION_PATTERN = re.compile(
+    r"Cover letter to translate:\s*(.*?)\s*Target language:", re.DOTALL
+)
+SUMMARY_PATTERN = re.compile(
+    r"Document to condense:\s*(.*?)\s*(?:This is the expected criteria|$)", re.DOTALL
+)
+
+# Maximum characters of a document the default summarizer answer keeps
+SUMMARY_CHARS = 2000
+
+DEFAULT_LETTER = """Dear Hiring Manager,
+
+I am writing to apply for the position advertised on your careers page. The
+role combines hands-on engineering with close collaboration across teams, and
+that combination is where I have done my best work over the past
+years. I would welcome the chance to bring that experience to your team.
+
+In my current position I lead the development of data processing services
+that are used by several hundred people every day. I designed the service
+architecture, introduced automated testing and deployment, and reduced the
+time from a merged change to production from days to under an hour. Along the
+way I mentored four junior engineers, two of whom now lead projects of their
+own.
+
+Before that, I spent three years building analytics tools for a research
+group. Working with scientists taught me to listen carefully, to ask about the
+question behind a request and to explain technical trade-offs in plain
+language. Those habits have helped me in every project since.
+
+What draws me to your company is the focus on practical tools that people rely
+on in their daily work. I enjoy turning unclear requirements into simple,
+reliable software, and I am confident that my background in both engineering
+and collaboration would let me contribute quickly.
+
+Thank you for considering my application. I would be glad to discuss how my
+experience fits your plans, and I look forward to hearing from you.
+
+Sincerely,
+Alex Example"""
+
+
+def default_review(decision: str = "APPROVED", score: int = 8) -> str:
+    """
+    Build a structured review in the reviewer task's JSON format.
+
+    Args:
+        decision: "APPROVED" or "NEEDS_IMPROVEMENT"
+        score: Score given for every criterion
+
+    Returns:
+        Review JSON
+    """
+    return json.dumps(
+        {
+            "decision": decision,
+            "scores": dict.fromkeys(ReviewScores.model_fields, score),
+            "strengths": ["Clear structure and a natural, personal voice"],
+            "improvements": []
+            if decision == "APPROVED"
+            else ["Connect the listed experience more directly to the role"],
+        },
+        indent=2,
+    )
+
+
+def default_response(prompt: str) -> str:
+    """
+    Answer a prompt of one of the project's crews with a plausible response.
+
+    Reviews approve with good scores, translations and summaries echo the
+    given text, and everything else gets a fixed letter that passes the
+    draft linter.
+
+    Args:
+        prompt: Rendered prompt text
+
+    Returns:
+        Response text (without the CrewAI final answer marker)
+    """
+    if REVIEW_PROMPT_PATTERN.search(prompt):
+        return default_review()
+    translation = TRANSLATION_PATTERN.search(prompt)
+    if translation:
+        return translation.group(1)
+    summary = SUMMARY_PATTERN.search(prompt)
+    if summary:
+        return summary.group(1)[:SUMMARY_CHARS]
+    return DEFAULT_LETTER
+
+
+def prompt_text(messages: str | list[dict[str, Any]]) -> str:
+    """Join the text of all messages of a prompt."""
+    if isinstance(messages, str):
+        return messages
+    return "\n\n".join(
+        message_text(message.get("content") or "") for message in messages
+    )
+
+
+class FakeChatModel:
+    """
+    LangChain-style chat model returning scripted responses.
+
+    A script is a list of rules, each with a regular expression that is
+    searched in the prompt and one response (or a list served in turn, the
+    last one repeating). Prompts no rule matches get default_response().
+    """
+
+    def __init__(
+        self,
+        rules: list[dict[str, Any]] | None = None,
+        latency_seconds: float = 0.0,
+    ):
+        """
+        Initialize fake chat model.
+
+        Args:
+            rules: Script rules with "match" and "response" or "responses"
+            latency_seconds: Artificial latency of every call
+
+        Raises:
+            ValueError: If a rule has no match pattern or no response
+        """
+        self.rules = []
+        for rule in rules or []:
+            responses = rule.get("responses", [rule.get("response")])
+            if not rule.get("match") or not responses or None in responses:
+                raise ValueError(
+                    f"Invalid fake LLM rule {rule}: it needs 'match' and "
+                    "'response' or 'responses'"
+                )
+            self.rules.append((re.compile(rule["match"]), [str(r) for r in responses]))
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self._served = [0] * len(self.rules)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_script(
+        cls, path: str | None, latency_seconds: float = 0.0
+    ) -> "FakeChatModel":
+        """
+        Create a fake chat model from a YAML or JSON script file.
+
+        The file contains {"rules": [{"match": ..., "response": ...}, ...]}.
+
+        Args:
+            path: Script file (None uses the default responses only)
+            latency_seconds: Artificial latency of every call
+
+        Returns:
+            Fake chat model
+
+        Raises:
+            FileNotFoundError: If the script file doesn't exist
+            ValueError: If the script is invalid
+        """
+        if path is None:
+            return cls(latency_seconds=latency_seconds)
+        script_path = Path(path).expanduser()
+        if not script_path.exists():
+            raise FileNotFoundError(f"Fake LLM script not found: {path}")
+        try:
+            script = yaml.safe_load(script_path.read_text(encoding="utf-8")) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid fake LLM script {path}: {e}") from e
+        return cls(rules=script.get("rules", []), latency_seconds=latency_seconds)
+
+    def respond(self, messages: str | list[dict[str, Any]]) -> str:
+        """
+        Pick the response to a prompt.
+
+        Args:
+            messages: Prompt string or list of role/content messages
+
+        Returns:
+            Response text including the CrewAI final answer marker
+        """
+        prompt = prompt_text(messages)
+        with self._lock:
+            self.calls += 1
+            for index, (pattern, responses) in enumerate(self.rules):
+                if pattern.search(prompt):
+                    response = responses[min(self._served[index], len(responses) - 1)]
+                    self._served[index] += 1
+                    break
+            else:
+                response = default_response(prompt)
+        if "Final Answer:" in response:
+            return response
+        return FINAL_ANSWER_PREFIX + response
+
+    def invoke(
+        self, messages: str | list[dict[str, Any]], stop: list[str] | None = None
+    ) -> AIMessage:
+        """Return the scripted response after the configured latency."""
+        response = self.respond(messages)
+        time.sleep(self.latency_seconds)
+        return AIMessage(
+            content=response, usage_metadata=estimate_usage(messages, response)
+        )
+
+    def stream(
+        self, messages: str | list[dict[str, Any]], stop: list[str] | None = None
+    ) -> Any:
+        """Stream the scripted response word by word after the configured latency."""
+        response = self.respond(messages)
+        time.sleep(self.latency_seconds)
+        words = re.findall(r"\S+\s*|\s+", response)
+        for index, word in enumerate(words):
+            usage = estimate_usage(messages, response) if index == 0 else None
+            yield AIMessageChunk(content=word, usage_metadata=usage)
+
+
+def estimate_usage(
+    messages: str | list[dict[str, Any]], response: str
+) -> dict[str, int]:
+    """Estimate the usage metadata of a fake or replayed response."""
+    prompt_tokens = estimate_tokens(prompt_text(messages))
+    completion_tokens = estimate_tokens(response)
+    return {
+        "input_tokens": prompt_tokens,
+        "output_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
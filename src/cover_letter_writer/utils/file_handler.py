@@ -1,7 +1,11 @@
 """File handling utilities for Cover Letter Writer."""
 
+import json
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+from cover_letter_writer.utils.token_accounting import summarize_usage
 
 
 class FileHandler:
@@ -100,7 +104,20 @@ class FileHandler:
             lines.append(
                 f"**Timestamp:** {feedback.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
             )
-            lines.append(f"**Decision:** {feedback.decision}\n")
+            lines.append(f"**Decision:** {feedback.decision}")
+            if feedback.scores is not None:
+                lines.append(f"**Aggregate Score:** {feedback.aggregate_score:.2f}/10")
+            if feedback.change_ratio is not None:
+                lines.append(f"**Draft Change:** {feedback.change_ratio:.1%}")
+            if feedback.source != "reviewer":
+                lines.append(f"**Feedback Source:** {feedback.source}")
+            if feedback.lint_violations:
+                violations = ", ".join(
+                    f"{rule} {count}"
+                    for rule, count in feedback.lint_violations.items()
+                )
+                lines.append(f"**Lint Violations:** {violations}")
+            lines.append("")
 
             lines.append("### Comments")
             lines.append(feedback.comments + "\n")
@@ -140,6 +157,106 @@ class FileHandler:
 
         return file_path
 
+    @staticmethod
+    def save_flow_outputs(
+        state: Any,
+        output_dir: str,
+        cover_letter_filename_pattern: str = "cover_letter_optimized_{timestamp}.md",
+        feedback_filename_pattern: str = "cover_letter_review_history_{timestamp}.md",
+        usage_filename_pattern: str = "token_usage_{timestamp}.json",
+    ) -> dict[str, Path]:
+        """
+        Save all outputs of a finished cover letter flow.
+
+        Args:
+            state: Final CoverLetterState of the flow
+            output_dir: Output directory
+            cover_letter_filename_pattern: Filename pattern for the cover letter
+            feedback_filename_pattern: Filename pattern for the feedback history
+            usage_filename_pattern: Filename pattern for the token usage report
+
+        Returns:
+            Mapping of output kind ("cover_letter", "translation_<language>",
+            "feedback", "usage") to path
+        """
+        saved = {}
+
+        cover_letter_path = FileHandler.save_cover_letter(
+            cover_letter_content=state.current_draft,
+            output_dir=output_dir,
+            filename_pattern=cover_letter_filename_pattern,
+        )
+        saved["cover_letter"] = cover_letter_path
+
+        # Translations share the base filename of the English cover letter
+        for language, translation in state.translations.items():
+            saved[f"translation_{language}"] = FileHandler.save_translated_cover_letter(
+                cover_letter_content=translation,
+                output_dir=output_dir,
+                language_code=language,
+                base_filename=cover_letter_path.stem,
+            )
+
+        feedback_content = FileHandler.format_feedback_history(state.feedback_history)
+        saved["feedback"] = FileHandler.save_feedback_history(
+            feedback_content=feedback_content,
+            output_dir=output_dir,
+            filename_pattern=feedback_filename_pattern,
+        )
+
+        if state.usage:
+            saved["usage"] = FileHandler.save_json(
+                data={
+                    "summary": summarize_usage(state.usage),
+                    "calls": [call.model_dump() for call in state.usage],
+                },
+                output_dir=output_dir,
+                filename_pattern=usage_filename_pattern,
+            )
+
+        return saved
+
+    @staticmethod
+    def save_batch_summary(
+        summary: dict[str, Any],
+        output_dir: str,
+        filename_pattern: str = "batch_summary_{timestamp}.json",
+    ) -> Path:
+        """
+        Save a batch run summary as JSON.
+
+        Args:
+            summary: JSON-serializable summary data
+            output_dir: Output directory
+            filename_pattern: Filename pattern with {timestamp} placeholder
+
+        Returns:
+            Path to saved file
+        """
+        return FileHandler.save_json(summary, output_dir, filename_pattern)
+
+    @staticmethod
+    def save_json(data: Any, output_dir: str, filename_pattern: str) -> Path:
+        """
+        Save data as a timestamped JSON file.
+
+        Args:
+            data: JSON-serializable data
+            output_dir: Output directory
+            filename_pattern: Filename pattern with {timestamp} placeholder
+
+        Returns:
+            Path to saved file
+        """
+        dir_path = FileHandler.ensure_directory(output_dir)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = dir_path / filename_pattern.format(timestamp=timestamp)
+
+        file_path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+
+        return file_path
+
     @staticmethod
     def read_file(file_path: str) -> str:
         """
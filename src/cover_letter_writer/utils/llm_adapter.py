@@ -0,0 +1,217 @@
+"""Adapter exposing LangChain chat models as CrewAI LLMs."""
+
+import time
+from typing import Any
+
+from crewai import BaseLLM
+
+from cover_letter_writer.utils.streaming import emit_token, streaming_enabled
+from cover_letter_writer.utils.token_accounting import report_failure, report_usage
+
+# Task templates start their per-iteration inputs with this header; the
+# prompt before it is stable across iterations and cached by the provider
+PROMPT_CACHE_BOUNDARY = "=== CURRENT ITERATION"
+
+# Providers that need explicit cache breakpoints (OpenAI caches prefixes
+# automatically)
+CACHE_BREAKPOINT_PROVIDERS = ["anthropic"]
+
+
+def message_text(content: Any) -> str:
+    """
+    Convert LangChain message content to plain text.
+
+    Some providers (e.g. Anthropic) return a list of content blocks
+    instead of a string.
+
+    Args:
+        content: Message content (string or list of blocks)
+
+    Returns:
+        Text content
+    """
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(block.get("text", ""))
+    return "".join(parts)
+
+
+def add_cache_breakpoints(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Mark the stable prompt prefix for Anthropic prompt caching.
+
+    Adds a cache_control breakpoint after the system message and, if the
+    user message contains PROMPT_CACHE_BOUNDARY, right before the boundary,
+    so repeated calls of an agent only pay full price for the part of the
+    prompt that changes between iterations.
+
+    Args:
+        messages: Role/content messages with string content
+
+    Returns:
+        New messages with the cached parts split into content blocks
+    """
+    marked = []
+    user_marked = False
+    for message in messages:
+        content = message.get("content")
+        if not isinstance(content, str) or not content:
+            marked.append(message)
+            continue
+
+        if message.get("role") == "system":
+            blocks = [_cached_block(content)]
+        elif message.get("role") == "user" and not user_marked:
+            prefix, boundary, rest = content.partition(PROMPT_CACHE_BOUNDARY)
+            if not boundary or not prefix.strip():
+                marked.append(message)
+                continue
+            blocks = [_cached_block(prefix), {"type": "text", "text": boundary + rest}]
+            user_marked = True
+        else:
+            marked.append(message)
+            continue
+        marked.append({**message, "content": blocks})
+    return marked
+
+
+def _cached_block(text: str) -> dict[str, Any]:
+    """Build a text content block ending with a cache breakpoint."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+class LangChainLLM(BaseLLM):
+    """
+    CrewAI LLM that sends the rendered prompt to a LangChain chat model.
+
+    CrewAI normally converts LangChain models into its own LLM class. This
+    adapter keeps the call in our hands so wrappers (such as the response
+    cache) can see the fully rendered prompt.
+    """
+
+    def __init__(
+        self,
+        chat_model: Any,
+        provider: str,
+        model: str,
+        temperature: float,
+        prompt_caching: bool = False,
+    ):
+        """
+        Initialize adapter.
+
+        Args:
+            chat_model: LangChain chat model instance
+            provider: LLM provider name
+            model: Model name
+            temperature: Temperature setting
+            prompt_caching: Add provider cache breakpoints to the prompts
+        """
+        super().__init__(model=model, temperature=temperature)
+        self.chat_model = chat_model
+        self.provider = provider
+        self.prompt_caching = prompt_caching
+
+    def call(
+        self,
+        messages: str | list[dict[str, Any]],
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+        response_model: Any | None = None,
+        stop: list[str] | None = None,
+    ) -> str:
+        """
+        Send messages to the chat model and return the response text.
+
+        Args:
+            messages: Prompt string or list of role/content messages
+            tools: Unused; the crews in this project don't use tools
+            callbacks: Unused
+            available_functions: Unused
+            from_task: Task issuing the call
+            from_agent: Agent issuing the call
+            response_model: Unused; the tasks in this project return plain text
+            stop: Stop words of this call; wrappers pass theirs here instead
+                of setting them on this shared LLM (defaults to this LLM's)
+
+        Returns:
+            Response text
+        """
+        if stop is None:
+            stop = getattr(self, "stop", None)
+        stop = list(stop or []) or None
+        if (
+            self.prompt_caching
+            and self.provider in CACHE_BREAKPOINT_PROVIDERS
+            and isinstance(messages, list)
+        ):
+            messages = add_cache_breakpoints(messages)
+        started = time.perf_counter()
+        try:
+            if streaming_enabled():
+                response = self._stream(messages, stop)
+            else:
+                response = self.chat_model.invoke(messages, stop=stop)
+        except Exception:
+            report_failure(latency_seconds=time.perf_counter() - started)
+            raise
+        self._track_usage(response, latency_seconds=time.perf_counter() - started)
+        return message_text(response.content)
+
+    def _stream(
+        self, messages: str | list[dict[str, Any]], stop: list[str] | None
+    ) -> Any:
+        """
+        Stream the response, forwarding each chunk as it arrives.
+
+        Returns:
+            The merged response message (including usage metadata)
+        """
+        response = None
+        for chunk in self.chat_model.stream(messages, stop=stop):
+            emit_token(message_text(chunk.content))
+            response = chunk if response is None else response + chunk
+        if response is None:
+            raise ValueError("The model returned an empty stream")
+        return response
+
+    def _track_usage(self, response: Any, latency_seconds: float = 0.0) -> None:
+        """Record the provider-reported token usage and latency of a response."""
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            report_usage(latency_seconds=latency_seconds)
+            return
+        cached = (usage.get("input_token_details") or {}).get("cache_read", 0)
+        self._track_token_usage_internal(
+            {
+                "prompt_tokens": usage.get("input_tokens", 0),
+                "completion_tokens": usage.get("output_tokens", 0),
+                "cached_prompt_tokens": cached or 0,
+            }
+        )
+        report_usage(
+            prompt_tokens=usage.get("input_tokens", 0),
+            completion_tokens=usage.get("output_tokens", 0),
+            cached_prompt_tokens=cached or 0,
+            latency_seconds=latency_seconds,
+        )
+
+    def supports_function_calling(self) -> bool:
+        """Tools are not used by the crews, so function calling is disabled."""
+        return False
+
+    def supports_stop_words(self) -> bool:
+        """Stop words are passed through to the chat model."""
+        return True
+
+    def get_context_window_size(self) -> int:
+        """Return a conservative context window size."""
+        return 128_000
@@ -0,0 +1,239 @@
+"""Content-addressed on-disk cache for LLM responses."""
+
+import hashlib
+import json
+from typing import Any
+
+from crewai import BaseLLM
+
+from cover_letter_writer.utils.cache_store import SQLiteCache, SQLiteCacheStore
+from cover_letter_writer.utils.streaming import emit_token
+
+LLM_CACHE_MODES = ["bypass", "read_only", "read_write"]
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    temperature: float | None,
+    messages: str | list[dict[str, Any]],
+    stop: list[str] | None = None,
+    tools: list[dict] | None = None,
+    response_model: Any | None = None,
+) -> str:
+    """
+    Build a content-addressed key for an LLM call.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        temperature: Temperature setting
+        messages: Fully rendered prompt (string or role/content messages)
+        stop: Stop words sent with the call
+        tools: Tool schemas offered to the model
+        response_model: Pydantic model the response is parsed into
+
+    Returns:
+        SHA-256 hex digest identifying the call
+    """
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "messages": messages,
+            "stop": stop or [],
+            "tools": tools or [],
+            # The schema, not the class name, decides what the model returns
+            "response_model": (
+                response_model.model_json_schema()
+                if hasattr(response_model, "model_json_schema")
+                else response_model
+            ),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(SQLiteCache):
+    """LLM response cache with read-only, read-write and bypass modes."""
+
+    filename = "llm_responses.sqlite3"
+
+    def __init__(self, store: SQLiteCacheStore, mode: str = "read_write"):
+        """
+        Initialize cache.
+
+        Args:
+            store: Backing key/value store
+            mode: One of "bypass", "read_only", "read_write"
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in LLM_CACHE_MODES:
+            raise ValueError(
+                f"Unsupported LLM cache mode: {mode}. "
+                f"Supported modes: {', '.join(LLM_CACHE_MODES)}"
+            )
+        super().__init__(store)
+        self.mode = mode
+
+    @classmethod
+    def open(
+        cls,
+        directory: str,
+        mode: str = "read_write",
+        max_size_mb: float | None = None,
+        ttl_hours: float | None = None,
+    ) -> "LLMResponseCache":
+        """
+        Open the cache database in a directory.
+
+        Args:
+            directory: Cache directory
+            mode: Cache mode
+            max_size_mb: Maximum cache size before LRU eviction
+            ttl_hours: Time-to-live of cached responses
+
+        Returns:
+            Cache instance
+        """
+        store = cls.open_store(directory, max_size_mb=max_size_mb, ttl_hours=ttl_hours)
+        return cls(store, mode=mode)
+
+    @property
+    def readable(self) -> bool:
+        """Whether cached responses are served."""
+        return self.mode in ["read_only", "read_write"]
+
+    @property
+    def writable(self) -> bool:
+        """Whether new responses are stored."""
+        return self.mode == "read_write"
+
+    def get(self, key: str) -> str | None:
+        """Look up a response and update hit/miss counters."""
+        if not self.readable:
+            return None
+        value = self.store.get(key, touch=self.writable)
+        self._count(hits=int(value is not None), misses=int(value is None))
+        return value
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response if the cache is writable."""
+        if self.writable:
+            self.store.put(key, response)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache mode and hit/miss counters."""
+        return {"mode": self.mode} | super().stats()
+
+
+class CachingLLM(BaseLLM):
+    """CrewAI LLM wrapper that serves repeated prompts from an LLMResponseCache."""
+
+    def __init__(
+        self,
+        inner: BaseLLM,
+        cache: LLMResponseCache,
+        provider: str,
+        model: str,
+        temperature: float,
+    ):
+        """
+        Initialize caching wrapper.
+
+        Args:
+            inner: LLM that handles cache misses (a LangChainLLM, which
+                takes the stop words with each call)
+            cache: Response cache
+            provider: LLM provider name (part of the cache key)
+            model: Model name (part of the cache key)
+            temperature: Temperature setting (part of the cache key)
+        """
+        super().__init__(model=model, temperature=temperature)
+        self.inner = inner
+        self.cache = cache
+        self.provider = provider
+
+    def call(
+        self,
+        messages: str | list[dict[str, Any]],
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+        response_model: Any | None = None,
+        stop: list[str] | None = None,
+    ) -> str:
+        """
+        Return the cached response for the prompt or call the inner LLM.
+
+        Args:
+            messages: Prompt string or list of role/content messages
+            tools: Passed through to the inner LLM
+            callbacks: Passed through to the inner LLM
+            available_functions: Passed through to the inner LLM
+            from_task: Task issuing the call
+            from_agent: Agent issuing the call
+            response_model: Passed through to the inner LLM
+            stop: Stop words of this call (defaults to this LLM's)
+
+        Returns:
+            Response text
+        """
+        # CrewAI sets stop words on the outer LLM. They are passed with the
+        # call because the inner LLM is shared by concurrent kickoffs.
+        if stop is None:
+            stop = getattr(self, "stop", None)
+        stop = list(stop or [])
+        key = make_cache_key(
+            self.provider,
+            self.model,
+            self.temperature,
+            messages,
+            stop,
+            tools=tools,
+            response_model=response_model,
+        )
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            # Streaming callers still see the (instant) cached response
+            emit_token(cached)
+            return cached
+
+        response = self.inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+            stop=stop,
+        )
+        if isinstance(response, str):
+            self.cache.put(key, response)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        """Delegate to the inner LLM."""
+        return self.inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        """Delegate to the inner LLM."""
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        """Delegate to the inner LLM."""
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        """Delegate to the inner LLM (cache hits use no provider tokens)."""
+        return self.inner.get_token_usage_summary()
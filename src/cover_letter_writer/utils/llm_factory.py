@@ -1,11 +1,27 @@
 """LLM factory for creating language model instances."""
 
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain_anthropic import ChatAnthropic
-from langchain_ollama import ChatOllama
-from langchain_openai import ChatOpenAI
+# Provider SDKs and the CrewAI wrappers take seconds to import. They are
+# imported when an LLM is created, and only for the provider in use, so the
+# CLI can show help and validate options without loading them.
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_ollama import ChatOllama
+    from langchain_openai import ChatOpenAI
+
+    from cover_letter_writer.utils.cassettes import (
+        CassetteRecorder,
+        ReplayChatModel,
+    )
+    from cover_letter_writer.utils.fake_llm import FakeChatModel
+    from cover_letter_writer.utils.llm_cache import LLMResponseCache
+
+SUPPORTED_PROVIDERS = ["openai", "anthropic", "ollama", "fake", "replay"]
+
+# Providers answering from scripts or recordings, without network access
+OFFLINE_PROVIDERS = ["fake", "replay"]
 
 
 class LLMFactory:
@@ -13,16 +29,34 @@ class LLMFactory:
 
     @staticmethod
     def create_llm(
-        provider: str, model: str, temperature: float = 0.7, **kwargs: Any
+        provider: str,
+        model: str,
+        temperature: float = 0.7,
+        cache: "LLMResponseCache | None" = None,
+        prompt_caching: bool = False,
+        streaming: bool = False,
+        recorder: "CassetteRecorder | None" = None,
+        **kwargs: Any,
     ) -> Any:
         """
         Create an LLM instance based on provider.
 
         Args:
-            provider: LLM provider (openai, anthropic, ollama)
+            provider: LLM provider (openai, anthropic, ollama, or the offline
+                fake and replay providers)
             model: Model name
             temperature: Temperature setting
-            **kwargs: Additional provider-specific arguments
+            cache: Optional response cache; unless it is in bypass mode the
+                model is wrapped in a CachingLLM
+            prompt_caching: Mark the stable prompt prefix for provider-side
+                prompt caching (Anthropic cache_control breakpoints; OpenAI
+                caches prefixes automatically)
+            streaming: Route calls through the LangChain adapter, which
+                streams tokens to callbacks registered with stream_tokens
+            recorder: Optional cassette recorder; every call is appended to
+                its cassette so the run can be replayed offline
+            **kwargs: Additional provider-specific arguments (fake: script,
+                latency_seconds; replay: cassette, latency_seconds)
 
         Returns:
             LLM instance
@@ -32,21 +66,79 @@ class LLMFactory:
         """
         provider = provider.lower()
 
+        if streaming and provider == "openai":
+            # OpenAI only reports token usage of streamed responses on request
+            kwargs.setdefault("stream_usage", True)
+
         if provider == "openai":
-            return LLMFactory._create_openai(model, temperature, **kwargs)
+            llm = LLMFactory._create_openai(model, temperature, **kwargs)
         elif provider == "anthropic":
-            return LLMFactory._create_anthropic(model, temperature, **kwargs)
+            llm = LLMFactory._create_anthropic(model, temperature, **kwargs)
         elif provider == "ollama":
-            return LLMFactory._create_ollama(model, temperature, **kwargs)
+            llm = LLMFactory._create_ollama(model, temperature, **kwargs)
+        elif provider == "fake":
+            llm = LLMFactory._create_fake(**kwargs)
+        elif provider == "replay":
+            llm = LLMFactory._create_replay(**kwargs)
         else:
             raise ValueError(
                 f"Unsupported LLM provider: {provider}. "
-                "Supported providers: openai, anthropic, ollama"
+                f"Supported providers: {', '.join(SUPPORTED_PROVIDERS)}"
             )
 
+        from cover_letter_writer.utils.llm_adapter import (
+            CACHE_BREAKPOINT_PROVIDERS,
+            LangChainLLM,
+        )
+
+        use_cache = cache is not None and cache.mode != "bypass"
+        # Cache breakpoints are added by our adapter, which must see the prompt
+        add_breakpoints = prompt_caching and provider in CACHE_BREAKPOINT_PROVIDERS
+        # Offline models are no LangChain chat models CrewAI could convert
+        if (
+            not use_cache
+            and not add_breakpoints
+            and not streaming
+            and recorder is None
+            and provider not in OFFLINE_PROVIDERS
+        ):
+            return llm
+
+        llm = LangChainLLM(
+            llm,
+            provider=provider,
+            model=model,
+            temperature=temperature,
+            prompt_caching=prompt_caching,
+        )
+        if use_cache:
+            from cover_letter_writer.utils.llm_cache import CachingLLM
+
+            llm = CachingLLM(
+                llm,
+                cache=cache,
+                provider=provider,
+                model=model,
+                temperature=temperature,
+            )
+        if recorder is None:
+            return llm
+
+        from cover_letter_writer.utils.cassettes import RecordingLLM
+
+        return RecordingLLM(
+            llm,
+            recorder=recorder,
+            provider=provider,
+            model=model,
+            temperature=temperature,
+        )
+
     @staticmethod
-    def _create_openai(model: str, temperature: float, **kwargs: Any) -> ChatOpenAI:
+    def _create_openai(model: str, temperature: float, **kwargs: Any) -> "ChatOpenAI":
         """Create OpenAI LLM instance."""
+        from langchain_openai import ChatOpenAI
+
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(
@@ -61,8 +153,10 @@ class LLMFactory:
     @staticmethod
     def _create_anthropic(
         model: str, temperature: float, **kwargs: Any
-    ) -> ChatAnthropic:
+    ) -> "ChatAnthropic":
         """Create Anthropic LLM instance."""
+        from langchain_anthropic import ChatAnthropic
+
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError(
@@ -75,14 +169,41 @@ class LLMFactory:
         )
 
     @staticmethod
-    def _create_ollama(model: str, temperature: float, **kwargs: Any) -> ChatOllama:
+    def _create_ollama(model: str, temperature: float, **kwargs: Any) -> "ChatOllama":
         """Create Ollama LLM instance."""
+        from langchain_ollama import ChatOllama
+
         base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
         return ChatOllama(
             model=model, temperature=temperature, base_url=base_url, **kwargs
         )
 
+    @staticmethod
+    def _create_fake(
+        script: str | None = None, latency_seconds: float = 0.0, **kwargs: Any
+    ) -> "FakeChatModel":
+        """Create a fake chat model answering with scripted responses."""
+        from cover_letter_writer.utils.fake_llm import FakeChatModel
+
+        return FakeChatModel.from_script(script, latency_seconds=latency_seconds)
+
+    @staticmethod
+    def _create_replay(
+        cassette: str | None = None, latency_seconds: float = 0.0, **kwargs: Any
+    ) -> "ReplayChatModel":
+        """Create a chat model replaying the responses of a recorded cassette."""
+        from cover_letter_writer.utils.cassettes import ReplayChatModel
+
+        if not cassette:
+            raise ValueError(
+                "No cassette set for the replay provider. "
+                "Please set llm.replay.cassette to a cassette recorded with "
+                "llm.record_cassette."
+            )
+
+        return ReplayChatModel(cassette, latency_seconds=latency_seconds)
+
     @staticmethod
     def validate_provider(provider: str) -> bool:
         """
@@ -94,7 +215,7 @@ class LLMFactory:
         Returns:
             True if supported, False otherwise
         """
-        return provider.lower() in ["openai", "anthropic", "ollama"]
+        return provider.lower() in SUPPORTED_PROVIDERS
 
     @staticmethod
     def get_default_model(provider: str) -> str:
@@ -111,6 +232,7 @@ class LLMFactory:
             "openai": "gpt-5.1",
             "anthropic": "claude-sonnet-4-5",
             "ollama": "llama3.1",
+            "fake": "fake",
+            "replay": "replay",
         }
         return defaults.get(provider.lower(), "gpt-5.1")
-
@@ -0,0 +1,306 @@
+"""Latency, token and retry metrics with JSON and Prometheus text exporters."""
+
+import math
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from cover_letter_writer.models.usage_models import CrewCallUsage
+
+# Prefix of all exported Prometheus metric names
+PROMETHEUS_NAMESPACE = "cover_letter"
+
+QUANTILES = [0.5, 0.95, 0.99]
+
+METRIC_HELP = {
+    "flow_step_seconds": "Wall time of a flow step",
+    "crew_kickoff_seconds": "Wall time of a crew kickoff",
+    "llm_seconds": "Time spent waiting for LLM responses during a crew kickoff",
+    "llm_time_to_first_token_seconds": "Time from kickoff start to the first "
+    "streamed token",
+    "document_parse_seconds": "Time to load a document (URLs include the scrape)",
+    "output_write_seconds": "Time to write the outputs of a run",
+    "batch_job_seconds": "Wall time of a batch job",
+    "llm_requests_total": "LLM requests made by crew kickoffs",
+    "llm_failed_requests_total": "LLM requests that failed and were retried",
+    "llm_tokens_total": "Provider-reported tokens by type",
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def percentile(values: list[float], quantile: float) -> float:
+    """
+    Compute a percentile by linear interpolation between closest ranks.
+
+    Args:
+        values: Sorted samples (at least one)
+        quantile: Quantile between 0 and 1
+
+    Returns:
+        Interpolated percentile value
+    """
+    position = (len(values) - 1) * quantile
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class MetricsRecorder:
+    """Thread-safe collection of timing samples and counters of a run or batch."""
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self._timings: dict[str, dict[LabelKey, list[float]]] = {}
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _label_key(labels: dict[str, Any]) -> LabelKey:
+        """Turn labels into a hashable, sorted key."""
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """
+        Record a timing sample.
+
+        Args:
+            name: Metric name (e.g. "flow_step_seconds")
+            seconds: Measured duration
+            **labels: Label values identifying the series
+        """
+        key = self._label_key(labels)
+        with self._lock:
+            self._timings.setdefault(name, {}).setdefault(key, []).append(seconds)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: Metric name (e.g. "llm_requests_total")
+            value: Amount to add
+            **labels: Label values identifying the series
+        """
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    @contextmanager
+    def time(self, name: str, **labels: Any) -> Iterator[None]:
+        """
+        Record the wall time of the with block (also when it raises).
+
+        Args:
+            name: Metric name
+            **labels: Label values identifying the series
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def record_usage(self, call: CrewCallUsage) -> None:
+        """
+        Record latency, token and retry metrics of a crew kickoff.
+
+        Args:
+            call: Usage record of the kickoff
+        """
+        # Candidate and translation steps carry a suffix such as "[de]"
+        step = call.step.split("[")[0]
+        self.observe(
+            "crew_kickoff_seconds", call.duration_seconds, crew=call.crew, step=step
+        )
+        if call.llm_seconds is not None:
+            self.observe("llm_seconds", call.llm_seconds, crew=call.crew)
+        if call.time_to_first_token_seconds is not None:
+            self.observe(
+                "llm_time_to_first_token_seconds",
+                call.time_to_first_token_seconds,
+                crew=call.crew,
+            )
+        self.increment("llm_requests_total", call.requests, crew=call.crew)
+        self.increment(
+            "llm_failed_requests_total", call.failed_requests, crew=call.crew
+        )
+        for kind in ["prompt", "completion", "cached_prompt"]:
+            self.increment(
+                "llm_tokens_total",
+                getattr(call, f"{kind}_tokens"),
+                crew=call.crew,
+                type=kind,
+            )
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize all metrics.
+
+        Returns:
+            {"timings": {name: [series]}, "counters": {name: [series]}}, where
+            timing series have count, sum, mean, min, max, p50, p95 and p99
+            (in seconds) and counter series a value
+        """
+        with self._lock:
+            timings = {
+                name: {key: sorted(values) for key, values in series.items()}
+                for name, series in self._timings.items()
+            }
+            counters = {name: dict(series) for name, series in self._counters.items()}
+
+        result: dict[str, Any] = {"timings": {}, "counters": {}}
+        for name, series in sorted(timings.items()):
+            result["timings"][name] = [
+                {
+                    "labels": dict(key),
+                    "count": len(values),
+                    "sum": round(sum(values), 6),
+                    "mean": round(sum(values) / len(values), 6),
+                    "min": round(values[0], 6),
+                    "max": round(values[-1], 6),
+                }
+                | {
+                    f"p{round(quantile * 100)}": round(percentile(values, quantile), 6)
+                    for quantile in QUANTILES
+                }
+                for key, values in sorted(series.items())
+            ]
+        for name, series in sorted(counters.items()):
+            result["counters"][name] = [
+                {"labels": dict(key), "value": value}
+                for key, value in sorted(series.items())
+            ]
+        return result
+
+    def prometheus_text(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Timings are exported as summaries with 0.5/0.95/0.99 quantiles.
+
+        Returns:
+            Exposition text
+        """
+        summary = self.summary()
+        lines = []
+        for name, series in summary["timings"].items():
+            metric = f"{PROMETHEUS_NAMESPACE}_{name}"
+            lines.append(f"# HELP {metric} {METRIC_HELP.get(name, name)}")
+            lines.append(f"# TYPE {metric} summary")
+            for entry in series:
+                for quantile in QUANTILES:
+                    labels = entry["labels"] | {"quantile": str(quantile)}
+                    value = entry[f"p{round(quantile * 100)}"]
+                    lines.append(f"{metric}{_format_labels(labels)} {value}")
+                labels = _format_labels(entry["labels"])
+                lines.append(f"{metric}_sum{labels} {entry['sum']}")
+                lines.append(f"{metric}_count{labels} {entry['count']}")
+        for name, series in summary["counters"].items():
+            metric = f"{PROMETHEUS_NAMESPACE}_{name}"
+            lines.append(f"# HELP {metric} {METRIC_HELP.get(name, name)}")
+            lines.append(f"# TYPE {metric} counter")
+            for entry in series:
+                labels = _format_labels(entry["labels"])
+                lines.append(f"{metric}{labels} {entry['value']}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> Path:
+        """
+        Write the Prometheus text to a file, replacing it atomically.
+
+        Suitable for the node exporter's textfile collector, which must
+        never read a partially written file.
+
+        Args:
+            path: Target file (conventionally ending in .prom)
+
+        Returns:
+            Path to the written file
+        """
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.prometheus_text())
+            os.replace(temp_path, target)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        return target
+
+
+def timed(
+    recorder: MetricsRecorder | None, name: str, **labels: Any
+) -> AbstractContextManager[None]:
+    """
+    Time the with block if a recorder is given.
+
+    Args:
+        recorder: Recorder receiving the sample (None records nothing)
+        name: Metric name
+        **labels: Label values identifying the series
+
+    Returns:
+        Context manager timing the block
+    """
+    if recorder is None:
+        return nullcontext()
+    return recorder.time(name, **labels)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Render Prometheus labels with escaped values."""
+    if not labels:
+        return ""
+    pairs = (f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def serve_prometheus(
+    recorder: MetricsRecorder, port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """
+    Serve the recorder's metrics at /metrics from a background thread.
+
+    Args:
+        recorder: Metrics to expose
+        port: TCP port (0 picks a free port)
+        host: Interface to listen on
+
+    Returns:
+        Running server; call shutdown() to stop it
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = recorder.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Scrapes would otherwise be logged to stderr between flow output
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,99 @@
+"""Forwarding of streamed LLM tokens from crew kickoffs to the caller."""
+
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+# Receives the text of each streamed chunk during the current kickoff
+_token_sink: ContextVar[Callable[[str], None] | None] = ContextVar(
+    "token_sink", default=None
+)
+
+
+@dataclass
+class StreamStats:
+    """Timing of the tokens streamed during one kickoff."""
+
+    started: float = field(default_factory=time.perf_counter)
+    first_token_at: float | None = None
+    chunks: int = 0
+
+    @property
+    def time_to_first_token(self) -> float | None:
+        """Seconds from kickoff start to the first token (None if nothing streamed)."""
+        if self.first_token_at is None:
+            return None
+        return round(self.first_token_at - self.started, 3)
+
+
+def streaming_enabled() -> bool:
+    """Return whether tokens of the current LLM call should be streamed."""
+    return _token_sink.get() is not None
+
+
+def emit_token(text: str) -> None:
+    """
+    Forward a streamed chunk to the active kickoff's callback.
+
+    Called by LLM wrappers for every chunk; a no-op outside stream_tokens.
+
+    Args:
+        text: Chunk text
+    """
+    sink = _token_sink.get()
+    if sink is not None and text:
+        sink(text)
+
+
+@contextmanager
+def stream_tokens(callback: Callable[[str], None] | None) -> Iterator[StreamStats]:
+    """
+    Stream the tokens of LLM calls made inside the with block to a callback.
+
+    Args:
+        callback: Receives each chunk of text; None disables streaming
+
+    Yields:
+        Timing of the streamed tokens, updated as chunks arrive
+    """
+    stats = StreamStats()
+    if callback is None:
+        yield stats
+        return
+
+    def sink(text: str) -> None:
+        if stats.first_token_at is None:
+            stats.first_token_at = time.perf_counter()
+        stats.chunks += 1
+        callback(text)
+
+    token = _token_sink.set(sink)
+    try:
+        yield stats
+    finally:
+        _token_sink.reset(token)
+
+
+def print_tokens() -> Callable[[str, str], None]:
+    """
+    Create a flow token callback that writes tokens to stdout.
+
+    A header is printed whenever the streaming flow step changes.
+
+    Returns:
+        Callback taking the flow step and the chunk text
+    """
+    current_step = None
+
+    def on_token(step: str, text: str) -> None:
+        nonlocal current_step
+        if step != current_step:
+            current_step = step
+            sys.stdout.write(f"\n--- {step} (streaming) ---\n")
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    return on_token
@@ -0,0 +1,326 @@
+"""Local token counting and provider usage attribution for crew kickoffs."""
+
+import re
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from typing import Any
+
+from cover_letter_writer.models.usage_models import CrewCallUsage
+from cover_letter_writer.tools.document_retriever import estimate_tokens
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Task template placeholders and the prompt section they belong to
+SECTION_NAMES = {
+    "cv_content": "cv",
+    "job_description": "job_description",
+    "supporting_documents": "supporting_documents",
+    "draft_content": "draft",
+    "cover_letter_content": "draft",
+    "reviewer_feedback": "reviewer_feedback",
+    "document_content": "summarized_document",
+}
+INSTRUCTIONS_SECTION = "instructions"
+
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+FALLBACK_ENCODING = "o200k_base"
+
+_USAGE_FIELDS = ["prompt_tokens", "completion_tokens", "cached_prompt_tokens"]
+
+# Collects usage reported by LLM calls made during the current kickoff
+_active_usage: ContextVar[dict[str, int] | None] = ContextVar(
+    "active_usage", default=None
+)
+
+
+@cache
+def _encoding(model: str | None) -> Any:
+    """
+    Get the tiktoken encoding of a model (o200k_base for unknown models).
+
+    Returns None if tiktoken is missing or its encoding files can't be
+    loaded (they are downloaded on first use), so counting still works
+    offline with an estimate.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model or "")
+        except KeyError:
+            return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except (OSError, ValueError):
+        return None
+
+
+def tokenizer_name(model: str | None = None) -> str:
+    """Return the name of the tokenizer count_tokens uses for a model."""
+    encoding = _encoding(model)
+    return encoding.name if encoding is not None else "chars/4"
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """
+    Count the tokens of a text locally.
+
+    Uses the model's tiktoken encoding (o200k_base as an approximation for
+    non-OpenAI models) or a characters/4 estimate if tiktoken is missing.
+
+    Args:
+        text: Text to count
+        model: Model name used to pick the encoding
+
+    Returns:
+        Token count
+    """
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def report_usage(
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    cached_prompt_tokens: int = 0,
+    latency_seconds: float = 0.0,
+) -> None:
+    """
+    Attribute provider-reported usage of one LLM request to the active kickoff.
+
+    Called by LLM wrappers after each request; a no-op outside track_usage.
+
+    Args:
+        prompt_tokens: Prompt (input) tokens
+        completion_tokens: Completion (output) tokens
+        cached_prompt_tokens: Prompt tokens served from the provider's cache
+        latency_seconds: Time the request took
+    """
+    usage = _active_usage.get()
+    if usage is None:
+        return
+    usage["prompt_tokens"] += prompt_tokens or 0
+    usage["completion_tokens"] += completion_tokens or 0
+    usage["cached_prompt_tokens"] += cached_prompt_tokens or 0
+    usage["requests"] += 1
+    usage["llm_seconds"] += latency_seconds
+
+
+def report_failure(latency_seconds: float = 0.0) -> None:
+    """
+    Attribute a failed LLM request to the active kickoff.
+
+    Called by LLM wrappers when a request raises; the agent retries it.
+    A no-op outside track_usage.
+
+    Args:
+        latency_seconds: Time until the request failed
+    """
+    usage = _active_usage.get()
+    if usage is None:
+        return
+    usage["failed_requests"] += 1
+    usage["llm_seconds"] += latency_seconds
+
+
+def prompt_templates(crew: Any) -> list[str]:
+    """
+    Collect the uninterpolated prompt templates of a crew.
+
+    Args:
+        crew: CrewAI crew
+
+    Returns:
+        Agent role/goal/backstory and task description/expected output templates
+    """
+    templates = []
+    for agent in crew.agents:
+        for field in ["role", "goal", "backstory"]:
+            original = getattr(agent, f"_original_{field}", None)
+            templates.append(original or getattr(agent, field, "") or "")
+    for task in crew.tasks:
+        for field in ["description", "expected_output"]:
+            original = getattr(task, f"_original_{field}", None)
+            templates.append(original or getattr(task, field, "") or "")
+    return templates
+
+
+def section_tokens(
+    templates: Iterable[str], inputs: dict[str, Any], model: str | None = None
+) -> dict[str, int]:
+    """
+    Count prompt tokens per section of the rendered templates.
+
+    Each input counts once per placeholder occurrence; the template text
+    around the placeholders counts as fixed instructions.
+
+    Args:
+        templates: Prompt templates with {placeholder} variables
+        inputs: Kickoff inputs
+        model: Model name used to pick the encoding
+
+    Returns:
+        Token count per section name
+    """
+    sections: dict[str, int] = {}
+    input_tokens: dict[str, int] = {}
+    for template in templates:
+        for key in PLACEHOLDER_PATTERN.findall(template):
+            if key not in inputs:
+                continue
+            if key not in input_tokens:
+                input_tokens[key] = count_tokens(str(inputs[key]), model)
+            section = SECTION_NAMES.get(key, INSTRUCTIONS_SECTION)
+            sections[section] = sections.get(section, 0) + input_tokens[key]
+
+        fixed_text = PLACEHOLDER_PATTERN.sub("", template)
+        sections[INSTRUCTIONS_SECTION] = sections.get(
+            INSTRUCTIONS_SECTION, 0
+        ) + count_tokens(fixed_text, model)
+    return sections
+
+
+def _agent_llm_usage(crew: Any) -> dict[str, int]:
+    """Sum the cumulative usage counters of the crew's agent LLMs."""
+    totals = {field: 0 for field in _USAGE_FIELDS + ["requests"]}
+    for agent in crew.agents:
+        summary_fn = getattr(agent.llm, "get_token_usage_summary", None)
+        if summary_fn is None:
+            continue
+        summary = summary_fn()
+        for field in _USAGE_FIELDS:
+            totals[field] += getattr(summary, field, 0) or 0
+        totals["requests"] += getattr(summary, "successful_requests", 0) or 0
+    return totals
+
+
+@contextmanager
+def track_usage(
+    crew: Any,
+    crew_name: str,
+    step: str,
+    inputs: dict[str, Any],
+    iteration: int = 0,
+    model: str | None = None,
+) -> Iterator[CrewCallUsage]:
+    """
+    Measure a crew kickoff run inside the with block.
+
+    Provider usage comes from report_usage calls of the LLM wrappers when
+    available (exact even when flows share an LLM), otherwise from the
+    change of the agents' LLM usage counters during the kickoff.
+
+    Args:
+        crew: Crew about to be kicked off
+        crew_name: Crew name for the record
+        step: Flow step name
+        inputs: Kickoff inputs
+        iteration: Iteration number
+        model: Model name used to pick the encoding
+
+    Yields:
+        Usage record, completed when the block exits
+    """
+    record = CrewCallUsage(
+        crew=crew_name,
+        step=step,
+        iteration=iteration,
+        tokenizer=tokenizer_name(model),
+        sections=section_tokens(prompt_templates(crew), inputs, model),
+    )
+
+    reported = {field: 0 for field in _USAGE_FIELDS + ["requests", "failed_requests"]}
+    reported["llm_seconds"] = 0.0
+    before = _agent_llm_usage(crew)
+    token = _active_usage.set(reported)
+    started = time.perf_counter()
+    try:
+        yield record
+    finally:
+        _active_usage.reset(token)
+        record.duration_seconds = round(time.perf_counter() - started, 3)
+
+    record.failed_requests = reported["failed_requests"]
+    if reported["requests"] or reported["failed_requests"]:
+        record.llm_seconds = round(reported["llm_seconds"], 3)
+
+    if reported["requests"]:
+        usage = reported
+    else:
+        after = _agent_llm_usage(crew)
+        usage = {field: after[field] - before[field] for field in after}
+    record.prompt_tokens = usage["prompt_tokens"]
+    record.completion_tokens = usage["completion_tokens"]
+    record.cached_prompt_tokens = usage["cached_prompt_tokens"]
+    record.requests = usage["requests"]
+
+
+def summarize_usage(calls: Iterable[CrewCallUsage]) -> dict[str, Any]:
+    """
+    Aggregate usage records.
+
+    Args:
+        calls: Usage records (of one run, or of all runs of a batch)
+
+    Returns:
+        Totals overall, per section and per crew, including the share of
+        prompt tokens served from the provider's prompt cache and the
+        average time to first token of streamed kickoffs
+    """
+    calls = list(calls)
+    sections: dict[str, int] = {}
+    crews: dict[str, dict[str, Any]] = {}
+    for call in calls:
+        for section, tokens in call.sections.items():
+            sections[section] = sections.get(section, 0) + tokens
+        crew = crews.setdefault(
+            call.crew,
+            {"calls": 0, "local_prompt_tokens": 0, "duration_seconds": 0.0}
+            | {field: 0 for field in _USAGE_FIELDS}
+            | {"time_to_first_token_seconds": []},
+        )
+        crew["calls"] += 1
+        crew["local_prompt_tokens"] += call.local_prompt_tokens
+        crew["duration_seconds"] = round(
+            crew["duration_seconds"] + call.duration_seconds, 3
+        )
+        for field in _USAGE_FIELDS:
+            crew[field] += getattr(call, field)
+        if call.time_to_first_token_seconds is not None:
+            crew["time_to_first_token_seconds"].append(call.time_to_first_token_seconds)
+
+    summary = {
+        "calls": len(calls),
+        "requests": sum(call.requests for call in calls),
+        "failed_requests": sum(call.failed_requests for call in calls),
+        "local_prompt_tokens": sum(sections.values()),
+    }
+    for field in _USAGE_FIELDS:
+        summary[field] = sum(getattr(call, field) for call in calls)
+    summary["duration_seconds"] = round(sum(c.duration_seconds for c in calls), 3)
+    summary["cache_hit_rate"] = _cache_hit_rate(summary)
+    for crew in crews.values():
+        crew["cache_hit_rate"] = _cache_hit_rate(crew)
+        ttfts = crew.pop("time_to_first_token_seconds")
+        crew["avg_time_to_first_token_seconds"] = (
+            round(sum(ttfts) / len(ttfts), 3) if ttfts else None
+        )
+    summary["sections"] = dict(sorted(sections.items(), key=lambda item: -item[1]))
+    summary["crews"] = crews
+    return summary
+
+
+def _cache_hit_rate(usage: dict[str, Any]) -> float:
+    """Share of prompt tokens that were read from the provider's prompt cache."""
+    if not usage["prompt_tokens"]:
+        return 0.0
+    return round(usage["cached_prompt_tokens"] / usage["prompt_tokens"], 3)
@@ -0,0 +1,213 @@
+"""Persistent translation memory of cover letter paragraphs."""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+
+from cover_letter_writer.utils.cache_store import SQLiteCache
+
+# Bump when the translator prompt changes so stale translations are no longer used
+TRANSLATION_MEMORY_VERSION = "1"
+
+# Paragraphs are separated by blank lines; the separators are kept verbatim
+SEGMENT_SEPARATOR = re.compile(r"(\n[ \t]*\n\s*)")
+
+# Line announcing a segment in the text sent to the translator
+SEGMENT_MARKER = "[[SEGMENT {number}]]"
+SEGMENT_MARKER_PATTERN = re.compile(r"^\s*\[\[\s*\w+\s+(\d+)\s*\]\]\s*$", re.MULTILINE)
+
+WORD_PATTERN = re.compile(r"[^\W\d_]", re.UNICODE)
+
+
+def normalize_segment(segment: str) -> str:
+    """Collapse whitespace so re-wrapped paragraphs share a memory entry."""
+    return " ".join(segment.split())
+
+
+@dataclass
+class TranslationPlan:
+    """Segments of a letter with the translations found in memory."""
+
+    language: str
+    segments: list[str]
+    separators: list[str]
+    keys: list[str | None]
+    translations: list[str | None] = field(default_factory=list)
+    merged: list[int] = field(default_factory=list)
+
+    @property
+    def missing(self) -> list[int]:
+        """Indices of segments that still have to be translated."""
+        return [
+            index
+            for index, key in enumerate(self.keys)
+            if key is not None and self.translations[index] is None
+        ]
+
+    @property
+    def found(self) -> int:
+        """Number of segments whose translation was found in memory."""
+        return sum(
+            key is not None and translation is not None and index not in self.merged
+            for index, (key, translation) in enumerate(
+                zip(self.keys, self.translations)
+            )
+        )
+
+    @property
+    def complete(self) -> bool:
+        """Whether every segment is translated."""
+        return not self.missing
+
+    def source_text(self) -> str:
+        """
+        Build the text sent to the translator.
+
+        Returns:
+            Missing segments, each announced by a marker line numbered from 1
+        """
+        return "\n\n".join(
+            f"{SEGMENT_MARKER.format(number=number)}\n{self.segments[index].strip()}"
+            for number, index in enumerate(self.missing, start=1)
+        )
+
+    def merge(self, translated: str) -> bool:
+        """
+        Take the translations of the missing segments from the translator output.
+
+        Args:
+            translated: Translator output of source_text()
+
+        Returns:
+            True if the output had exactly the requested segments (nothing
+            is merged otherwise)
+        """
+        missing = self.missing
+        parts = SEGMENT_MARKER_PATTERN.split(translated)
+        numbers = [int(number) for number in parts[1::2]]
+        if sorted(numbers) != list(range(1, len(missing) + 1)):
+            return False
+        if any(not text.strip() for text in parts[2::2]):
+            return False
+        for number, text in zip(numbers, parts[2::2]):
+            index = missing[number - 1]
+            self.translations[index] = text.strip()
+            self.merged.append(index)
+        return True
+
+    def merge_letter(self, translated: str) -> bool:
+        """
+        Take the translations of the missing segments from a whole-letter translation.
+
+        Paragraphs are matched in order, which is only reliable if the
+        translation has as many paragraphs with words as the letter.
+
+        Args:
+            translated: Translation of the complete letter
+
+        Returns:
+            True if the paragraphs lined up (nothing is merged otherwise)
+        """
+        parts = SEGMENT_SEPARATOR.split(translated)[0::2]
+        paragraphs = [part.strip() for part in parts if WORD_PATTERN.search(part)]
+        indices = [index for index, key in enumerate(self.keys) if key is not None]
+        if len(paragraphs) != len(indices):
+            return False
+        for index, text in zip(indices, paragraphs):
+            if self.translations[index] is None:
+                self.translations[index] = text
+                self.merged.append(index)
+        return True
+
+    def assemble(self) -> str:
+        """
+        Reassemble the translated letter.
+
+        Each translation keeps the indentation and spacing of its original
+        segment; segments without words (rules, blank lines) are copied.
+
+        Returns:
+            Translated letter
+        """
+        parts = []
+        for index, segment in enumerate(self.segments):
+            translation = self.translations[index]
+            if translation is None:
+                parts.append(segment)
+            else:
+                leading = segment[: len(segment) - len(segment.lstrip())]
+                trailing = segment[len(segment.rstrip()) :]
+                parts.append(f"{leading}{translation}{trailing}")
+            if index < len(self.separators):
+                parts.append(self.separators[index])
+        return "".join(parts)
+
+
+class TranslationMemory(SQLiteCache):
+    """Translations of letter paragraphs stored in a local SQLite database."""
+
+    filename = "translations.sqlite3"
+
+    @staticmethod
+    def make_key(segment: str, language: str, model: str | None) -> str:
+        """
+        Build the memory key of a segment translation.
+
+        Args:
+            segment: Original segment text
+            language: Target language code
+            model: Model that translates the segment
+
+        Returns:
+            SHA-256 hex digest of the normalized segment, language and model
+        """
+        payload = json.dumps(
+            [
+                TRANSLATION_MEMORY_VERSION,
+                model,
+                language.lower(),
+                hashlib.sha256(normalize_segment(segment).encode("utf-8")).hexdigest(),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def plan(self, text: str, language: str, model: str | None) -> TranslationPlan:
+        """
+        Split a letter into paragraph segments and look each one up.
+
+        Args:
+            text: Letter in markdown
+            language: Target language code
+            model: Model that translates missing segments
+
+        Returns:
+            Plan with the remembered translations filled in
+        """
+        parts = SEGMENT_SEPARATOR.split(text)
+        segments, separators = parts[0::2], parts[1::2]
+        keys = [
+            self.make_key(segment, language, model)
+            if WORD_PATTERN.search(segment)
+            else None
+            for segment in segments
+        ]
+        translations = [
+            self.store.get(key) if key is not None else None for key in keys
+        ]
+
+        found = sum(translation is not None for translation in translations)
+        self._count(hits=found, misses=sum(key is not None for key in keys) - found)
+        return TranslationPlan(language, segments, separators, keys, translations)
+
+    def remember(self, plan: TranslationPlan) -> None:
+        """Store the segment translations merged into a plan."""
+        for index in plan.merged:
+            self.store.put(plan.keys[index], plan.translations[index])
+
+    def stats(self) -> dict[str, float]:
+        """Return segment hit and miss counters and the hit rate."""
+        stats = super().stats()
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        return stats
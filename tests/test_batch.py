@@ -0,0 +1,157 @@
+"""Tests for batch manifest loading and the batch runner."""
+
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cover_letter_writer.batch import BatchRunner, load_manifest
+from cover_letter_writer.config import Config
+from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+from cover_letter_writer.models.batch_models import BatchJob
+from cover_letter_writer.utils import LLMFactory
+from cover_letter_writer.utils.checkpoints import FlowCheckpointStore
+from cover_letter_writer.utils.crew_pool import CrewPool
+
+
+class TestLoadManifest:
+    """Test suite for load_manifest."""
+
+    def _write(self, suffix: str, content: str) -> str:
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=suffix, delete=False, encoding="utf-8"
+        ) as f:
+            f.write(content)
+            return f.name
+
+    def test_load_csv_manifest(self):
+        """Test loading a CSV manifest with optional columns."""
+        path = self._write(
+            ".csv",
+            "id,job_description,translate_to\n"
+            "acme,https://example.com/jobs/1,de\n"
+            ",examples/sample_job_description.txt,\n",
+        )
+        try:
+            jobs = load_manifest(path)
+            assert len(jobs) == 2
+            assert jobs[0].job_id == "acme"
+            assert jobs[0].translate_to == "de"
+            assert jobs[1].job_id == "job_002"
+            assert jobs[1].translate_to is None
+        finally:
+            os.unlink(path)
+
+    def test_load_jsonl_manifest(self):
+        """Test loading a JSONL manifest and sanitizing ids."""
+        lines = [
+            json.dumps({"id": "Acme / Senior Dev", "job_description": "a.txt"}),
+            "",
+            json.dumps({"job_description": "b.txt"}),
+        ]
+        path = self._write(".jsonl", "\n".join(lines))
+        try:
+            jobs = load_manifest(path)
+            assert [job.job_id for job in jobs] == ["Acme_Senior_Dev", "job_002"]
+        finally:
+            os.unlink(path)
+
+    def test_duplicate_ids_rejected(self):
+        """Test that duplicate job ids raise an error."""
+        path = self._write(".csv", "id,job_description\nx,a.txt\nx,b.txt\n")
+        try:
+            with pytest.raises(ValueError, match="Duplicate job id"):
+                load_manifest(path)
+        finally:
+            os.unlink(path)
+
+    def test_missing_job_description_rejected(self):
+        """Test that entries without a job description raise an error."""
+        path = self._write(".jsonl", json.dumps({"id": "x"}))
+        try:
+            with pytest.raises(ValueError, match="job_description"):
+                load_manifest(path)
+        finally:
+            os.unlink(path)
+
+    def test_unsupported_manifest_format(self):
+        """Test that unsupported manifest formats raise an error."""
+        path = self._write(".xlsx", "")
+        try:
+            with pytest.raises(ValueError, match="Unsupported manifest"):
+                load_manifest(path)
+        finally:
+            os.unlink(path)
+
+
+class TestBatchRunner:
+    """Test suite for BatchRunner with the offline fake LLM."""
+
+    CV = "Python engineer at ACME since 2018."
+
+    def _runner(
+        self, tmpdir: str, checkpoints: FlowCheckpointStore | None = None
+    ) -> BatchRunner:
+        config = Config()
+        config.set("output.directory", os.path.join(tmpdir, "output"))
+        return BatchRunner(
+            config,
+            LLMFactory.create_llm("fake", "fake"),
+            cv_content=self.CV,
+            supporting_docs=[],
+            max_workers=2,
+            crew_pool=CrewPool(),
+            checkpoints=checkpoints,
+            resume=checkpoints is not None,
+        )
+
+    def _run(self, runner: BatchRunner, jobs: list[BatchJob], use_async: bool):
+        if use_async:
+            return asyncio.run(runner.run_async(jobs))
+        return runner.run(jobs)
+
+    @pytest.mark.parametrize("use_async", [False, True])
+    def test_failed_job_does_not_stop_the_batch(self, use_async):
+        """Test that a failing job is reported while the others finish."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job_file = Path(tmpdir) / "job.txt"
+            job_file.write_text("Senior Python engineer", encoding="utf-8")
+            jobs = [
+                BatchJob(job_id="ok", job_description=str(job_file)),
+                BatchJob(job_id="missing", job_description=f"{tmpdir}/none.txt"),
+            ]
+            checkpoints = FlowCheckpointStore(os.path.join(tmpdir, "checkpoints"))
+            runner = self._runner(tmpdir, checkpoints)
+
+            results = self._run(runner, jobs, use_async)
+
+            assert [result.job_id for result in results] == ["ok", "missing"]
+            assert results[0].error is None
+            assert results[0].status == "APPROVED"
+            assert Path(results[0].output_files["cover_letter"]).exists()
+            assert results[1].status == "FAILED"
+            assert "none.txt" in results[1].error
+            # Finished jobs are not resumed by the next run of the batch
+            assert not checkpoints.exists("ok")
+
+    @pytest.mark.parametrize("use_async", [False, True])
+    def test_resume_continues_checkpointed_jobs(self, use_async):
+        """Test that a checkpointed job resumes without reloading its input."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoints = FlowCheckpointStore(os.path.join(tmpdir, "checkpoints"))
+            interrupted = CoverLetterFlow(LLMFactory.create_llm("fake", "fake"))
+            interrupted.state.id = "resumed"
+            interrupted.state.job_description = "Senior Python engineer"
+            interrupted.state.cv_content = self.CV
+            checkpoints.save("resumed", interrupted.state)
+
+            # The job description file is gone; only the checkpoint has it
+            jobs = [BatchJob(job_id="resumed", job_description=f"{tmpdir}/gone.txt")]
+            results = self._run(self._runner(tmpdir, checkpoints), jobs, use_async)
+
+            assert results[0].error is None
+            assert results[0].status == "APPROVED"
+            assert not checkpoints.exists("resumed")
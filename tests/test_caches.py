@@ -0,0 +1,319 @@
+"""Tests for the on-disk cache store, LLM response and prompt caching, HTTP cache and translation memory."""
+
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from cover_letter_writer.tools.http_cache import HTTPCache
+from cover_letter_writer.utils.cache_store import SQLiteCache, SQLiteCacheStore
+from cover_letter_writer.utils.llm_cache import LLMResponseCache, make_cache_key
+from cover_letter_writer.utils.translation_memory import TranslationMemory
+
+
+class TestSQLiteCacheStore:
+    """Test suite for SQLiteCacheStore."""
+
+    def test_put_and_get(self):
+        """Test storing and reading back a value."""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteCacheStore(str(Path(tmp) / "cache.sqlite3"))
+            store.put("key", "value")
+            assert store.get("key") == "value"
+            assert store.get("missing") is None
+            assert store.stats()["entries"] == 1
+            store.close()
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as missing."""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteCacheStore(str(Path(tmp) / "cache.sqlite3"), ttl_seconds=0.01)
+            store.put("key", "value")
+            time.sleep(0.05)
+            assert store.get("key") is None
+            store.close()
+
+    def test_lru_eviction(self):
+        """Test that least recently used entries are evicted above max size."""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteCacheStore(
+                str(Path(tmp) / "cache.sqlite3"), max_size_bytes=25
+            )
+            store.put("a", "x" * 10)
+            time.sleep(0.01)
+            store.put("b", "x" * 10)
+            time.sleep(0.01)
+            store.get("a")
+            time.sleep(0.01)
+            store.put("c", "x" * 10)
+            assert store.get("a") is not None
+            assert store.get("b") is None
+            assert store.get("c") is not None
+            store.close()
+
+
+class TestSQLiteCache:
+    """Test suite for the shared cache base class."""
+
+    class NotesCache(SQLiteCache):
+        filename = "notes.sqlite3"
+
+    def test_caches_share_a_directory_and_count_lookups(self):
+        """Test that each cache opens its own database file and counts hits."""
+        with tempfile.TemporaryDirectory() as tmp:
+            notes = self.NotesCache.open(tmp)
+            responses = LLMResponseCache.open(tmp)
+            notes.put("key", "extracted text")
+
+            assert notes.get("key") == "extracted text"
+            assert responses.get("key") is None
+            assert notes.stats() == {"hits": 1, "misses": 0}
+            assert responses.stats() == {"mode": "read_write", "hits": 0, "misses": 1}
+            assert {path.name for path in Path(tmp).iterdir()} >= {
+                "notes.sqlite3",
+                "llm_responses.sqlite3",
+            }
+
+
+class TestLLMResponseCache:
+    """Test suite for LLMResponseCache."""
+
+    def test_cache_key_depends_on_all_parts(self):
+        """Test that provider, model, temperature and prompt change the key."""
+        messages = [{"role": "user", "content": "Write a letter"}]
+        key = make_cache_key("openai", "gpt-5.1", 0.7, messages)
+        assert key == make_cache_key("openai", "gpt-5.1", 0.7, list(messages))
+        assert key != make_cache_key("anthropic", "gpt-5.1", 0.7, messages)
+        assert key != make_cache_key("openai", "gpt-5", 0.7, messages)
+        assert key != make_cache_key("openai", "gpt-5.1", 0.2, messages)
+        assert key != make_cache_key("openai", "gpt-5.1", 0.7, "Write a letter")
+
+    def test_cache_key_depends_on_tools_and_response_model(self):
+        """Test that offered tools and the response schema change the key."""
+        from cover_letter_writer.models.state_models import ReviewScores
+
+        messages = [{"role": "user", "content": "Review the letter"}]
+        tools = [{"name": "scrape_website", "parameters": {"url": "string"}}]
+        key = make_cache_key("openai", "gpt-5.1", 0.7, messages)
+        assert key == make_cache_key("openai", "gpt-5.1", 0.7, messages, tools=[])
+        assert key != make_cache_key("openai", "gpt-5.1", 0.7, messages, tools=tools)
+        assert key != make_cache_key(
+            "openai", "gpt-5.1", 0.7, messages, response_model=ReviewScores
+        )
+
+    def test_modes(self):
+        """Test read-write, read-only and bypass behavior."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LLMResponseCache.open(tmp, mode="read_write")
+            cache.put("k", "response")
+            assert cache.get("k") == "response"
+            assert cache.stats()["hits"] == 1
+
+            read_only = LLMResponseCache.open(tmp, mode="read_only")
+            read_only.put("other", "ignored")
+            assert read_only.get("k") == "response"
+            assert read_only.get("other") is None
+
+            bypass = LLMResponseCache.open(tmp, mode="bypass")
+            assert bypass.get("k") is None
+
+    def test_caching_llm_serves_repeated_prompts(self):
+        """Test that a repeated prompt is answered without calling the model."""
+        from cover_letter_writer.utils.llm_adapter import LangChainLLM
+        from cover_letter_writer.utils.llm_cache import CachingLLM
+
+        class FakeChatModel:
+            calls = 0
+
+            def invoke(self, messages, stop=None):
+                FakeChatModel.calls += 1
+                return type("Message", (), {"content": "Dear hiring manager"})()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LLMResponseCache.open(tmp)
+            inner = LangChainLLM(FakeChatModel(), "openai", "gpt-test", 0.7)
+            llm = CachingLLM(inner, cache, "openai", "gpt-test", 0.7)
+            messages = [{"role": "user", "content": "Write a cover letter"}]
+
+            # CrewAI passes response_model with every call
+            for _ in range(2):
+                response = llm.call(messages, response_model=None)
+                assert response == "Dear hiring manager"
+            assert FakeChatModel.calls == 1
+            assert cache.stats()["hits"] == 1
+
+    def test_caching_llm_passes_stop_words_per_call(self):
+        """Test that wrappers sharing an inner LLM don't change its stop words."""
+        from cover_letter_writer.utils.llm_adapter import LangChainLLM
+        from cover_letter_writer.utils.llm_cache import CachingLLM
+
+        class FakeChatModel:
+            def __init__(self):
+                self.stops = []
+
+            def invoke(self, messages, stop=None):
+                self.stops.append(stop)
+                return type("Message", (), {"content": "ok"})()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LLMResponseCache.open(tmp, mode="read_only")
+            chat_model = FakeChatModel()
+            inner = LangChainLLM(chat_model, "openai", "gpt-test", 0.7)
+            inner_stop = inner.stop
+            for stop in [["\nObservation:"], ["\nResult:"]]:
+                llm = CachingLLM(inner, cache, "openai", "gpt-test", 0.7)
+                llm.stop = stop
+                llm.call("Write a cover letter")
+
+            assert chat_model.stops == [["\nObservation:"], ["\nResult:"]]
+            assert inner.stop == inner_stop
+
+
+class TestPromptCaching:
+    """Test suite for provider prompt-prefix cache breakpoints."""
+
+    def test_breakpoints_mark_the_stable_prefix(self):
+        """Test that the system prompt and the text before the boundary are cached."""
+        from cover_letter_writer.utils.llm_adapter import (
+            PROMPT_CACHE_BOUNDARY,
+            add_cache_breakpoints,
+        )
+
+        messages = [
+            {"role": "system", "content": "You are a writer."},
+            {
+                "role": "user",
+                "content": f"CV and job.\n{PROMPT_CACHE_BOUNDARY}: FEEDBACK ===\nFix it",
+            },
+        ]
+        system, user = add_cache_breakpoints(messages)
+
+        assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
+        cached, rest = user["content"]
+        assert cached["text"] == "CV and job.\n"
+        assert "cache_control" in cached
+        assert rest["text"].startswith(PROMPT_CACHE_BOUNDARY)
+        assert "cache_control" not in rest
+        assert messages[1]["content"].startswith("CV")  # input left unchanged
+
+    def test_anthropic_calls_carry_breakpoints(self):
+        """Test that the adapter only adds breakpoints for Anthropic."""
+        from cover_letter_writer.utils.llm_adapter import LangChainLLM
+
+        class FakeChatModel:
+            def invoke(self, messages, stop=None):
+                self.messages = messages
+                return type("Message", (), {"content": "ok"})()
+
+        messages = [{"role": "system", "content": "You are a writer."}]
+        for provider, expected in [("anthropic", list), ("openai", str)]:
+            chat_model = FakeChatModel()
+            llm = LangChainLLM(chat_model, provider, "model", 0.7, prompt_caching=True)
+            llm.call(messages)
+            assert isinstance(chat_model.messages[0]["content"], expected)
+
+
+class TestHTTPCache:
+    """Test suite for HTTPCache and conditional GET revalidation."""
+
+    def test_only_responses_with_validators_are_stored(self):
+        """Test that pages without ETag/Last-Modified are not cached."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HTTPCache.open(tmp)
+            cache.put("https://example.com/a", b"<p>A</p>")
+            cache.put("https://example.com/b", b"<p>B</p>", etag='"v1"')
+
+            assert cache.get("https://example.com/a") is None
+            entry = cache.get("https://example.com/b")
+            assert entry["content"] == b"<p>B</p>"
+            assert HTTPCache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+    def test_not_modified_response_serves_cached_page(self):
+        """Test that a 304 answer returns the cached body."""
+        pytest.importorskip("requests")
+        pytest.importorskip("bs4")
+        from cover_letter_writer.tools.web_scraper import WebScraperTool
+
+        class FakeResponse:
+            def __init__(self, status_code, content=b"", headers=None):
+                self.status_code = status_code
+                self.content = content
+                self.headers = headers or {}
+
+            def raise_for_status(self):
+                pass
+
+        class FakeSession:
+            def __init__(self):
+                self.requests = []
+
+            def get(self, url, headers=None, timeout=None):
+                self.requests.append(headers)
+                if headers.get("If-None-Match") == '"v1"':
+                    return FakeResponse(304)
+                return FakeResponse(200, b"<p>Job posting</p>", {"ETag": '"v1"'})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HTTPCache.open(tmp)
+            session = FakeSession()
+            scraper = WebScraperTool(session=session, cache=cache)
+
+            assert scraper.scrape_url("https://example.com/job") == "Job posting"
+            assert scraper.scrape_url("https://example.com/job") == "Job posting"
+            assert cache.stats() == {"revalidated": 1, "fetched": 1}
+            assert "If-None-Match" not in session.requests[0]
+
+
+LETTER = "Dear Ms. Smith,\n\nI am applying for the role.\n\n  - Python\n  - SQL\n\n---\n\nKind regards,\nJane"
+
+
+class TestTranslationMemory:
+    """Test suite for the paragraph translation memory."""
+
+    def test_missing_paragraphs_are_marked_and_merged(self):
+        """Test that translated segments are reassembled with formatting kept."""
+        with tempfile.TemporaryDirectory() as tmp:
+            memory = TranslationMemory.open(tmp)
+            plan = memory.plan(LETTER, "de", "gpt-test")
+
+            assert plan.missing == [0, 1, 2, 4]
+            assert "[[SEGMENT 3]]\n- Python" in plan.source_text()
+            assert plan.merge(
+                "[[SEGMENT 1]]\nSehr geehrte Frau Smith,\n\n[[SEGMENT 2]]\n"
+                "Ich bewerbe mich.\n\n[[SEGMENT 3]]\n- Python\n  - SQL\n\n"
+                "[[SEGMENT 4]]\nMit freundlichen Grüßen,\nJane"
+            )
+            memory.remember(plan)
+
+            assert plan.assemble() == (
+                "Sehr geehrte Frau Smith,\n\nIch bewerbe mich.\n\n"
+                "  - Python\n  - SQL\n\n---\n\nMit freundlichen Grüßen,\nJane"
+            )
+
+            rewrapped = LETTER.replace("I am applying", "I am\napplying")
+            again = memory.plan(rewrapped, "de", "gpt-test")
+            assert again.complete
+            assert memory.plan(LETTER, "fr", "gpt-test").missing == [0, 1, 2, 4]
+            assert memory.stats() == {"hits": 4, "misses": 8, "hit_rate": 0.333}
+
+    def test_lost_markers_are_rejected(self):
+        """Test that output without the requested segments is not merged."""
+        with tempfile.TemporaryDirectory() as tmp:
+            plan = TranslationMemory.open(tmp).plan(LETTER, "de", None)
+            assert not plan.merge("Sehr geehrte Frau Smith, ich bewerbe mich.")
+            assert plan.merged == []
+
+    def test_whole_letter_translation_is_merged_by_paragraph(self):
+        """Test that a plain translation is only merged if paragraphs line up."""
+        with tempfile.TemporaryDirectory() as tmp:
+            plan = TranslationMemory.open(tmp).plan(LETTER, "de", None)
+            assert not plan.merge_letter("Sehr geehrte Frau Smith, ich bewerbe mich.")
+            assert plan.merged == []
+
+            assert plan.merge_letter(
+                "Sehr geehrte Frau Smith,\n\nIch bewerbe mich.\n\n- Python\n- SQL"
+                "\n\n---\n\nMit freundlichen Grüßen,\nJane"
+            )
+            assert plan.complete
+            assert plan.translations[1] == "Ich bewerbe mich."
@@ -0,0 +1,373 @@
+"""Tests for CoverLetterFlow helpers that don't call an LLM."""
+
+import json
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+from cover_letter_writer.models import ReviewScores
+from cover_letter_writer.tools.draft_diff import change_ratio
+from cover_letter_writer.tools.draft_linter import DraftLinter
+from cover_letter_writer.utils import FileHandler
+from cover_letter_writer.utils.checkpoints import FlowCheckpointStore
+from cover_letter_writer.utils.digest_cache import DigestCache
+from cover_letter_writer.utils.translation_memory import TranslationMemory
+
+
+def make_flow(**state) -> CoverLetterFlow:
+    """Create a flow without an LLM and set initial state fields."""
+    flow = CoverLetterFlow(llm=None)
+    for name, value in state.items():
+        setattr(flow.state, name, value)
+    return flow
+
+
+class TestContextSelection:
+    """Test suite for relevance-ranked context selection."""
+
+    def test_documents_within_budget_are_sent_in_full(self):
+        """Test that nothing is selected when documents fit the budget."""
+        flow = make_flow(
+            job_description="Python developer",
+            supporting_docs=["Short reference letter."],
+            supporting_docs_token_budget=1000,
+        )
+        flow._select_context()
+        assert flow.state.selected_supporting_docs is None
+        assert flow._format_supporting_docs().endswith("Short reference letter.")
+
+    def test_large_documents_are_reduced_to_relevant_excerpts(self):
+        """Test that only relevant excerpts are sent once over budget."""
+        filler = "\n\n".join(f"Unrelated hobby paragraph {i}." for i in range(40))
+        flow = make_flow(
+            job_description="Senior Rust engineer for embedded firmware",
+            supporting_docs=[filler + "\n\nWrote embedded Rust firmware."],
+            cv_content="Rust engineer. " * 200,
+            supporting_docs_token_budget=40,
+            cv_token_budget=100,
+            chunk_tokens=20,
+        )
+        flow._select_context()
+
+        docs = flow._format_supporting_docs()
+        assert docs.startswith("Document 1 (excerpts):")
+        assert "embedded Rust firmware" in docs
+        assert len(flow._cv_content()) < len(flow.state.cv_content)
+
+
+class TestDocumentDigests:
+    """Test suite for the one-time pre-summarization stage."""
+
+    def test_summarization_disabled_by_default(self):
+        """Test that no document is condensed without a threshold."""
+        flow = make_flow(cv_content="Python developer. " * 500)
+        assert flow._pending_digests() == []
+
+    def test_only_long_documents_are_pending(self):
+        """Test that documents under the threshold stay verbatim."""
+        flow = make_flow(
+            cv_content="Python developer. " * 500,
+            supporting_docs=["Short reference letter.", "Long portfolio. " * 500],
+            summarize_min_tokens=100,
+        )
+        pending = flow._pending_digests()
+        assert [(index, kind) for index, kind, _ in pending] == [
+            (None, "CV"),
+            (1, "supporting document"),
+        ]
+
+    def test_cached_digests_replace_documents(self):
+        """Test that cached digests are used without calling the summarizer."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DigestCache.open(temp_dir)
+            state = {
+                "cv_content": "Python developer. " * 500,
+                "supporting_docs": ["Short reference letter."],
+                "summarize_min_tokens": 100,
+            }
+
+            flow = make_flow(**state)
+            flow.digest_cache = cache
+            [(index, kind, text)] = flow._pending_digests()
+            flow._store_digest(index, kind, text, SimpleNamespace(raw="- Python"))
+
+            flow = make_flow(**state)
+            flow.digest_cache = cache
+            assert flow._pending_digests() == []
+            assert flow._cv_content() == "- Python"
+            assert flow._format_supporting_docs().endswith("Short reference letter.")
+            assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def make_review(decision: str = "NEEDS_IMPROVEMENT", score: int = 7) -> str:
+    """Build a reviewer answer in the structured JSON format."""
+    return json.dumps(
+        {
+            "decision": decision,
+            "scores": dict.fromkeys(ReviewScores.model_fields, score),
+            "strengths": ["Clear opening"],
+            "improvements": ["Quantify the migration project"],
+        }
+    )
+
+
+class TestStructuredReview:
+    """Test suite for structured reviews and plateau-based early stopping."""
+
+    def test_structured_review_is_parsed(self):
+        """Test that a fenced JSON review is validated and scored."""
+        flow = make_flow(iteration_count=1)
+        flow._store_review(SimpleNamespace(raw=f"```json\n{make_review()}\n```"))
+
+        feedback = flow.state.feedback_history[-1]
+        assert feedback.decision == "NEEDS_IMPROVEMENT"
+        assert feedback.aggregate_score == 7.0
+        assert "Quantify the migration project" in feedback.comments
+
+    def test_invalid_review_falls_back_to_decision_text(self):
+        """Test that unstructured or out-of-range reviews still yield a decision."""
+        assert CoverLetterFlow._parse_review(make_review(score=11)) is None
+
+        flow = make_flow(iteration_count=1)
+        flow._store_review(SimpleNamespace(raw="DECISION: APPROVED\nGreat letter."))
+
+        feedback = flow.state.feedback_history[-1]
+        assert feedback.decision == "APPROVED"
+        assert feedback.scores is None
+
+    def test_plateau_stops_revisions(self):
+        """Test that revisions stop once scores no longer improve."""
+        flow = make_flow(max_iterations=5, plateau_patience=1)
+        for iteration, score in enumerate([5, 7, 7], start=1):
+            flow.state.iteration_count = iteration
+            flow._store_review(SimpleNamespace(raw=make_review(score=score)))
+            decision = flow.route_decision()
+            if iteration < 3:
+                assert decision == "decision_to_revise"
+
+        assert decision == "decision_to_finalize"
+        assert flow.state.status == "SCORE_PLATEAU"
+
+    def test_plateau_disabled(self):
+        """Test that flat scores don't stop the flow without a patience."""
+        flow = make_flow(max_iterations=5, plateau_patience=None)
+        for iteration in [1, 2]:
+            flow.state.iteration_count = iteration
+            flow._store_review(SimpleNamespace(raw=make_review()))
+        assert flow.route_decision() == "decision_to_revise"
+
+
+class TestDraftConvergence:
+    """Test suite for skipping reviews of converged drafts."""
+
+    def test_change_ratio(self):
+        """Test that whitespace is ignored and edits are measured per word."""
+        draft = "Dear hiring manager, I build data platforms in Python."
+        assert change_ratio(draft, draft.replace(" ", "\n  ")) == 0.0
+        assert 0 < change_ratio(draft, draft.replace("Python", "Rust")) < 0.2
+        assert change_ratio(draft, "Completely different text") > 0.8
+
+    def test_converged_revision_skips_review(self):
+        """Test that a near-identical revision is finalized without a review."""
+        draft = "Dear hiring manager, " + "I build data platforms in Python. " * 20
+        flow = make_flow(max_iterations=5, convergence_threshold=0.02)
+        flow.state.iteration_count = 1
+        flow._store_draft(SimpleNamespace(raw=draft), label="First draft")
+        flow._store_review(SimpleNamespace(raw=make_review()))
+        assert flow.route_decision() == "decision_to_revise"
+
+        flow.state.iteration_count = 2
+        flow._store_draft(
+            SimpleNamespace(raw=draft + " Thanks."), label="Revised draft"
+        )
+        flow.review_draft()  # must not kick off the reviewer crew (no LLM)
+
+        skipped = flow.state.feedback_history[-1]
+        assert skipped.iteration == 2
+        assert skipped.scores is None
+        assert 0 < skipped.change_ratio < 0.02
+        assert flow.route_decision() == "decision_to_finalize"
+        assert flow.state.status == "CONVERGED"
+
+
+class TestDraftLint:
+    """Test suite for the lint pass between writing and review."""
+
+    def test_lint_violations_skip_the_reviewer(self):
+        """Test that unfixable violations go back to the writer unreviewed."""
+        flow = make_flow(max_iterations=3)
+        flow.linter = DraftLinter(min_words=50)
+        flow.state.iteration_count = 1
+        flow._store_draft(
+            SimpleNamespace(raw="Dear team — hello."), label="First draft"
+        )
+        assert flow.state.current_draft == "Dear team, hello."
+
+        flow.review_draft()  # must not kick off the reviewer crew (no LLM)
+
+        feedback = flow.state.feedback_history[-1]
+        assert feedback.source == "lint"
+        assert feedback.lint_violations == {"dashes": 1, "length": 1}
+        assert "at least 50 words" in flow._revision_inputs()["reviewer_feedback"]
+        assert flow.route_decision() == "decision_to_revise"
+
+    def test_lint_rejects_at_most_once_in_a_row(self):
+        """Test that a draft still failing lint after a lint round is reviewed."""
+        flow = make_flow(max_iterations=3)
+        flow.linter = DraftLinter(min_words=50)
+        flow.state.iteration_count = 1
+        flow._store_draft(SimpleNamespace(raw="Dear team, hello."), label="First draft")
+        assert flow._lint_rejected()
+        flow._store_lint_feedback()
+
+        flow.state.iteration_count = 2
+        flow._store_draft(SimpleNamespace(raw="Dear team, hi."), label="Revised draft")
+        assert not flow._lint_rejected()
+
+    def test_last_iteration_is_always_reviewed(self):
+        """Test that a draft failing lint in the last iteration goes to review."""
+        flow = make_flow(max_iterations=2)
+        flow.linter = DraftLinter(min_words=50)
+        flow.state.iteration_count = 2
+        flow._store_draft(SimpleNamespace(raw="Dear team, hello."), label="First draft")
+        assert flow.state.lint_feedback is not None
+        assert not flow._lint_rejected()
+
+
+class TestDraftCandidates:
+    """Test suite for best-of-N parallel first drafts."""
+
+    def test_candidate_prompts_differ(self):
+        """Test that parallel drafts get distinct instructions."""
+        flow = make_flow(draft_candidates=3)
+        feedback = {flow._candidate_inputs(i)["reviewer_feedback"] for i in range(3)}
+        assert len(feedback) == 3
+
+    def test_best_reviewed_candidate_is_kept(self):
+        """Test that the highest-scoring draft and its review are stored."""
+        flow = make_flow(draft_candidates=3, max_iterations=3)
+        flow.state.iteration_count = 1
+        flow._keep_best_candidate(
+            [
+                (
+                    SimpleNamespace(raw=f"Draft {score}"),
+                    SimpleNamespace(raw=make_review(score=score)),
+                )
+                for score in [6, 8, 7]
+            ]
+        )
+
+        assert flow.state.current_draft == "Draft 8"
+        assert flow.state.candidate_scores == [6.0, 8.0, 7.0]
+        assert [
+            feedback.aggregate_score for feedback in flow.state.feedback_history
+        ] == [8.0]
+        assert flow._draft_reviewed()
+        assert flow.route_decision() == "decision_to_revise"
+
+
+class TestTranslations:
+    """Test suite for translating into several languages."""
+
+    def test_target_languages_are_parsed(self):
+        """Test that comma- or semicolon-separated codes are normalized."""
+        flow = make_flow(translate_to="DE, fr;nl,de")
+        assert flow.state.target_languages == ["de", "fr", "nl"]
+        assert make_flow().state.target_languages == []
+
+    def test_translations_are_saved_per_language(self):
+        """Test that every translation is stored and saved with its suffix."""
+        flow = make_flow(translate_to="de,fr", current_draft="Dear team")
+        flow._store_translation("fr", "Chère équipe")
+        flow._store_translation("de", "Liebes Team")
+
+        assert flow.state.translations == {"fr": "Chère équipe", "de": "Liebes Team"}
+        assert flow.state.translated_cover_letter == "Liebes Team"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            saved = FileHandler.save_flow_outputs(flow.state, temp_dir)
+            assert saved["translation_de"].name.endswith("_de.md")
+            assert saved["translation_fr"].read_text(encoding="utf-8") == "Chère équipe"
+
+    def test_remembered_paragraphs_skip_the_translator(self):
+        """Test that a letter fully in translation memory needs no crew."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            memory = TranslationMemory.open(temp_dir)
+            flow = CoverLetterFlow(llm=None, translation_memory=memory)
+            flow.state.current_draft = "Dear team,\n\nBest regards"
+            plan = memory.plan(flow.state.current_draft, "de", model=None)
+            assert plan.merge("[[SEGMENT 1]]\nLiebes Team,\n\n[[SEGMENT 2]]\nGrüße")
+            memory.remember(plan)
+
+            assert flow._translate("de") == "Liebes Team,\n\nGrüße"
+            assert memory.stats()["hits"] == 2
+
+    def test_empty_memory_sends_the_plain_draft(self, monkeypatch):
+        """Test that a letter without known paragraphs is sent without markers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            memory = TranslationMemory.open(temp_dir)
+            flow = CoverLetterFlow(llm=None, translation_memory=memory)
+            flow.state.current_draft = "Dear team,\n\nBest regards"
+            sent = []
+
+            def run_translator(language, content):
+                sent.append(content)
+                return "Liebes Team,\n\nGrüße"
+
+            monkeypatch.setattr(flow, "_run_translator", run_translator)
+
+            assert flow._translate("de") == "Liebes Team,\n\nGrüße"
+            assert sent == [flow.state.current_draft]
+            # The paragraphs lined up, so the next letter reuses them
+            assert memory.plan(flow.state.current_draft, "de", model=None).complete
+
+
+class TestCheckpoints:
+    """Test suite for checkpointing and resuming runs."""
+
+    def test_store_round_trip(self):
+        """Test that checkpoints are replaced atomically and validated."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FlowCheckpointStore(temp_dir)
+            flow = make_flow(current_draft="Draft 1")
+            store.save("run-1", flow.state)
+            flow.state.current_draft = "Draft 2"
+            store.save("run-1", flow.state)
+
+            assert store.load("run-1")["current_draft"] == "Draft 2"
+            assert [path.name for path in store.directory.iterdir()] == ["run-1.json"]
+            with pytest.raises(FileNotFoundError):
+                store.load("run-2")
+            with pytest.raises(ValueError):
+                store.path("../run-1")
+
+    def test_completed_steps_are_replayed_after_restore(self):
+        """Test that a restored flow skips completed steps and reuses routes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FlowCheckpointStore(temp_dir)
+            flow = CoverLetterFlow(llm=None, checkpoints=store)
+            flow.initialize_flow()
+            assert flow.route_translation() == "decision_to_end"
+            assert store.load(flow.state.id)["completed_steps"] == [
+                "initialize_flow",
+                "route_translation=decision_to_end",
+            ]
+
+            resumed = CoverLetterFlow(llm=None, checkpoints=store)
+            resumed.restore(flow.state.id)
+            resumed.state.translate_to = "de"
+            resumed.state.status = "APPROVED"
+            resumed.initialize_flow()
+            assert resumed.state.status == "APPROVED"
+            assert resumed.route_translation() == "decision_to_end"
+
+            # Steps after the checkpoint run again and are recorded
+            assert resumed.route_translation() == "decision_to_translate"
+            assert resumed.state.id == flow.state.id
+            assert len(store.load(flow.state.id)["completed_steps"]) == 3
+
+    def test_restore_requires_a_store(self):
+        """Test that restoring without checkpoints fails clearly."""
+        with pytest.raises(ValueError):
+            make_flow().restore("run-1")
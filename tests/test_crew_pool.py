@@ -0,0 +1,142 @@
+"""Tests for crew reuse and cached crew configs."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cover_letter_writer.crews.writer_crew.writer_crew import WriterCrew
+from cover_letter_writer.utils import LLMFactory
+from cover_letter_writer.utils.crew_pool import CrewPool, load_yaml_cached
+
+
+class DummyCrew:
+    """Stand-in for a @CrewBase class."""
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def crew(self):
+        return object()
+
+
+class TestCrewPool:
+    """Test suite for CrewPool."""
+
+    def test_crew_is_reused_after_release(self):
+        """Test that a released crew is handed out again."""
+        pool = CrewPool()
+        llm = object()
+        with pool.acquire(DummyCrew, llm) as first:
+            pass
+        with pool.acquire(DummyCrew, llm) as second:
+            assert second is first
+        assert pool.stats()["builds"] == 1
+        assert pool.stats()["reuses"] == 1
+
+    def test_checked_out_crews_are_not_shared(self):
+        """Test that nested checkouts get different crews."""
+        pool = CrewPool()
+        llm = object()
+        with (
+            pool.acquire(DummyCrew, llm) as first,
+            pool.acquire(DummyCrew, llm) as second,
+        ):
+            assert second is not first
+        with pool.acquire(DummyCrew, object()) as other_llm_crew:
+            assert other_llm_crew not in (first, second)
+
+    def test_failed_crew_is_discarded(self):
+        """Test that a crew whose kickoff raised is not reused."""
+        pool = CrewPool()
+        llm = object()
+        with (
+            pytest.raises(RuntimeError),
+            pool.acquire(DummyCrew, llm) as failed,
+        ):
+            raise RuntimeError("kickoff failed")
+        with pool.acquire(DummyCrew, llm) as crew:
+            assert crew is not failed
+        assert pool.stats()["reuses"] == 0
+
+    def test_idle_crews_per_key_are_bounded(self):
+        """Test that crews released beyond max_idle_per_key are dropped."""
+        pool = CrewPool(max_idle_per_key=1)
+        llm = object()
+        with (
+            pool.acquire(DummyCrew, llm) as first,
+            pool.acquire(DummyCrew, llm) as second,
+        ):
+            pass
+        with pool.acquire(DummyCrew, llm) as crew:
+            assert crew is second
+        with pool.acquire(DummyCrew, llm) as crew:
+            assert crew is not first
+        assert pool.stats()["evictions"] == 1
+
+    def test_least_recently_used_llm_is_released(self):
+        """Test that evicting an LLM's last crews stops pinning the LLM."""
+        pool = CrewPool(max_keys=2)
+        llms = [object() for _ in range(3)]
+        for llm in llms:
+            with pool.acquire(DummyCrew, llm):
+                pass
+        with pool.acquire(DummyCrew, llms[1]):
+            pass
+
+        assert id(llms[0]) not in pool._llms
+        assert pool.stats()["evictions"] == 1
+        assert pool.stats()["reuses"] == 1
+
+    def test_reused_writer_crew_uses_new_inputs(self):
+        """Test that a pooled real crew answers the second kickoff's inputs."""
+        jobs = ["Senior Python engineer", "Registered nurse"]
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "script.json"
+            rules = [{"match": job, "response": f"Letter for: {job}"} for job in jobs]
+            script.write_text(json.dumps({"rules": rules}))
+            llm = LLMFactory.create_llm("fake", "fake", script=str(script))
+
+        pool = CrewPool()
+        outputs = []
+        for job in jobs:
+            inputs = {
+                "job_description": job,
+                "cv_content": "Engineer at ACME since 2018.",
+                "supporting_documents": "None",
+                "reviewer_feedback": "This is the initial draft.",
+                "draft_content": "No previous draft.",
+            }
+            with pool.acquire(WriterCrew, llm) as crew:
+                outputs.append(crew.kickoff(inputs=inputs).raw)
+
+        assert pool.stats()["reuses"] == 1
+        assert outputs == [f"Letter for: {job}" for job in jobs]
+
+
+class TestCachedConfigs:
+    """Test suite for load_yaml_cached."""
+
+    def test_returns_independent_copies(self):
+        """Test that callers can't modify the cached config."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "agents.yaml"
+            path.write_text("writer:\n  role: Writer\n")
+
+            first = load_yaml_cached(path)
+            first["writer"]["role"] = "Changed"
+            assert load_yaml_cached(path) == {"writer": {"role": "Writer"}}
+
+    def test_reloads_modified_file(self):
+        """Test that an edited config file is parsed again."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tasks.yaml"
+            path.write_text("task: one\n")
+            assert load_yaml_cached(path) == {"task": "one"}
+
+            path.write_text("task: two\n")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert load_yaml_cached(path) == {"task": "two"}
@@ -3,9 +3,36 @@
 import pytest
 from pathlib import Path
 import tempfile
+from itertools import pairwise
+import importlib.util
 import os
 
+from cover_letter_writer.tools.document_cache import DocumentCache
 from cover_letter_writer.tools.document_parser import DocumentParser
+from cover_letter_writer.tools.document_retriever import (
+    BM25Index,
+    chunk_document,
+    estimate_tokens,
+    select_chunks,
+)
+from cover_letter_writer.tools.html_extractor import (
+    available_engines,
+    extract_text,
+    resolve_engine,
+)
+from cover_letter_writer.tools.pdf_reader import PDFReaderTool, split_page_range
+
+BENCHMARKS_DIR = Path(__file__).parent.parent / "benchmarks"
+
+
+def write_text_pdf(path: Path, pages: int) -> Path:
+    """Write a text PDF with the benchmark fixture generator (5 lines per page)."""
+    spec = importlib.util.spec_from_file_location(
+        "pdf_fixtures", BENCHMARKS_DIR / "pdf_fixtures.py"
+    )
+    pdf_fixtures = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(pdf_fixtures)
+    return pdf_fixtures.write_text_pdf(path, pages, lines_per_page=5)
 
 
 class TestDocumentParser:
@@ -104,6 +131,290 @@ class TestDocumentParser:
             os.unlink(temp1)
             os.unlink(temp2)
 
+    def test_parse_text_file_with_char_limit(self):
+        """Test that text files are truncated to max_chars."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write("0123456789")
+            temp_path = f.name
+
+        try:
+            assert DocumentParser.parse_file(temp_path, max_chars=4) == "0123"
+        finally:
+            os.unlink(temp_path)
+
+
+class TestDocumentCache:
+    """Test suite for DocumentCache."""
+
+    def test_fingerprint_changes_with_content(self):
+        """Test that modifying a file changes its fingerprint."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".pdf", delete=False) as f:
+            f.write("version 1")
+            temp_path = f.name
+
+        try:
+            first = DocumentCache.fingerprint(temp_path)
+            assert first == DocumentCache.fingerprint(temp_path)
+
+            Path(temp_path).write_text("version 2")
+            assert first != DocumentCache.fingerprint(temp_path)
+        finally:
+            os.unlink(temp_path)
+
+    def test_cache_hit_skips_extraction(self):
+        """Test that a cached PDF is returned without parsing the file."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DocumentCache.open(cache_dir)
+            pdf_path = Path(cache_dir) / "cv.pdf"
+            pdf_path.write_bytes(b"not a real pdf")
+
+            cache.put(DocumentCache.fingerprint(str(pdf_path)), "Cached CV text")
+
+            content = DocumentParser.parse_file(str(pdf_path), cache=cache)
+            assert content == "Cached CV text"
+            assert cache.hits == 1
+
+    def test_text_files_bypass_cache(self):
+        """Test that text files are read directly even with a cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DocumentCache.open(cache_dir)
+            txt_path = Path(cache_dir) / "notes.txt"
+            txt_path.write_text("Plain text")
+
+            assert DocumentParser.parse_file(str(txt_path), cache=cache) == "Plain text"
+            assert cache.hits == 0 and cache.misses == 0
+
+    def test_fingerprint_includes_extraction_limits(self):
+        """Test that truncated extractions don't share a key with full ones."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pdf_path = Path(cache_dir) / "cv.pdf"
+            pdf_path.write_bytes(b"not a real pdf")
+
+            full = DocumentCache.fingerprint(str(pdf_path))
+            assert full != DocumentCache.fingerprint(str(pdf_path), max_pages=2)
+            assert full != DocumentCache.fingerprint(str(pdf_path), max_chars=100)
+
+    def test_precompute_uses_extraction_limits(self):
+        """Test that precomputed entries are hits for documents read with limits."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            docs = Path(tmpdir) / "docs"
+            docs.mkdir()
+            pdf_path = write_text_pdf(docs / "reference.pdf", pages=3)
+            cache = DocumentCache.open(str(Path(tmpdir) / "cache"))
+
+            counts = cache.precompute(str(docs), max_pages=1)
+            assert counts == {"cached": 1, "already_cached": 0, "failed": 0}
+
+            content = DocumentParser.parse_file(str(pdf_path), cache=cache, max_pages=1)
+            assert cache.hits == 1
+            assert "Page 1 line 1" in content
+            assert "Page 2" not in content
+
+    def test_precomputed_cv_is_a_cache_hit(self):
+        """Test that the CV, read without limits, is precomputed as well."""
+        from cover_letter_writer.main import _load_candidate_documents
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            docs = Path(tmpdir) / "docs"
+            docs.mkdir()
+            cv_path = write_text_pdf(docs / "cv.pdf", pages=3)
+            reference_path = write_text_pdf(docs / "reference.pdf", pages=3)
+            cache = DocumentCache.open(str(Path(tmpdir) / "cache"))
+            cache.precompute(str(docs), max_pages=1)
+            misses_before = cache.misses
+
+            cv_text, supporting = _load_candidate_documents(
+                str(cv_path), (str(reference_path),), cache=cache, max_pages=1
+            )
+            assert cache.misses == misses_before
+            assert cache.hits == 2
+            assert "Page 3 line 1" in cv_text
+            assert "Page 2" not in supporting[0]
+
+
+class TestPDFReader:
+    """Test suite for PDF page splitting."""
+
+    def test_split_page_range_covers_all_pages_in_order(self):
+        """Test that page ranges are contiguous and cover every page."""
+        for page_count, workers in [(1, 4), (5, 2), (40, 4), (121, 8)]:
+            ranges = split_page_range(page_count, workers)
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == page_count
+            assert all(a[1] == b[0] for a, b in pairwise(ranges))
+            assert len(ranges) <= workers * 2
+
+    def test_parallel_extraction_matches_serial(self, monkeypatch):
+        """Test that worker processes return the same text as serial extraction."""
+        used_pool = []
+        extract_parallel = PDFReaderTool._extract_parallel
+
+        def record_parallel(reader, file_path, page_count):
+            used_pool.append(page_count)
+            return extract_parallel(reader, file_path, page_count)
+
+        monkeypatch.setattr(PDFReaderTool, "_extract_parallel", record_parallel)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = str(write_text_pdf(Path(tmpdir) / "doc.pdf", pages=7))
+
+            serial = PDFReaderTool().extract_text(pdf_path)
+            reader = PDFReaderTool(max_workers=2, parallel_threshold=3)
+            parallel = reader.extract_text(pdf_path)
+
+        assert used_pool == [7]
+        assert parallel == serial
+        assert serial.index("Page 1 line 1") < serial.index("Page 7 line 5")
+
+    def test_join_limited_stops_at_char_budget(self):
+        """Test that pages after the character budget are never requested."""
+        requested = []
+
+        def pages():
+            for text in ["a" * 10, "", "b" * 10, "c" * 10]:
+                requested.append(text)
+                yield text
+
+        text = PDFReaderTool._join_limited(pages(), max_chars=15)
+        assert text == "a" * 10 + "\n" + "b" * 4
+        assert len(requested) == 3
+
+    def test_join_limited_budget_ending_on_page_boundary(self):
+        """Test that a budget filled by whole pages requests no further page."""
+        requested = []
+
+        def pages():
+            for text in ["a" * 10, "b" * 10, "c" * 10]:
+                requested.append(text)
+                yield text
+
+        text = PDFReaderTool._join_limited(pages(), max_chars=21)
+        assert text == "a" * 10 + "\n" + "b" * 10
+        assert len(requested) == 2
+
+    @pytest.fixture
+    def counted_pages(self, monkeypatch):
+        """Count the pages pypdf extracts."""
+        from pypdf import PageObject
+
+        calls = []
+        extract_text = PageObject.extract_text
+
+        def counting_extract_text(page, *args, **kwargs):
+            calls.append(page)
+            return extract_text(page, *args, **kwargs)
+
+        monkeypatch.setattr(PageObject, "extract_text", counting_extract_text)
+        return calls
+
+    def test_iter_pages_extracts_lazily(self, counted_pages):
+        """Test that iter_pages only extracts the pages that are consumed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = write_text_pdf(Path(tmpdir) / "doc.pdf", pages=4)
+            pages = PDFReaderTool().iter_pages(str(pdf_path))
+
+            assert next(pages).startswith("Page 1 line 1")
+            assert len(counted_pages) == 1
+            assert next(pages).startswith("Page 2 line 1")
+            assert len(counted_pages) == 2
+
+    def test_iter_pages_respects_max_pages(self, counted_pages):
+        """Test that iter_pages stops after max_pages pages."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = write_text_pdf(Path(tmpdir) / "doc.pdf", pages=4)
+            pages = list(PDFReaderTool().iter_pages(str(pdf_path), max_pages=2))
+
+        assert [page.split(" line")[0] for page in pages] == ["Page 1", "Page 2"]
+        assert len(counted_pages) == 2
+
+    def test_char_limit_stops_extraction_early(self, counted_pages):
+        """Test that a character limit truncates the full text and skips later pages."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = str(write_text_pdf(Path(tmpdir) / "doc.pdf", pages=6))
+            reader = PDFReaderTool()
+            full_text = reader.extract_text(pdf_path)
+            first_page = next(reader.iter_pages(pdf_path))
+            counted_pages.clear()
+
+            # The budget ends a few characters into the second page
+            limit = len(first_page) + 1 + 5
+            text = reader.extract_text(pdf_path, max_chars=limit)
+
+        assert text == full_text[:limit]
+        assert text.endswith("\nPage ")
+        assert len(counted_pages) == 2
+
+
+class TestHTMLExtractor:
+    """Test suite for HTML extraction engines."""
+
+    PAGE = (
+        b"<html><head><title>Job</title><script>var x = 1;</script></head>"
+        b"<body><nav>Home</nav><h1>Data Engineer</h1><!-- tracking -->"
+        b"<p>Build <b>pipelines</b>.</p><footer>Imprint</footer></body></html>"
+    )
+
+    def test_page_chrome_is_removed(self):
+        """Test that scripts, navigation and footers are dropped."""
+        text = extract_text(self.PAGE, engine="html.parser")
+        assert text == "Job\nData Engineer\nBuild\npipelines\n."
+
+    def test_engines_produce_identical_text(self):
+        """Test that every installed engine matches the html.parser fallback."""
+        fixtures = Path(__file__).parent.parent / "benchmarks" / "fixtures" / "html"
+        for page in [self.PAGE] + [p.read_bytes() for p in fixtures.glob("*.html")]:
+            expected = extract_text(page, engine="html.parser")
+            for engine in available_engines():
+                assert extract_text(page, engine=engine) == expected
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError, match="Unsupported HTML engine"):
+            resolve_engine("regex")
+
+
+class TestDocumentRetriever:
+    """Test suite for chunking and BM25 chunk selection."""
+
+    DOCUMENTS = (
+        (
+            "Led a team of five data engineers.\n\nBuilt Kubernetes "
+            "deployments for machine learning inference services."
+        ),
+        (
+            "Volunteer at the local animal shelter on weekends.\n\nWrote "
+            "Python pipelines with PyTorch for forecasting models."
+        ),
+    )
+    JOB = "Machine learning engineer: Python, PyTorch, Kubernetes inference"
+
+    def test_chunks_respect_target_size(self):
+        """Test that long paragraphs are split into chunks of the target size."""
+        text = "\n\n".join(["word " * 300, "short paragraph"])
+        chunks = chunk_document(text, source=0, chunk_tokens=50)
+        assert all(chunk.tokens <= 50 for chunk in chunks)
+        assert [chunk.position for chunk in chunks] == list(range(len(chunks)))
+
+    def test_relevant_chunks_rank_first(self):
+        """Test that chunks sharing job terms outscore unrelated ones."""
+        chunks = [
+            chunk
+            for source, text in enumerate(self.DOCUMENTS)
+            for chunk in chunk_document(text, source, chunk_tokens=20)
+        ]
+        scores = BM25Index(chunks).score(self.JOB)
+        best = {chunks[i].text for i in scores.argsort()[-2:]}
+        assert any("Kubernetes" in text for text in best)
+        assert any("PyTorch" in text for text in best)
+
+    def test_selection_fits_budget_in_document_order(self):
+        """Test that selected chunks fit the budget and keep their order."""
+        selected = select_chunks(
+            self.DOCUMENTS, self.JOB, token_budget=40, chunk_tokens=20
+        )
+        assert sum(estimate_tokens(chunk.text) for chunk in selected) <= 40
+        assert selected == sorted(selected, key=lambda c: (c.source, c.position))
+        assert not any("animal shelter" in chunk.text for chunk in selected)
+
 
 class TestExampleFiles:
     """Test that example files can be read."""
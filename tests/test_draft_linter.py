@@ -0,0 +1,52 @@
+"""Tests for the local draft lint pass."""
+
+from cover_letter_writer.tools.draft_linter import DraftLinter
+
+LETTER = (
+    "Dear Hiring Manager,\n\n"
+    + "I have spent eight years building data platforms in Python. " * 30
+    + "\n\nSincerely,\nJane Doe"
+)
+
+
+class TestDraftLinter:
+    """Test suite for DraftLinter."""
+
+    def test_clean_letter_passes(self):
+        """Test that a compliant letter is left untouched."""
+        report = DraftLinter().lint(LETTER)
+        assert report.issues == []
+        assert report.draft == LETTER
+
+    def test_dashes_and_preamble_are_fixed(self):
+        """Test that auto-fixable violations are fixed without blocking."""
+        draft = (
+            "Sure! Here is your cover letter:\n\n"
+            + LETTER.replace("Python.", "Python — mostly at scale.", 1)
+            + "\n\nFrom 2019–2021 I led a team.\n\nLet me know if you want changes."
+        )
+        report = DraftLinter().lint(draft)
+
+        assert report.counts == {"preamble": 2, "dashes": 2}
+        assert report.blocking == []
+        assert report.draft.startswith("Dear Hiring Manager,")
+        assert "Python, mostly at scale." in report.draft
+        assert "2019-2021" in report.draft
+        assert "Let me know" not in report.draft
+
+    def test_banned_phrases_and_length_block(self):
+        """Test that rewrites the linter can't do are sent back to the writer."""
+        report = DraftLinter(max_words=50).lint(
+            LETTER + "\nI want to delve into robust systems."
+        )
+
+        assert report.counts == {"banned_phrases": 2, "length": 1}
+        feedback = report.feedback()
+        assert '"robust"' in feedback and '"delve"' in feedback
+        assert "at most 50 words" in feedback
+
+    def test_without_auto_fix_dashes_block(self):
+        """Test that dashes go back to the writer when auto-fix is off."""
+        report = DraftLinter(auto_fix=False).lint(LETTER.replace(".", " — ", 1))
+        assert [issue.rule for issue in report.blocking] == ["dashes"]
+        assert "—" in report.draft
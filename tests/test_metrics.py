@@ -0,0 +1,89 @@
+"""Tests for step, kickoff and LLM metrics."""
+
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+from cover_letter_writer.models.usage_models import CrewCallUsage
+from cover_letter_writer.utils.metrics import (
+    MetricsRecorder,
+    percentile,
+    serve_prometheus,
+)
+
+
+class TestMetricsRecorder:
+    """Test suite for the metrics recorder and its exporters."""
+
+    def test_summary_percentiles(self):
+        """Test that timings are summarized per label set."""
+        metrics = MetricsRecorder()
+        for seconds in range(1, 101):
+            metrics.observe("flow_step_seconds", float(seconds), step="review_draft")
+        metrics.observe("flow_step_seconds", 2.0, step="revise_draft")
+
+        series = metrics.summary()["timings"]["flow_step_seconds"]
+        review = next(s for s in series if s["labels"] == {"step": "review_draft"})
+        assert review["count"] == 100
+        assert review["p50"] == 50.5
+        assert review["p99"] == percentile([float(s) for s in range(1, 101)], 0.99)
+        assert len(series) == 2
+
+    def test_usage_and_prometheus_text(self):
+        """Test that kickoff usage becomes timings and counters in the export."""
+        metrics = MetricsRecorder()
+        metrics.record_usage(
+            CrewCallUsage(
+                crew="translator",
+                step="translate_cover_letter[de]",
+                tokenizer="chars/4",
+                prompt_tokens=100,
+                requests=2,
+                failed_requests=1,
+                duration_seconds=3.0,
+                llm_seconds=2.5,
+            )
+        )
+
+        text = metrics.prometheus_text()
+        assert "# TYPE cover_letter_crew_kickoff_seconds summary" in text
+        assert (
+            'cover_letter_crew_kickoff_seconds{crew="translator",'
+            'step="translate_cover_letter",quantile="0.95"} 3.0'
+        ) in text
+        assert 'cover_letter_llm_failed_requests_total{crew="translator"} 1' in text
+        assert (
+            'cover_letter_llm_tokens_total{crew="translator",type="prompt"} 100' in text
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = metrics.write_prometheus(str(Path(temp_dir) / "cover_letter.prom"))
+            assert path.read_text(encoding="utf-8") == text
+            assert [p.name for p in path.parent.iterdir()] == ["cover_letter.prom"]
+
+    def test_prometheus_endpoint(self):
+        """Test that /metrics serves the exposition text."""
+        metrics = MetricsRecorder()
+        metrics.increment("llm_requests_total", crew="writer")
+        server = serve_prometheus(metrics, port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+        assert 'cover_letter_llm_requests_total{crew="writer"} 1' in body
+
+    def test_flow_steps_are_timed(self):
+        """Test that completed flow steps are recorded."""
+        metrics = MetricsRecorder()
+        flow = CoverLetterFlow(llm=None, metrics=metrics)
+        flow.initialize_flow()
+        flow.route_translation()
+
+        steps = metrics.summary()["timings"]["flow_step_seconds"]
+        assert [s["labels"]["step"] for s in steps] == [
+            "initialize_flow",
+            "route_translation",
+        ]
@@ -0,0 +1,136 @@
+"""Tests for the offline fake and replay LLM providers."""
+
+import asyncio
+import json
+import os
+import tempfile
+
+import pytest
+
+from cover_letter_writer.async_cover_letter_flow import AsyncCoverLetterFlow
+from cover_letter_writer.cover_letter_flow import CoverLetterFlow
+from cover_letter_writer.models import ReviewResult
+from cover_letter_writer.utils import LLMFactory
+from cover_letter_writer.utils.cassettes import CassetteRecorder
+from cover_letter_writer.utils.fake_llm import default_review
+
+FLOW_INPUTS = {
+    "job_description": "Senior Python engineer",
+    "cv_content": "Python engineer at ACME since 2018.",
+    "translate_to": "de",
+}
+
+
+def run_flow(llm) -> CoverLetterFlow:
+    """Run a complete flow with one translation."""
+    flow = CoverLetterFlow(llm)
+    flow.kickoff(inputs=FLOW_INPUTS)
+    return flow
+
+
+class TestOfflineProviders:
+    """Test suite for scripted and replayed LLM responses."""
+
+    def test_fake_rules_are_served_in_order(self):
+        """Test that rule responses are served in turn, the last one repeating."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = os.path.join(tmpdir, "script.yaml")
+            with open(script, "w") as f:
+                f.write("rules:\n  - match: capital\n    responses: [Paris, Berlin]\n")
+            llm = LLMFactory.create_llm("fake", "fake", script=script)
+            messages = [{"role": "user", "content": "Name a capital."}]
+            answers = [llm.call(messages) for _ in range(3)]
+
+        assert [answer.split("Final Answer: ")[-1] for answer in answers] == [
+            "Paris",
+            "Berlin",
+            "Berlin",
+        ]
+        assert llm.get_token_usage_summary().successful_requests == 3
+
+    def test_default_review_matches_the_review_model(self):
+        """Test that the fake reviewer scores every ReviewScores criterion."""
+        review = ReviewResult.model_validate_json(
+            default_review("NEEDS_IMPROVEMENT", 6)
+        )
+        assert review.decision == "NEEDS_IMPROVEMENT"
+        assert set(review.scores.model_dump().values()) == {6}
+
+    def test_fake_flow_runs_offline(self):
+        """Test that the default fake answers carry a flow to approval."""
+        flow = run_flow(LLMFactory.create_llm("fake", "fake"))
+
+        assert flow.state.status == "APPROVED"
+        assert flow.state.translations["de"] == flow.state.current_draft
+
+    def test_async_flow_matches_sync_flow(self):
+        """Test that kickoff_async of the async flow ends in the same state."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # The first review asks for a revision, so every step runs
+            script = os.path.join(tmpdir, "script.json")
+            with open(script, "w") as f:
+                reviews = [default_review("NEEDS_IMPROVEMENT", 6), default_review()]
+                json.dump({"rules": [{"match": '"decision"', "responses": reviews}]}, f)
+
+            sync_flow = run_flow(LLMFactory.create_llm("fake", "fake", script=script))
+            async_flow = AsyncCoverLetterFlow(
+                LLMFactory.create_llm("fake", "fake", script=script)
+            )
+            asyncio.run(async_flow.kickoff_async(inputs=FLOW_INPUTS))
+
+        expected, actual = sync_flow.state, async_flow.state
+        assert expected.status == "APPROVED"
+        assert expected.iteration_count == 2
+        assert actual.status == expected.status
+        assert actual.iteration_count == expected.iteration_count
+        assert actual.current_draft == expected.current_draft
+        assert actual.translations == expected.translations
+        assert actual.completed_steps == expected.completed_steps
+        assert [
+            (feedback.source, feedback.decision, feedback.aggregate_score)
+            for feedback in actual.feedback_history
+        ] == [
+            (feedback.source, feedback.decision, feedback.aggregate_score)
+            for feedback in expected.feedback_history
+        ]
+        assert [(usage.crew, usage.step) for usage in actual.usage] == [
+            (usage.crew, usage.step) for usage in expected.usage
+        ]
+
+    def test_recorded_run_replays_without_the_model(self):
+        """Test that a recorded flow replays to the same letter."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cassette = os.path.join(tmpdir, "run.jsonl")
+            recorder = CassetteRecorder(cassette)
+            recorded = run_flow(
+                LLMFactory.create_llm("fake", "fake", recorder=recorder)
+            )
+            assert recorder.recorded == 3
+
+            llm = LLMFactory.create_llm("replay", "replay", cassette=cassette)
+            replayed = run_flow(llm)
+
+            assert replayed.state.current_draft == recorded.state.current_draft
+            assert replayed.state.translations == recorded.state.translations
+            assert llm.chat_model.hits == 3
+
+            with pytest.raises(ValueError, match="No recorded response"):
+                llm.chat_model.invoke([{"role": "user", "content": "New prompt"}])
+
+    def test_recording_passes_stop_words_per_call(self):
+        """Test that recording doesn't change the shared inner LLM's stop words."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = CassetteRecorder(os.path.join(tmpdir, "run.jsonl"))
+            llm = LLMFactory.create_llm("fake", "fake", recorder=recorder)
+            inner_stop = llm.inner.stop
+            llm.stop = ["\nObservation:"]
+            llm.call("Name a capital.")
+
+            assert llm.inner.stop == inner_stop
+            with open(recorder.path, encoding="utf-8") as f:
+                assert json.loads(f.readline())["stop"] == ["\nObservation:"]
+
+    def test_replay_requires_a_cassette(self):
+        """Test that the replay provider fails clearly without a cassette."""
+        with pytest.raises(ValueError, match="No cassette"):
+            LLMFactory.create_llm("replay", "replay")
@@ -0,0 +1,58 @@
+"""Tests for the lazy imports keeping CLI startup fast."""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "crewai",
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_ollama",
+]
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the heavy modules it loaded."""
+    check = (
+        f"{code}\nimport sys\n"
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    return set(completed.stdout.split())
+
+
+class TestLazyImports:
+    """Test suite for the lazy package and provider imports."""
+
+    def test_cli_import_skips_crewai_and_provider_sdks(self):
+        """Test that loading the CLI and the config imports no heavy module."""
+        code = (
+            "import cover_letter_writer.main\n"
+            "from cover_letter_writer.config import Config\n"
+            "Config().llm_provider"
+        )
+
+        assert loaded_modules(code) == set()
+
+    def test_creating_an_llm_imports_only_its_provider(self):
+        """Test that creating an Ollama LLM leaves the other SDKs unloaded."""
+        code = (
+            "from cover_letter_writer.utils import LLMFactory\n"
+            "LLMFactory.create_llm('ollama', 'llama3.1')"
+        )
+
+        assert loaded_modules(code) == {"crewai", "langchain_ollama"}
+
+    def test_package_exports_are_imported_on_access(self):
+        """Test that public names resolve on access and unknown names fail."""
+        import cover_letter_writer
+        from cover_letter_writer.config import Config
+
+        assert cover_letter_writer.Config is Config
+        assert "CoverLetterFlow" in dir(cover_letter_writer)
+        with pytest.raises(AttributeError):
+            cover_letter_writer.NoSuchName  # noqa: B018
@@ -0,0 +1,59 @@
+"""Tests for streaming LLM tokens to callbacks."""
+
+from langchain_core.messages import AIMessageChunk
+
+from cover_letter_writer.utils.llm_adapter import LangChainLLM
+from cover_letter_writer.utils.streaming import emit_token, stream_tokens
+
+
+class FakeStreamingChatModel:
+    """Chat model streaming a fixed answer word by word."""
+
+    def stream(self, messages, stop=None):
+        for index, word in enumerate(["Dear ", "hiring ", "manager"]):
+            usage = {
+                "input_tokens": 12 if index == 0 else 0,
+                "output_tokens": 1,
+                "total_tokens": 13 if index == 0 else 1,
+            }
+            yield AIMessageChunk(content=word, usage_metadata=usage)
+
+    def invoke(self, messages, stop=None):
+        raise AssertionError("invoke must not be used while streaming")
+
+
+class TestStreaming:
+    """Test suite for token streaming."""
+
+    def test_tokens_reach_callback_only_inside_block(self):
+        """Test that emitted tokens are forwarded and timed inside the block."""
+        received = []
+        emit_token("ignored")
+        with stream_tokens(received.append) as stats:
+            emit_token("Dear ")
+            emit_token("")
+            emit_token("Sir")
+        emit_token("ignored")
+
+        assert received == ["Dear ", "Sir"]
+        assert stats.chunks == 2
+        assert stats.time_to_first_token is not None
+
+    def test_without_callback_nothing_is_streamed(self):
+        """Test that no time to first token is reported without a callback."""
+        with stream_tokens(None) as stats:
+            emit_token("Dear")
+        assert stats.time_to_first_token is None
+
+    def test_adapter_streams_and_tracks_usage(self):
+        """Test that the LangChain adapter streams chunks and merges usage."""
+        llm = LangChainLLM(FakeStreamingChatModel(), "openai", "gpt-test", 0.7)
+        received = []
+        with stream_tokens(received.append):
+            response = llm.call([{"role": "user", "content": "Write"}])
+
+        assert response == "Dear hiring manager"
+        assert received == ["Dear ", "hiring ", "manager"]
+        usage = llm.get_token_usage_summary()
+        assert usage.prompt_tokens == 12
+        assert usage.completion_tokens == 3
@@ -0,0 +1,94 @@
+"""Tests for per-section token accounting of crew kickoffs."""
+
+from types import SimpleNamespace
+
+from cover_letter_writer.utils.token_accounting import (
+    count_tokens,
+    report_failure,
+    report_usage,
+    section_tokens,
+    summarize_usage,
+    track_usage,
+)
+
+
+def make_crew(description: str):
+    """Build a minimal crew-like object with one task template."""
+    agent = SimpleNamespace(
+        role="Writer", goal="Write", backstory="", llm=SimpleNamespace()
+    )
+    task = SimpleNamespace(description=description, expected_output="A letter")
+    return SimpleNamespace(agents=[agent], tasks=[task])
+
+
+class TestTokenAccounting:
+    """Test suite for token accounting."""
+
+    def test_inputs_count_per_placeholder_occurrence(self):
+        """Test that an input used twice is counted twice."""
+        inputs = {"cv_content": "Python developer with ten years of experience"}
+        once = section_tokens(["CV: {cv_content}"], inputs)
+        twice = section_tokens(["CV: {cv_content}", "Again: {cv_content}"], inputs)
+
+        assert once["cv"] == count_tokens(inputs["cv_content"])
+        assert twice["cv"] == 2 * once["cv"]
+        assert twice["instructions"] > once["instructions"]
+
+    def test_track_usage_records_reported_usage(self):
+        """Test that usage reported during the kickoff lands on the record."""
+        crew = make_crew("Write using {cv_content}")
+        inputs = {"cv_content": "Experienced engineer"}
+
+        with track_usage(crew, "writer", "create_first_draft", inputs) as record:
+            report_usage(prompt_tokens=100, completion_tokens=20)
+            report_usage(
+                prompt_tokens=50, completion_tokens=10, cached_prompt_tokens=40
+            )
+        report_usage(prompt_tokens=999)  # outside the kickoff, ignored
+
+        assert record.prompt_tokens == 150
+        assert record.completion_tokens == 30
+        assert record.cached_prompt_tokens == 40
+        assert record.requests == 2
+        assert record.sections["cv"] > 0
+
+    def test_summarize_usage_totals(self):
+        """Test aggregation over calls of several crews."""
+        crew = make_crew("Review {draft_content}")
+        calls = []
+        for name in ["writer", "reviewer", "writer"]:
+            with track_usage(crew, name, "step", {"draft_content": "Dear"}) as record:
+                report_usage(prompt_tokens=10, completion_tokens=5)
+            calls.append(record)
+
+        summary = summarize_usage(calls)
+
+        assert summary["calls"] == 3
+        assert summary["prompt_tokens"] == 30
+        assert summary["crews"]["writer"]["calls"] == 2
+        assert summary["local_prompt_tokens"] == sum(summary["sections"].values())
+
+    def test_cache_hit_rate(self):
+        """Test that the cache hit rate is the cached share of prompt tokens."""
+        crew = make_crew("Review {draft_content}")
+        with track_usage(crew, "reviewer", "step", {"draft_content": "Dear"}) as record:
+            report_usage(prompt_tokens=1000, cached_prompt_tokens=0)
+            report_usage(prompt_tokens=1000, cached_prompt_tokens=900)
+
+        summary = summarize_usage([record])
+
+        assert summary["cache_hit_rate"] == 0.45
+        assert summary["crews"]["reviewer"]["cache_hit_rate"] == 0.45
+        assert summarize_usage([])["cache_hit_rate"] == 0.0
+
+    def test_failed_requests_and_llm_time(self):
+        """Test that failed requests and LLM latency are recorded."""
+        crew = make_crew("Review {draft_content}")
+        with track_usage(crew, "reviewer", "step", {"draft_content": "Dear"}) as record:
+            report_failure(latency_seconds=0.5)
+            report_usage(prompt_tokens=10, latency_seconds=1.25)
+
+        assert record.requests == 1
+        assert record.failed_requests == 1
+        assert record.llm_seconds == 1.75
+        assert summarize_usage([record])["failed_requests"] == 1